@@ -0,0 +1,78 @@
+"""Benchmark CSV duplicate detection as the history grows.
+
+Compares the indexed ``save_to_csv`` against the previous behaviour of
+re-reading the whole file on every save.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_csv_store
+"""
+
+import contextlib
+import csv
+import io
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from geoguessr_daily_tracker.models import DailyChallengeGame, Round
+from geoguessr_daily_tracker.utils import save_many, save_to_csv
+
+SIZES = [100, 1_000, 10_000, 100_000]
+SAVES = 50
+
+
+def make_games(count, start=date(1800, 1, 1)):
+    """Build ``count`` games on consecutive days."""
+    return [
+        DailyChallengeGame(
+            token=f"token{i}",
+            totalScore=20000,
+            totalDistance=1234.5,
+            rounds=[
+                Round(score=4000, distance=246.9, roundNumber=r) for r in range(1, 6)
+            ],
+            date=start + timedelta(days=i),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_exists(filename: Path, date_str: str) -> bool:
+    """Duplicate check as done before the index: a full DictReader scan."""
+    with open(filename, mode="r", newline="") as file:
+        return any(row["date"] == date_str for row in csv.DictReader(file))
+
+
+def bench(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "daily_challenges.csv"
+        history = make_games(size)
+        new_games = make_games(SAVES, start=history[-1].date + timedelta(days=1))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            save_many(history, path)
+
+            start = time.perf_counter()
+            for game in new_games:
+                save_to_csv(game, path)
+            indexed = (time.perf_counter() - start) / SAVES
+
+        start = time.perf_counter()
+        for game in new_games:
+            legacy_exists(path, game.date.strftime("%Y-%m-%d"))
+        legacy = (time.perf_counter() - start) / SAVES
+
+    return indexed, legacy
+
+
+def main():
+    print(f"{'rows':>8}  {'indexed save':>14}  {'full-scan check':>16}")
+    for size in SIZES:
+        indexed, legacy = bench(size)
+        print(f"{size:>8}  {indexed * 1e6:>11.1f} us  {legacy * 1e6:>13.1f} us")
+
+
+if __name__ == "__main__":
+    main()
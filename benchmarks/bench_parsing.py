@@ -0,0 +1,55 @@
+"""Benchmark lean versus strict parsing of API responses.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parsing
+"""
+
+import json
+import timeit
+
+from geoguessr_daily_tracker.api import (
+    decode_json,
+    parse_daily_challenge,
+    parse_game_details,
+)
+
+from .synthetic import make_daily_payload, make_game_payload
+
+NUMBER = 200
+
+
+def bench(label, body, parse):
+    per_call = {}
+    for mode, strict, decode in [
+        ("strict", True, json.loads),
+        ("lean", False, decode_json),
+    ]:
+        seconds = timeit.timeit(lambda: parse(decode(body), strict), number=NUMBER)
+        per_call[mode] = seconds / NUMBER
+    speedup = per_call["strict"] / per_call["lean"]
+    print(
+        f"{label:<28} {per_call['strict'] * 1e6:>10.1f} us "
+        f"{per_call['lean'] * 1e6:>10.1f} us {speedup:>8.1f}x"
+    )
+
+
+def main():
+    print(f"{'payload':<28} {'strict':>13} {'lean':>13} {'speedup':>9}")
+    game = json.dumps(make_game_payload()).encode()
+    bench(
+        f"game ({len(game) // 1024} KiB)",
+        game,
+        lambda p, s: parse_game_details("t", p, s),
+    )
+    for entries in (100, 1000):
+        daily = json.dumps(make_daily_payload(entries=entries)).encode()
+        bench(
+            f"daily, {entries} entries ({len(daily) // 1024} KiB)",
+            daily,
+            parse_daily_challenge,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Load generator for the API client and the fill path.
+
+Drives GeoGuessrAPI against the local stub server with configurable
+latency, errors and 429s, then reports throughput and tail latency.
+Latencies are measured per game as the caller sees them, so retries and
+rate-limit waits are included.
+
+Run from the repository root:
+
+    python -m benchmarks.loadgen --requests 2000 --concurrency 32 --latency 0.05
+    python -m benchmarks.loadgen --mode fill --throttle-rate 0.05 --rate-limit 20
+    python -m benchmarks.loadgen --archive data/archive --replay-only
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, List, Optional
+from unittest import mock
+
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.archive import ResponseArchive
+from geoguessr_daily_tracker.cli import fill_previous_dates
+from geoguessr_daily_tracker.ratelimit import RateLimiter
+from geoguessr_daily_tracker.storage import CsvStorage
+
+from .stub_server import StubServer
+from .synthetic import HISTORY_START
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class Recorder:
+    """Wrap a callable and record the latency and outcome of every call."""
+
+    def __init__(self, fn: Callable):
+        self.fn = fn
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.latencies.append(elapsed)
+
+
+def make_api(
+    server: StubServer, concurrency: int, rate_limit: Optional[float]
+) -> GeoGuessrAPI:
+    """Client pointed at the stub, with a short backoff so faults stay cheap."""
+    api = GeoGuessrAPI(
+        cookie="loadgen",
+        pool_size=concurrency,
+        backoff_factor=0.05,
+        rate_limiter=RateLimiter(rate_limit) if rate_limit else None,
+    )
+    api.BASE_URL = server.base_url
+    return api
+
+
+def drive_api(
+    server: StubServer,
+    tokens: List[str],
+    concurrency: int,
+    rate_limit: Optional[float] = None,
+) -> Recorder:
+    """Fetch every token with ``concurrency`` threads sharing one client."""
+    with make_api(server, concurrency, rate_limit) as api:
+        recorder = Recorder(api.get_game_payload)
+
+        def fetch(token):
+            with contextlib.suppress(Exception):
+                recorder(token)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(fetch, tokens))
+    return recorder
+
+
+def drive_fill(
+    server: StubServer,
+    tokens: List[str],
+    concurrency: int,
+    rate_limit: Optional[float] = None,
+) -> Recorder:
+    """Run the fill command's backfill with one past challenge per token."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(Path(tmp) / "previous_daily_links.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Date", "URL"])
+            for i, token in enumerate(tokens):
+                day = HISTORY_START + timedelta(days=i)
+                writer.writerow(
+                    [
+                        day.strftime("%d/%m/%Y"),
+                        f"https://www.geoguessr.com/challenge/{token}",
+                    ]
+                )
+
+        with (
+            mock.patch(
+                "geoguessr_daily_tracker.utils.get_data_dir", return_value=Path(tmp)
+            ),
+            make_api(server, concurrency, rate_limit) as api,
+            CsvStorage(Path(tmp) / "daily_challenges.csv") as storage,
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            # An instance attribute, so get_game_details calls go through it
+            recorder = api.get_game_payload = Recorder(api.get_game_payload)
+            fill_previous_dates(api, None, workers=concurrency, storage=storage)
+    return recorder
+
+
+def summarize(recorder: Recorder, seconds: float, server: StubServer) -> dict:
+    """Throughput, latency percentiles and server-side status counts."""
+    latencies = sorted(recorder.latencies)
+    completed = len(latencies) - recorder.errors
+    return {
+        "games": len(latencies),
+        "failed": recorder.errors,
+        "seconds": seconds,
+        "games_per_second": completed / seconds if seconds else 0.0,
+        "latency": {
+            **{f"p{p:g}": percentile(latencies, p) for p in PERCENTILES},
+            "max": latencies[-1] if latencies else 0.0,
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        },
+        "server_requests": server.request_count,
+        "server_statuses": {str(k): v for k, v in sorted(server.statuses.items())},
+    }
+
+
+def run(
+    mode: str = "api",
+    requests: int = 1000,
+    concurrency: int = 16,
+    rate_limit: Optional[float] = None,
+    archive: Optional[ResponseArchive] = None,
+    **server_options,
+) -> dict:
+    """Start a stub server, drive it and summarize the run.
+
+    Args:
+        mode (str): "api" for raw client calls, "fill" for the fill path
+        requests (int): Games to fetch; with an archive, at most the
+                        number of recorded games
+        concurrency (int): Threads, and connections in the client pool
+        rate_limit (float, optional): Client-side requests per second
+        archive (ResponseArchive, optional): Recorded responses to replay
+        **server_options: Passed to StubServer (latency, jitter, ...)
+
+    Returns:
+        dict: Summary as returned by summarize()
+    """
+    if archive is not None:
+        tokens = archive.tokens("game")[:requests]
+    else:
+        tokens = [f"load{i}" for i in range(requests)]
+    drive = drive_fill if mode == "fill" else drive_api
+
+    with StubServer(archive=archive, **server_options) as server:
+        start = time.perf_counter()
+        recorder = drive(server, tokens, concurrency, rate_limit)
+        seconds = time.perf_counter() - start
+        return summarize(recorder, seconds, server)
+
+
+def report(summary: dict) -> None:
+    print(
+        f"{summary['games']} games in {summary['seconds']:.2f} s "
+        f"({summary['games_per_second']:.1f} games/s, {summary['failed']} failed)"
+    )
+    print(
+        "latency "
+        + "  ".join(f"{k} {v * 1000:.1f} ms" for k, v in summary["latency"].items())
+    )
+    statuses = ", ".join(f"{k}: {v}" for k, v in summary["server_statuses"].items())
+    print(f"server saw {summary['server_requests']} requests ({statuses})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test against the API stub")
+    parser.add_argument(
+        "--mode",
+        choices=["api", "fill"],
+        default="api",
+        help="Drive GeoGuessrAPI directly or through fill (default: api)",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=1000, help="Games to fetch (default: 1000)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Worker threads (default: 16)"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Base latency (default: 0.02 s)"
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.01,
+        help="Mean extra latency, exponentially distributed (default: 0.01 s)",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction answered with 503"
+    )
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="Fraction answered with 429"
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=0.1,
+        help="Retry-After sent with each 429 (default: 0.1 s)",
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, help="Client-side requests per second"
+    )
+    parser.add_argument("--archive", type=Path, help="Replay a response archive")
+    parser.add_argument(
+        "--replay-only",
+        action="store_true",
+        help="Answer 404 for games missing from the archive",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Fault injection seed")
+    parser.add_argument("--output", type=Path, help="Also write the summary as JSON")
+    args = parser.parse_args()
+
+    summary = run(
+        mode=args.mode,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        rate_limit=args.rate_limit,
+        archive=ResponseArchive(args.archive) if args.archive else None,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        replay_only=args.replay_only,
+        seed=args.seed,
+    )
+    report(summary)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Local GeoGuessr API stub for end-to-end benchmarks and load tests.
+
+Serves the daily challenge and game endpoints over HTTP/1.1 so the real
+client, connection pooling and backfill code can be measured without
+touching geoguessr.com. Responses are synthetic, or replayed from a
+ResponseArchive recorded by real runs, and the server can inject
+latency, server errors and 429s.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .synthetic import make_daily_payload, make_game_payload
+
+DAILY_PATH = "/api/v3/challenges/daily-challenges/today"
+GAME_PATH = re.compile(r"^/api/v3/challenges/([^/]+)/game$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, delayed ACKs
+    # add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        delay, fault = server.draw()
+        if delay:
+            time.sleep(delay)
+
+        match = GAME_PATH.match(self.path)
+        if self.path == DAILY_PATH:
+            body = server.daily_body
+        elif match:
+            body = server.game_body(match.group(1))
+        else:
+            body = None
+
+        if body is None:
+            status = 404
+        else:
+            status = fault or 200
+        server.count(status)
+
+        if status != 200:
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", str(server.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub server; use as a context manager.
+
+    Args:
+        latency (float): Seconds slept before answering each request
+        daily_entries (int): Rows per leaderboard list in the daily response
+        jitter (float): Mean of an exponentially distributed extra delay,
+                        which gives the latency a realistic long tail
+        error_rate (float): Fraction of requests answered with a 503
+        throttle_rate (float): Fraction of requests answered with a 429
+        retry_after (float): Retry-After seconds sent with every 429
+        archive (ResponseArchive, optional): Recorded responses to replay.
+                        Tokens it lacks get synthetic responses unless
+                        ``replay_only`` is set, in which case they get a 404.
+        replay_only (bool): Serve only archived responses
+        seed (int): Seed for the injected latency and faults
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        daily_entries: int = 100,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1,
+        archive=None,
+        replay_only: bool = False,
+        seed: int = 0,
+    ):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.archive = archive
+        self.replay_only = replay_only
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.statuses = Counter()
+        self._random = random.Random(seed)
+        self._games = {}
+        self._thread = None
+
+        self.daily_body = None
+        if archive is not None:
+            recorded = list(archive.locations("daily_challenge"))
+            if recorded:
+                self.daily_body = archive.get("daily_challenge", recorded[-1][0])
+        if self.daily_body is None and not replay_only:
+            self.daily_body = json.dumps(
+                make_daily_payload(entries=daily_entries)
+            ).encode()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to set as ``GeoGuessrAPI.BASE_URL``."""
+        return f"http://127.0.0.1:{self.server_address[1]}/api/v3"
+
+    def draw(self):
+        """Pick the delay and injected status (or None) for one request."""
+        with self.lock:
+            delay = self.latency
+            if self.jitter:
+                delay += self._random.expovariate(1 / self.jitter)
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, 503
+        return delay, None
+
+    def count(self, status: int) -> None:
+        """Record the status of a response."""
+        with self.lock:
+            self.request_count += 1
+            self.statuses[status] += 1
+
+    def game_body(self, token: str):
+        """Encoded game response for a token, stable across requests.
+
+        Returns None when replaying only and the token was not recorded.
+        """
+        body = self._games.get(token)
+        if body is None:
+            if self.archive is not None:
+                body = self.archive.get("game", token)
+            if body is None:
+                if self.replay_only:
+                    return None
+                payload = make_game_payload(token, seed=zlib.crc32(token.encode()))
+                body = json.dumps(payload).encode()
+            self._games[token] = body
+        return body
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
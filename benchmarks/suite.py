@@ -0,0 +1,268 @@
+"""Benchmark suite with results stored as JSON for comparison.
+
+Runs every benchmark against synthetic multi-year datasets, a fake
+Sheets service and a local API stub, then writes the timings to
+``benchmarks/results/<commit>.json``. Pass ``--compare`` with an
+earlier results file to flag regressions.
+
+Run from the repository root:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --quick --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+from geoguessr_daily_tracker.api import (
+    GeoGuessrAPI,
+    decode_json,
+    parse_daily_challenge,
+    parse_game_details,
+)
+from geoguessr_daily_tracker.backfill import fetch_games
+from geoguessr_daily_tracker.storage import CsvStorage
+from geoguessr_daily_tracker.utils import get_previous_challenges, save_to_csv
+
+from .stub_server import StubServer
+from .synthetic import (
+    FakeSheetsService,
+    make_daily_payload,
+    make_game_payload,
+    make_games,
+    make_history_csv,
+    make_previous_links_csv,
+    make_sheets_writer,
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+REPEAT = 5
+
+BENCHMARKS = {}
+
+
+def benchmark(fn):
+    """Register a benchmark; it receives the dataset size in years."""
+    BENCHMARKS[fn.__name__] = fn
+    return fn
+
+
+def per_call(fn, number):
+    """Best per-call time over REPEAT runs of ``number`` calls."""
+    return min(timeit.repeat(fn, number=number, repeat=REPEAT)) / number
+
+
+@benchmark
+def parse_game_lean(years):
+    body = json.dumps(make_game_payload()).encode()
+    return {
+        "seconds": per_call(lambda: parse_game_details("t", decode_json(body)), 200)
+    }
+
+
+@benchmark
+def parse_game_strict(years):
+    body = json.dumps(make_game_payload()).encode()
+    return {
+        "seconds": per_call(
+            lambda: parse_game_details("t", json.loads(body), strict=True), 200
+        )
+    }
+
+
+@benchmark
+def parse_daily_lean(years):
+    body = json.dumps(make_daily_payload(entries=1000)).encode()
+    return {"seconds": per_call(lambda: parse_daily_challenge(decode_json(body)), 20)}
+
+
+@benchmark
+def save_to_csv_duplicate(years):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "daily_challenges.csv"
+        history = make_history_csv(path, years)
+        game = history[len(history) // 2]
+        return {
+            "rows": len(history),
+            "seconds": per_call(lambda: save_to_csv(game, path), 100),
+        }
+
+
+@benchmark
+def save_to_csv_append(years):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "daily_challenges.csv"
+        history = make_history_csv(path, years)
+        new_games = make_games(100, start=history[-1].date + timedelta(days=1), seed=1)
+        save_to_csv(new_games[0], path)
+        start = time.perf_counter()
+        for game in new_games[1:]:
+            save_to_csv(game, path)
+        seconds = (time.perf_counter() - start) / (len(new_games) - 1)
+        return {"rows": len(history), "seconds": seconds}
+
+
+@benchmark
+def format_sheet_requests(years):
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = make_sheets_writer(FakeSheetsService(), Path(tmp))
+        return {"seconds": per_call(lambda: writer._build_format_requests(True), 1000)}
+
+
+@benchmark
+def format_sheet_apply(years):
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = make_sheets_writer(FakeSheetsService(), Path(tmp))
+        return {"seconds": per_call(lambda: writer.format_sheet(force=True), 100)}
+
+
+@benchmark
+def get_previous_challenges_read(years):
+    with tempfile.TemporaryDirectory() as tmp:
+        make_previous_links_csv(Path(tmp) / "previous_daily_links.csv", years * 365)
+        with mock.patch(
+            "geoguessr_daily_tracker.utils.get_data_dir", return_value=Path(tmp)
+        ):
+            return {
+                "rows": years * 365,
+                "seconds": per_call(get_previous_challenges, 10),
+            }
+
+
+@benchmark
+def backfill_end_to_end(years, workers=8):
+    days = years * 365
+    with tempfile.TemporaryDirectory() as tmp, StubServer() as server:
+        make_previous_links_csv(Path(tmp) / "previous_daily_links.csv", days)
+        service = FakeSheetsService()
+        sheet = make_sheets_writer(service, Path(tmp))
+        start = time.perf_counter()
+        with (
+            mock.patch(
+                "geoguessr_daily_tracker.utils.get_data_dir", return_value=Path(tmp)
+            ),
+            GeoGuessrAPI(cookie="bench", pool_size=workers) as api,
+            CsvStorage(Path(tmp) / "daily_challenges.csv") as storage,
+        ):
+            api.BASE_URL = server.base_url
+            games, failures = fetch_games(api, get_previous_challenges(), workers)
+            added = storage.save_games(games)
+            sheet.save_games(added)
+        seconds = time.perf_counter() - start
+    return {
+        "games": len(games),
+        "failures": len(failures),
+        "seconds": seconds,
+        "games_per_second": len(games) / seconds,
+        "sheet_calls": sum(service.calls.values()),
+    }
+
+
+def current_commit():
+    """Short hash of HEAD, or "unknown" outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f} {unit}"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def run(names, years):
+    results = {}
+    for name in names:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = BENCHMARKS[name](years)
+        print(f"{name:<30} {format_seconds(results[name]['seconds']):>14}", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print the change against a baseline; return the regressed names."""
+    regressions = []
+    print(f"\n{'benchmark':<30} {'baseline':>14} {'now':>14} {'change':>8}")
+    for name, result in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<30} {format_seconds(old['seconds']):>14} "
+            f"{format_seconds(result['seconds']):>14} {ratio:>7.2f}x{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument(
+        "--quick", action="store_true", help="Use a one-year dataset (default: 10)"
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run"
+    )
+    parser.add_argument("--output", type=Path, help="Where to write the results")
+    parser.add_argument("--compare", type=Path, help="Earlier results to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown counted as a regression (default: 0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    years = 1 if args.quick else 10
+    commit = current_commit()
+    results = run(args.only or list(BENCHMARKS), years)
+
+    output = args.output or RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "years": years,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Synthetic GeoGuessr payloads and datasets for benchmarks.
+
+The shapes mirror real /challenges/daily-challenges/today and
+/challenges/{token}/game responses, sized like the ones seen in
+practice: full leaderboards and every per-round field populated.
+Multi-year CSV histories and an in-memory Sheets service are provided
+for the storage and spreadsheet benchmarks.
+"""
+
+import csv
+import random
+import re
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+from geoguessr_daily_tracker.models import DailyChallengeGame, Round
+from geoguessr_daily_tracker.utils import save_many
+
+# First day of every synthetic history
+HISTORY_START = date(2015, 1, 1)
+
+
+def make_leaderboard_entry(rng: random.Random, index: int) -> dict:
+    """Build one leaderboard entry."""
+    return {
+        "id": f"player{index:08d}",
+        "nick": f"Player {index}",
+        "pinUrl": f"pin/{index:032x}.png",
+        "totalScore": rng.randint(0, 25000),
+        "totalTime": rng.randint(30, 1500),
+        "totalDistance": rng.uniform(0, 20_000_000),
+        "isOnLeaderboard": True,
+        "isVerified": rng.random() < 0.1,
+        "flair": rng.randint(0, 10),
+        "countryCode": rng.choice(["es", "fr", "de", "us", "br", "jp"]),
+        "currentStreak": rng.randint(0, 365),
+        "totalStepsCount": rng.randint(0, 500),
+    }
+
+
+def make_daily_payload(
+    token: str = "daily", entries: int = 1000, seed: int = 0
+) -> dict:
+    """Build a daily challenge response with ``entries`` rows per list."""
+    rng = random.Random(seed)
+    return {
+        "authorCreator": {
+            "id": "author",
+            "name": "GeoGuessr",
+            "avatarImage": "avatar.png",
+            "customName": None,
+            "customAvatarImage": None,
+            "signupAssetIds": ["a", "b"],
+            "signupCoins": 0,
+            "youtubeLink": "",
+            "twitchLink": "",
+            "twitterLink": "",
+            "instagramLink": "",
+            "program": None,
+        },
+        "date": "2025-01-01T00:00:00Z",
+        "description": "Daily challenge",
+        "participants": entries * 50,
+        "token": token,
+        "pickedWinner": False,
+        "leaderboard": [make_leaderboard_entry(rng, i) for i in range(entries)],
+        "friends": [make_leaderboard_entry(rng, i) for i in range(entries // 10)],
+        "country": [make_leaderboard_entry(rng, i) for i in range(entries)],
+    }
+
+
+def make_game_payload(
+    token: str = "game", rounds: int = 5, seed: int = 0, state: str = "finished"
+) -> dict:
+    """Build a game response with every field populated."""
+    rng = random.Random(seed)
+    guesses = []
+    for _ in range(rounds):
+        meters = rng.uniform(0, 5_000_000)
+        score = int(5000 * 2.718 ** (-meters / 1_500_000))
+        guesses.append(
+            {
+                "lat": rng.uniform(-60, 70),
+                "lng": rng.uniform(-180, 180),
+                "timedOut": False,
+                "timedOutWithGuess": False,
+                "skippedRound": False,
+                "roundScore": {
+                    "amount": str(score),
+                    "unit": "points",
+                    "percentage": score / 50,
+                },
+                "roundScoreInPercentage": score / 50,
+                "roundScoreInPoints": score,
+                "distance": {
+                    "meters": {"amount": f"{meters:.0f}", "unit": "m"},
+                    "miles": {"amount": f"{meters / 1609:.1f}", "unit": "miles"},
+                },
+                "distanceInMeters": meters,
+                "stepsCount": rng.randint(0, 100),
+                "streakLocationCode": rng.choice(["es", "fr", None]),
+                "time": rng.randint(5, 300),
+            }
+        )
+    total_score = sum(g["roundScoreInPoints"] for g in guesses)
+    total_meters = sum(g["distanceInMeters"] for g in guesses)
+    return {
+        "token": token,
+        "type": "challenge",
+        "mode": "standard",
+        "state": state,
+        "roundCount": rounds,
+        "timeLimit": 0,
+        "forbidMoving": False,
+        "forbidZooming": False,
+        "forbidRotating": False,
+        "streakType": "countrystreak",
+        "map": "world",
+        "mapName": "A Diverse World",
+        "panoramaProvider": 1,
+        "bounds": {
+            "min": {"lat": -65.0, "lng": -180.0},
+            "max": {"lat": 80.0, "lng": 180.0},
+        },
+        "round": rounds,
+        "rounds": [
+            {
+                "lat": rng.uniform(-60, 70),
+                "lng": rng.uniform(-180, 180),
+                "panoId": f"{rng.getrandbits(128):032x}",
+                "heading": rng.uniform(0, 360),
+                "pitch": rng.uniform(-10, 10),
+                "zoom": 0.0,
+                "streakLocationCode": rng.choice(["es", "fr", "de"]),
+                "startTime": "2025-01-01T10:00:00Z",
+            }
+            for _ in range(rounds)
+        ],
+        "player": {
+            "totalScore": {"amount": str(total_score), "unit": "points"},
+            "totalDistance": {
+                "meters": {"amount": f"{total_meters:.0f}", "unit": "m"},
+                "miles": {"amount": f"{total_meters / 1609:.1f}", "unit": "miles"},
+            },
+            "totalDistanceInMeters": total_meters,
+            "totalStepsCount": 100,
+            "totalTime": 600,
+            "totalStreak": 0,
+            "guesses": guesses,
+            "isLeader": False,
+            "currentPosition": 1,
+            "pin": {"url": "pin.png", "anchor": "center", "isDefault": True},
+            "newBadges": [],
+            "explorer": None,
+            "id": "player",
+            "nick": "player",
+            "isVerified": False,
+            "flair": 0,
+            "countryCode": "es",
+        },
+    }
+
+
+def make_games(
+    count: int, start: date = HISTORY_START, seed: int = 0
+) -> List[DailyChallengeGame]:
+    """Build ``count`` games on consecutive days."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(count):
+        rounds = [
+            Round(
+                score=rng.randint(0, 5000),
+                distance=rng.uniform(0, 5_000_000),
+                roundNumber=r,
+            )
+            for r in range(1, 6)
+        ]
+        games.append(
+            DailyChallengeGame(
+                token=f"token{seed}_{i:06d}",
+                totalScore=sum(r.score for r in rounds),
+                totalDistance=sum(r.distance for r in rounds),
+                rounds=rounds,
+                date=start + timedelta(days=i),
+            )
+        )
+    return games
+
+
+def make_history_csv(path: Path, years: int, seed: int = 0) -> List[DailyChallengeGame]:
+    """Write a daily_challenges.csv covering ``years`` years of games."""
+    games = make_games(years * 365, seed=seed)
+    save_many(games, path)
+    return games
+
+
+def make_previous_links_csv(path: Path, days: int) -> None:
+    """Write a previous_daily_links.csv with ``days`` challenges."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Date", "URL"])
+        for i in range(days):
+            day = HISTORY_START + timedelta(days=i)
+            writer.writerow(
+                [
+                    day.strftime("%d/%m/%Y"),
+                    f"https://www.geoguessr.com/challenge/token{i:06d}",
+                ]
+            )
+
+
+class _Request:
+    """A prepared call, run by ``execute()`` like the Google client's."""
+
+    def __init__(self, service, name, fn):
+        self._service = service
+        self._name = name
+        self._fn = fn
+
+    def execute(self):
+        self._service.calls[self._name] += 1
+        if self._service.latency:
+            time.sleep(self._service.latency)
+        return self._fn()
+
+
+class _Values:
+    def __init__(self, service):
+        self._service = service
+
+    def get(self, spreadsheetId, range):
+        first_row = int(re.match(r"[A-Z]+(\d+)", range).group(1))
+        grid = self._service.grid
+        return _Request(
+            self._service,
+            "values.get",
+            lambda: {"values": [row[:1] for row in grid[first_row - 1 :]]},
+        )
+
+    def append(self, spreadsheetId, range, body, **kwargs):
+        def run():
+            grid = self._service.grid
+            first_row = len(grid) + 1
+            grid.extend(body["values"])
+            return {"updates": {"updatedRange": f"Sheet1!A{first_row}:N{len(grid)}"}}
+
+        return _Request(self._service, "values.append", run)
+
+
+class _Spreadsheets:
+    def __init__(self, service):
+        self._service = service
+
+    def values(self):
+        return _Values(self._service)
+
+    def get(self, spreadsheetId, **kwargs):
+        header = self._service.grid[0]
+        sheet = {
+            "properties": {"sheetId": 0},
+            "conditionalFormats": [],
+            "data": [
+                {"rowData": [{"values": [{"formattedValue": v} for v in header]}]}
+            ],
+        }
+        return _Request(self._service, "get", lambda: {"sheets": [sheet]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        return _Request(self._service, "batchUpdate", lambda: {"replies": []})
+
+
+class FakeSheetsService:
+    """In-memory stand-in for the Sheets v4 service.
+
+    Implements the calls GoogleSheetsWriter makes against a single grid
+    and counts them in ``calls``. ``latency`` seconds are slept on every
+    ``execute()`` to model the API round trip.
+    """
+
+    def __init__(self, rows: List[list] = (), latency: float = 0.0):
+        from geoguessr_daily_tracker.sheets import GoogleSheetsWriter
+
+        self.grid = [list(GoogleSheetsWriter.HEADERS)] + [list(row) for row in rows]
+        self.latency = latency
+        self.calls = Counter()
+
+    def spreadsheets(self):
+        return _Spreadsheets(self)
+
+
+def make_sheets_writer(service: FakeSheetsService, directory: Path):
+    """Build a GoogleSheetsWriter that talks to a fake service.
+
+    Credentials are never loaded; local state lives under ``directory``.
+    """
+    from geoguessr_daily_tracker.sheets import GoogleSheetsWriter, SheetMirror
+
+    writer = GoogleSheetsWriter.__new__(GoogleSheetsWriter)
+    writer.spreadsheet_id = "benchmark"
+    writer.service = service
+    writer.layout_file = directory / "sheet_layout.json"
+    writer.mirror = SheetMirror(directory / "sheet_mirror.json")
+    return writer
@@ -1,30 +1,409 @@
 """API client for GeoGuessr game interactions."""
 
-from datetime import datetime
+import json
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import get_config
+from .config import load_config
+from .metrics import metrics
 from .models import DailyChallengeGame, DailyChallengeResponse, GameResponse, Round
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds.
+
+    Args:
+        value (str, optional): Value of the Retry-After header
+
+    Returns:
+        float: Non-negative delay in seconds, or None if absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(delay, 0.0)
+
+
+def retry_delay(
+    attempt: int,
+    retry_after: Optional[str] = None,
+    backoff_factor: float = 0.5,
+    max_backoff: float = 60.0,
+) -> float:
+    """Compute how long to wait before the next retry.
+
+    A ``Retry-After`` header (seconds or HTTP date) wins when present,
+    otherwise a full-jitter exponential backoff is used.
+
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed
+        retry_after (str, optional): Value of the Retry-After header
+        backoff_factor (float): Base delay in seconds
+        max_backoff (float): Upper bound for any single delay
+
+    Returns:
+        float: Delay in seconds
+    """
+    delay = parse_retry_after(retry_after)
+    if delay is not None:
+        return min(delay, max_backoff)
+
+    return random.uniform(0, min(max_backoff, backoff_factor * 2**attempt))
+
+
+def endpoint_name(path: str) -> str:
+    """Metric label for an API path, without the challenge token."""
+    if path.endswith("/game"):
+        return "game"
+    if path.endswith("/daily-challenges/today"):
+        return "daily_challenge"
+    return "other"
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """Create a keep-alive HTTP session with a sized connection pool.
+
+    Args:
+        pool_size (int): Maximum connections kept open per host
+
+    Returns:
+        requests.Session: Session ready to be shared between clients
+    """
+    session = requests.Session()
+    # Retries are handled by GeoGuessrAPI so they can honour Retry-After
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def decode_json(data: bytes):
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        data (bytes): Raw response body
+
+    Returns:
+        Any: Decoded JSON value
+    """
+    return _loads(data)
+
+
+def parse_daily_challenge(payload: dict, strict: bool = False) -> str:
+    """Extract the challenge token from a daily challenge response.
+
+    Args:
+        payload (dict): Decoded /challenges/daily-challenges/today response
+        strict (bool): Validate the whole response, including leaderboards
+
+    Returns:
+        str: The challenge token
+
+    Raises:
+        ValueError: If the response does not have the expected shape
+    """
+    if strict:
+        return DailyChallengeResponse(**payload).token
+
+    token = payload.get("token") if isinstance(payload, dict) else None
+    if not isinstance(token, str):
+        raise ValueError("Daily challenge response has no token")
+    return token
+
+
+def load_cached_game(token: str, cache=None, archive=None) -> Optional[dict]:
+    """Look up a game response in the cache.
+
+    Shared by the sync and async clients; does blocking file I/O.
+
+    Args:
+        token (str): The challenge token/ID
+        cache (GameCache, optional): Cache of finished game responses
+        archive (ResponseArchive, optional): Archive of raw responses
+
+    Returns:
+        dict or None: The cached response, or None if it is not cached
+    """
+    if cache is None:
+        return None
+    payload = cache.get(token)
+    # Archive games cached before the archive existed
+    if payload is not None and archive is not None and ("game", token) not in archive:
+        archive.put("game", token, json.dumps(payload).encode())
+    return payload
+
+
+def store_game_response(
+    token: str, body: bytes, payload: dict, cache=None, archive=None
+) -> None:
+    """Archive a fetched game response and cache it once the game is finished.
+
+    Shared by the sync and async clients; does blocking file I/O.
+
+    Args:
+        token (str): The challenge token/ID
+        body (bytes): Response body as received
+        payload (dict): The decoded response
+        cache (GameCache, optional): Cache of finished game responses
+        archive (ResponseArchive, optional): Archive of raw responses
+    """
+    if archive is not None:
+        archive.put("game", token, body)
+    # Only finished games are immutable and safe to cache
+    if cache is not None and payload.get("state") == "finished":
+        cache.put(token, payload)
+
+
+def parse_challenge_start(payload: dict) -> datetime:
+    """Extract when a daily challenge started from its response.
+
+    Games are stored under the date of this start, in UTC, whichever
+    command fetched them.
+
+    Args:
+        payload (dict): Decoded /challenges/daily-challenges/today response
+
+    Returns:
+        datetime: Start of the challenge, in UTC
+
+    Raises:
+        ValueError: If the response has no valid date
+    """
+    value = payload.get("date") if isinstance(payload, dict) else None
+    if not isinstance(value, str):
+        raise ValueError("Daily challenge response has no date")
+    start = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.astimezone(timezone.utc)
+
+
+def parse_game_details(
+    token: str, payload: dict, strict: bool = False
+) -> DailyChallengeGame:
+    """Build a DailyChallengeGame from a game response.
+
+    By default only the fields that are stored (scores, distances and
+    round coordinates) are read; ``strict``
+    validates the full response against GameResponse first.
+
+    Args:
+        token (str): The challenge token/ID
+        payload (dict): Decoded /challenges/{token}/game response
+        strict (bool): Validate every field of the response
+
+    Returns:
+        DailyChallengeGame: Game details including score and rounds
+
+    Raises:
+        ValueError: If the response does not have the expected shape
+    """
+    if strict:
+        game_data = GameResponse(**payload)
+        player = game_data.player
+        total_score = player.totalScore.amount
+        total_distance = player.totalDistanceInMeters
+        guesses = [
+            (guess.roundScoreInPoints, guess.distanceInMeters, guess.lat, guess.lng)
+            for guess in player.guesses
+        ]
+        locations = [(r.lat, r.lng, r.streakLocationCode) for r in game_data.rounds]
+    else:
+        try:
+            player = payload["player"]
+            total_score = player["totalScore"]["amount"]
+            total_distance = player["totalDistanceInMeters"]
+            guesses = [
+                (
+                    guess["roundScoreInPoints"],
+                    guess["distanceInMeters"],
+                    guess.get("lat"),
+                    guess.get("lng"),
+                )
+                for guess in player["guesses"]
+            ]
+            locations = [
+                (r.get("lat"), r.get("lng"), r.get("streakLocationCode"))
+                for r in payload.get("rounds") or []
+            ]
+        except (AttributeError, KeyError, TypeError) as e:
+            raise ValueError(f"Unexpected game response: missing {e}") from e
+
+    rounds = []
+    for i, (score, distance, guess_lat, guess_lng) in enumerate(guesses):
+        lat, lng, country = locations[i] if i < len(locations) else (None,) * 3
+        rounds.append(
+            Round(
+                score=score,
+                distance=distance,
+                roundNumber=i + 1,
+                lat=lat,
+                lng=lng,
+                guessLat=guess_lat,
+                guessLng=guess_lng,
+                countryCode=country,
+            )
+        )
+
+    return DailyChallengeGame(
+        token=token,
+        totalScore=int(total_score),
+        totalDistance=total_distance,
+        rounds=rounds,
+        date=datetime.now().date(),
+    )
+
 
 class GeoGuessrAPI:
     """API client for GeoGuessr game interactions."""
 
     BASE_URL = "https://www.geoguessr.com/api/v3"
 
-    def __init__(self, cookie=None):
+    def __init__(
+        self,
+        cookie=None,
+        session=None,
+        pool_size=10,
+        timeout=(5, 30),
+        max_retries=3,
+        backoff_factor=0.5,
+        cache=None,
+        refresh_cache=False,
+        strict=False,
+        rate_limiter=None,
+        archive=None,
+    ):
         """Initialize the API client with required authentication.
 
         Args:
             cookie (str, optional): The _ncfa cookie value. If not provided,
                                    will be read from environment or config.
+            session (requests.Session, optional): Shared session to reuse. The
+                                   client only closes sessions it created.
+            pool_size (int): Connection pool size for a new session
+            timeout (float or tuple): Connect and read timeouts in seconds
+            max_retries (int): Retries for connection errors, 429 and 5xx
+            backoff_factor (float): Base delay for exponential backoff
+            cache (GameCache, optional): Cache of finished game responses
+            refresh_cache (bool): Ignore cached responses but still store
+                                  freshly fetched ones
+            strict (bool): Validate whole responses instead of reading only
+                           the fields that are stored. Useful for debugging.
+            rate_limiter (RateLimiter, optional): Limiter shared by every
+                           request; share one instance between clients to
+                           throttle them together
+            archive (ResponseArchive, optional): Archive every raw response
+                           is appended to, for offline re-processing
         """
-        self.ncfa_cookie = cookie or get_config().get("NCFA_COOKIE")
+        self.ncfa_cookie = cookie or load_config().ncfa_cookie
         if not self.ncfa_cookie:
             raise ValueError("NCFA_COOKIE is required in environment or config")
 
         self.headers = {"Cookie": f"_ncfa={self.ncfa_cookie}"}
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._owns_session = session is None
+        self.session = session or create_session(pool_size)
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.strict = strict
+        self.rate_limiter = rate_limiter
+        self.archive = archive
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying session if it is owned by this client."""
+        if self._owns_session:
+            self.session.close()
+
+    def _get(self, path: str) -> requests.Response:
+        """Send a GET request, retrying transient failures.
+
+        Args:
+            path (str): Path relative to BASE_URL
+
+        Returns:
+            requests.Response: Successful response
+
+        Raises:
+            requests.RequestException: If the request keeps failing
+        """
+        url = f"{self.BASE_URL}{path}"
+        endpoint = endpoint_name(path)
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                metrics.inc("geoguessr_api_retries_total", endpoint=endpoint)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            try:
+                with metrics.timer("geoguessr_api_request_seconds", endpoint=endpoint):
+                    response = self.session.get(
+                        url, headers=self.headers, timeout=self.timeout
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                metrics.inc(
+                    "geoguessr_api_requests_total", endpoint=endpoint, status="error"
+                )
+                if attempt == self.max_retries:
+                    raise
+                delay = retry_delay(attempt, backoff_factor=self.backoff_factor)
+            else:
+                if metrics.enabled:
+                    metrics.inc(
+                        "geoguessr_api_requests_total",
+                        endpoint=endpoint,
+                        status=str(response.status_code),
+                    )
+                    metrics.inc(
+                        "geoguessr_api_response_bytes_total",
+                        len(response.content),
+                        endpoint=endpoint,
+                    )
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record_response(
+                        endpoint,
+                        response.status_code,
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == self.max_retries
+                ):
+                    response.raise_for_status()
+                    return response
+                delay = retry_delay(
+                    attempt,
+                    response.headers.get("Retry-After"),
+                    backoff_factor=self.backoff_factor,
+                )
+                response.close()
+            time.sleep(delay)
 
     def get_daily_challenge(self) -> str:
         """Fetch today's daily challenge token.
@@ -35,12 +414,22 @@ class GeoGuessrAPI:
         Raises:
             requests.RequestException: If API request fails
         """
-        response = requests.get(
-            f"{self.BASE_URL}/challenges/daily-challenges/today", headers=self.headers
-        )
-        response.raise_for_status()
-        challenge_data = DailyChallengeResponse(**response.json())
-        return challenge_data.token
+        return parse_daily_challenge(self.get_daily_challenge_payload(), self.strict)
+
+    def get_daily_challenge_payload(self) -> dict:
+        """Fetch today's daily challenge response, including leaderboards.
+
+        Returns:
+            dict: The decoded response
+
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        body = self._get("/challenges/daily-challenges/today").content
+        payload = decode_json(body)
+        if self.archive is not None:
+            self.archive.put("daily_challenge", str(payload.get("token")), body)
+        return payload
 
     def get_game_details(self, token: str) -> DailyChallengeGame:
         """Fetch game details for a specific challenge token.
@@ -54,25 +443,25 @@ class GeoGuessrAPI:
         Raises:
             requests.RequestException: If API request fails
         """
-        response = requests.get(
-            f"{self.BASE_URL}/challenges/{token}/game", headers=self.headers
-        )
-        response.raise_for_status()
-        game_data = GameResponse(**response.json())
+        return parse_game_details(token, self.get_game_payload(token), self.strict)
 
-        rounds = [
-            Round(
-                score=guess.roundScoreInPoints,
-                distance=guess.distanceInMeters,
-                roundNumber=i + 1,
-            )
-            for i, guess in enumerate(game_data.player.guesses)
-        ]
+    def get_game_payload(self, token: str) -> dict:
+        """Fetch the raw game response for a challenge token.
 
-        return DailyChallengeGame(
-            token=token,
-            totalScore=int(game_data.player.totalScore.amount),
-            totalDistance=game_data.player.totalDistanceInMeters,
-            rounds=rounds,
-            date=datetime.now().date(),
-        )
+        Args:
+            token (str): The challenge token/ID
+
+        Returns:
+            dict: The decoded response, including the game ``state``
+
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        payload = None
+        if not self.refresh_cache:
+            payload = load_cached_game(token, self.cache, self.archive)
+        if payload is None:
+            body = self._get(f"/challenges/{token}/game").content
+            payload = decode_json(body)
+            store_game_response(token, body, payload, self.cache, self.archive)
+        return payload
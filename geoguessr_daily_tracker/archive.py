@@ -0,0 +1,280 @@
+"""Append-only archive of raw GeoGuessr API responses."""
+
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .api import decode_json, parse_game_details
+from .config import get_data_dir
+from .models import DailyChallengeGame
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Key length and compressed body length in front of every record
+RECORD_HEADER = struct.Struct(">HI")
+
+Location = Tuple[int, int]
+
+
+class ResponseArchive:
+    """Raw response bodies in compressed, append-only segment files.
+
+    Each record is a header, the ``kind:token`` key and the zlib-compressed
+    response body exactly as received. ``index.tsv`` maps every key to the
+    segment and offset of its latest record, so a lookup is one seek and
+    one read. Segments are never rewritten; once one grows past
+    ``segment_bytes`` new records go to the next one.
+
+    Appends are serialized with a thread lock and, where available, an
+    ``flock`` on ``lock`` so several processes can share an archive.
+    """
+
+    DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, directory=None, segment_bytes=DEFAULT_SEGMENT_BYTES):
+        """Open the archive, creating nothing until the first write.
+
+        Args:
+            directory (Path, optional): Archive directory. Defaults to
+                                       ``archive`` under the data dir.
+            segment_bytes (int): Size after which a new segment is started
+        """
+        self.directory = Path(directory) if directory else get_data_dir() / "archive"
+        self.segment_bytes = segment_bytes
+        self.index_path = self.directory / "index.tsv"
+        self._lock = threading.Lock()
+        self._index: Dict[Tuple[str, str], Location] = {}
+        if self.index_path.exists():
+            self._load_index()
+        elif self.segments():
+            self.rebuild_index()
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{number:08d}.seg"
+
+    def segments(self) -> List[int]:
+        """Numbers of the existing segment files, in order."""
+        return sorted(int(p.stem) for p in self.directory.glob("*.seg"))
+
+    def _load_index(self) -> None:
+        with open(self.index_path, "r") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                # A line cut short by a crash is simply ignored
+                if len(parts) == 4 and parts[3].isdigit():
+                    kind, token, segment, offset = parts
+                    self._index[(kind, token)] = (int(segment), int(offset))
+
+    def rebuild_index(self) -> int:
+        """Recreate ``index.tsv`` by scanning every segment.
+
+        Scanning a segment stops at the first truncated or corrupt record.
+
+        Returns:
+            int: Number of distinct keys found
+        """
+        index: Dict[Tuple[str, str], Location] = {}
+        for segment in self.segments():
+            with open(self._segment_path(segment), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                offset = 0
+                while True:
+                    header = f.read(RECORD_HEADER.size)
+                    if len(header) < RECORD_HEADER.size:
+                        break
+                    key_length, body_length = RECORD_HEADER.unpack(header)
+                    key = f.read(key_length)
+                    f.seek(body_length, os.SEEK_CUR)
+                    end = offset + RECORD_HEADER.size + key_length + body_length
+                    if len(key) < key_length or end > size:
+                        break
+                    kind, _, token = key.decode().partition(":")
+                    index[(kind, token)] = (segment, offset)
+                    offset = end
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name("index.tsv.tmp")
+        with open(tmp_path, "w") as f:
+            for (kind, token), (segment, offset) in index.items():
+                f.write(f"{kind}\t{token}\t{segment}\t{offset}\n")
+        os.replace(tmp_path, self.index_path)
+        with self._lock:
+            self._index = index
+        return len(index)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def put(self, kind: str, token: str, body: bytes) -> None:
+        """Append a raw response body.
+
+        Args:
+            kind (str): Response type, e.g. "game" or "daily_challenge"
+            token (str): The challenge token/ID
+            body (bytes): Response body as received
+        """
+        key = f"{kind}:{token}".encode()
+        compressed = zlib.compress(body)
+        record = RECORD_HEADER.pack(len(key), len(compressed)) + key + compressed
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / "lock", "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                segment = (self.segments() or [1])[-1]
+                path = self._segment_path(segment)
+                if path.exists() and path.stat().st_size >= self.segment_bytes:
+                    segment += 1
+                    path = self._segment_path(segment)
+                with open(path, "ab") as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    f.write(record)
+                # The record is complete before the index points at it
+                with open(self.index_path, "a") as f:
+                    f.write(f"{kind}\t{token}\t{segment}\t{offset}\n")
+            self._index[(kind, token)] = (segment, offset)
+
+    def get(self, kind: str, token: str) -> Optional[bytes]:
+        """Return the latest archived body for a token.
+
+        Args:
+            kind (str): Response type
+            token (str): The challenge token/ID
+
+        Returns:
+            bytes or None: The raw response body, or None if not archived
+        """
+        location = self._index.get((kind, token))
+        if location is None:
+            return None
+        return read_record(self._segment_path(location[0]), location[1])
+
+    def tokens(self, kind: str) -> List[str]:
+        """Tokens with at least one archived response of a kind."""
+        return [token for k, token in self._index if k == kind]
+
+    def locations(self, kind: str) -> Iterator[Tuple[str, Path, int]]:
+        """Yield (token, segment path, offset) for the latest record of each key.
+
+        Records are yielded in file order so readers seek forwards.
+        """
+        entries = sorted(
+            (location, token)
+            for (k, token), location in self._index.items()
+            if k == kind
+        )
+        for (segment, offset), token in entries:
+            yield token, self._segment_path(segment), offset
+
+
+def read_record(path: Path, offset: int) -> bytes:
+    """Read and decompress the record starting at ``offset`` in a segment.
+
+    Args:
+        path (Path): Segment file
+        offset (int): Offset of the record header
+
+    Returns:
+        bytes: The raw response body
+
+    Raises:
+        ValueError: If the record is truncated or corrupt
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        header = f.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            raise ValueError(f"Truncated record at {path}:{offset}")
+        key_length, body_length = RECORD_HEADER.unpack(header)
+        f.seek(key_length, os.SEEK_CUR)
+        compressed = f.read(body_length)
+    try:
+        return zlib.decompress(compressed)
+    except zlib.error as e:
+        raise ValueError(f"Corrupt record at {path}:{offset}: {e}") from e
+
+
+def _parse_batch(
+    batch: List[Tuple[str, str, int, date]], strict: bool
+) -> List[Tuple[str, Optional[DailyChallengeGame], str]]:
+    """Rebuild games from archived records; runs in a worker process.
+
+    Returns:
+        List[Tuple]: (token, game or None, error message) per record
+    """
+    results = []
+    for token, path, offset, day in batch:
+        try:
+            payload = decode_json(read_record(Path(path), offset))
+            if payload.get("state", "finished") != "finished":
+                results.append((token, None, "game not finished"))
+                continue
+            game = parse_game_details(token, payload, strict)
+        except (ValueError, OSError) as e:
+            # Corrupt records and unreadable segments fail only their games
+            results.append((token, None, str(e)))
+            continue
+        game.date = day
+        results.append((token, game, ""))
+    return results
+
+
+def reprocess(
+    archive: ResponseArchive,
+    dates: Dict[str, date],
+    workers: int = 1,
+    strict: bool = False,
+    batch_size: int = 256,
+) -> Tuple[List[DailyChallengeGame], Dict[str, str]]:
+    """Parse every archived game response again, without the network.
+
+    Args:
+        archive (ResponseArchive): Archive to read
+        dates (Dict[str, date]): Challenge date of each token; game
+                                 responses do not carry it
+        workers (int): Worker processes; 1 parses in this process
+        strict (bool): Fully validate every response
+        batch_size (int): Records handed to a worker at a time
+
+    Returns:
+        Tuple: (rebuilt games in date order, error message per failed token)
+    """
+    entries = [
+        (token, str(path), offset, dates[token])
+        for token, path, offset in archive.locations("game")
+        if token in dates
+    ]
+    batches = [
+        entries[start : start + batch_size]
+        for start in range(0, len(entries), batch_size)
+    ]
+
+    if workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_batch, batches, [strict] * len(batches))
+            results = list(results)
+    else:
+        results = [_parse_batch(batch, strict) for batch in batches]
+
+    games = []
+    errors = {}
+    for batch in results:
+        for token, game, error in batch:
+            if game is None:
+                errors[token] = error
+            else:
+                games.append(game)
+    games.sort(key=lambda game: game.date)
+    return games, errors
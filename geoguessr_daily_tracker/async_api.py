@@ -0,0 +1,244 @@
+"""Asyncio API client for GeoGuessr game interactions.
+
+Requires the optional ``aiohttp`` dependency
+(``pip install geoguessr-daily-tracker[async]``).
+"""
+
+import asyncio
+from typing import Iterable, List, Optional
+
+import aiohttp
+
+from .api import (
+    RETRY_STATUSES,
+    GeoGuessrAPI,
+    decode_json,
+    endpoint_name,
+    load_cached_game,
+    parse_daily_challenge,
+    parse_game_details,
+    parse_retry_after,
+    retry_delay,
+    store_game_response,
+)
+from .config import load_config
+from .metrics import metrics
+from .models import DailyChallengeGame
+
+
+class AsyncGeoGuessrAPI:
+    """Asyncio counterpart of GeoGuessrAPI for high fan-out workloads.
+
+    All requests made through one instance share a single pooled
+    connector, so use it as ``async with AsyncGeoGuessrAPI() as api:``
+    for the whole run.
+    """
+
+    BASE_URL = GeoGuessrAPI.BASE_URL
+
+    def __init__(
+        self,
+        cookie=None,
+        session: Optional[aiohttp.ClientSession] = None,
+        pool_size=100,
+        timeout=(5, 30),
+        max_retries=3,
+        backoff_factor=0.5,
+        cache=None,
+        refresh_cache=False,
+        strict=False,
+        rate_limiter=None,
+        archive=None,
+    ):
+        """Initialize the async API client with required authentication.
+
+        Args:
+            cookie (str, optional): The _ncfa cookie value. If not provided,
+                                   will be read from environment or config.
+            session (aiohttp.ClientSession, optional): Shared session to reuse.
+                                   The client only closes sessions it created.
+            pool_size (int): Maximum open connections for a new session
+            timeout (tuple): Connect and read timeouts in seconds
+            max_retries (int): Retries for connection errors, 429 and 5xx
+            backoff_factor (float): Base delay for exponential backoff
+            cache (GameCache, optional): Cache of finished game responses
+            refresh_cache (bool): Ignore cached responses but still store
+                                  freshly fetched ones
+            strict (bool): Validate whole responses instead of reading only
+                           the fields that are stored
+            rate_limiter (RateLimiter, optional): Limiter shared by every
+                           request; share one instance between clients to
+                           throttle them together
+            archive (ResponseArchive, optional): Archive every raw response
+                           is appended to, for offline re-processing
+        """
+        self.ncfa_cookie = cookie or load_config().ncfa_cookie
+        if not self.ncfa_cookie:
+            raise ValueError("NCFA_COOKIE is required in environment or config")
+
+        self.headers = {"Cookie": f"_ncfa={self.ncfa_cookie}"}
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._owns_session = session is None
+        self.session = session
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.strict = strict
+        self.rate_limiter = rate_limiter
+        self.archive = archive
+
+    async def __aenter__(self):
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        # The session must be created inside the running event loop
+        if self.session is None:
+            connect_timeout, read_timeout = self.timeout
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=connect_timeout, sock_read=read_timeout
+                ),
+            )
+        return self.session
+
+    async def close(self):
+        """Close the underlying session if it is owned by this client."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _get_body(self, path: str) -> bytes:
+        """Send a GET request, retrying transient failures.
+
+        Args:
+            path (str): Path relative to BASE_URL
+
+        Returns:
+            bytes: Raw response body
+
+        Raises:
+            aiohttp.ClientError: If the request keeps failing
+        """
+        session = self._ensure_session()
+        url = f"{self.BASE_URL}{path}"
+        endpoint = endpoint_name(path)
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                metrics.inc("geoguessr_api_retries_total", endpoint=endpoint)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            try:
+                with metrics.timer("geoguessr_api_request_seconds", endpoint=endpoint):
+                    async with session.get(url, headers=self.headers) as response:
+                        metrics.inc(
+                            "geoguessr_api_requests_total",
+                            endpoint=endpoint,
+                            status=str(response.status),
+                        )
+                        if self.rate_limiter is not None:
+                            await self.rate_limiter.record_response_async(
+                                endpoint,
+                                response.status,
+                                parse_retry_after(response.headers.get("Retry-After")),
+                            )
+                        if (
+                            response.status not in RETRY_STATUSES
+                            or attempt == self.max_retries
+                        ):
+                            response.raise_for_status()
+                            body = await response.read()
+                            metrics.inc(
+                                "geoguessr_api_response_bytes_total",
+                                len(body),
+                                endpoint=endpoint,
+                            )
+                            return body
+                    delay = retry_delay(
+                        attempt,
+                        response.headers.get("Retry-After"),
+                        backoff_factor=self.backoff_factor,
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                metrics.inc(
+                    "geoguessr_api_requests_total", endpoint=endpoint, status="error"
+                )
+                if attempt == self.max_retries:
+                    raise
+                delay = retry_delay(attempt, backoff_factor=self.backoff_factor)
+            await asyncio.sleep(delay)
+
+    async def get_daily_challenge(self) -> str:
+        """Fetch today's daily challenge token.
+
+        Returns:
+            str: The challenge token
+        """
+        body = await self._get_body("/challenges/daily-challenges/today")
+        payload = decode_json(body)
+        if self.archive is not None:
+            await asyncio.to_thread(
+                self.archive.put, "daily_challenge", str(payload.get("token")), body
+            )
+        return parse_daily_challenge(payload, self.strict)
+
+    async def get_game_details(self, token: str) -> DailyChallengeGame:
+        """Fetch game details for a specific challenge token.
+
+        Args:
+            token (str): The challenge token/ID
+
+        Returns:
+            DailyChallengeGame: Game details including score and rounds
+        """
+        # Cache and archive hit the disk, so they run off the event loop
+        payload = None
+        if not self.refresh_cache and self.cache is not None:
+            payload = await asyncio.to_thread(
+                load_cached_game, token, self.cache, self.archive
+            )
+        if payload is None:
+            body = await self._get_body(f"/challenges/{token}/game")
+            payload = decode_json(body)
+            if self.cache is not None or self.archive is not None:
+                await asyncio.to_thread(
+                    store_game_response,
+                    token,
+                    body,
+                    payload,
+                    self.cache,
+                    self.archive,
+                )
+
+        return parse_game_details(token, payload, self.strict)
+
+    async def gather_games(
+        self, tokens: Iterable[str], concurrency: int = 10
+    ) -> List[DailyChallengeGame]:
+        """Fetch many games with at most ``concurrency`` requests in flight.
+
+        Args:
+            tokens (Iterable[str]): Challenge tokens to fetch
+            concurrency (int): Maximum number of concurrent requests
+
+        Returns:
+            List[DailyChallengeGame]: Games in the same order as ``tokens``
+
+        Raises:
+            aiohttp.ClientError: If any game cannot be fetched
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(token):
+            async with semaphore:
+                return await self.get_game_details(token)
+
+        return list(await asyncio.gather(*(fetch(token) for token in tokens)))
@@ -0,0 +1,48 @@
+"""Concurrent backfill of previous daily challenges."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Tuple
+
+from .api import GeoGuessrAPI
+from .models import DailyChallengeGame
+
+
+def fetch_games(
+    api: GeoGuessrAPI, challenges: Dict[date, str], workers: int = 1
+) -> Tuple[List[DailyChallengeGame], List[Tuple[date, str, Exception]]]:
+    """Fetch game details for many challenges with bounded concurrency.
+
+    Args:
+        api (GeoGuessrAPI): API client instance
+        challenges (Dict[date, str]): Mapping of dates to challenge IDs
+        workers (int): Maximum number of requests in flight
+
+    Returns:
+        Tuple: Games sorted by date, and (date, challenge_id, error) for
+               every challenge that could not be fetched
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    def fetch(item):
+        challenge_date, challenge_id = item
+        print(f"Filling data for {challenge_date} with challenge {challenge_id}")
+        game = api.get_game_details(challenge_id)
+        game.date = challenge_date
+        return game
+
+    items = sorted(challenges.items())
+    games = []
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(fetch, item) for item in items]
+        # Collect in submission order so output stays sorted by date
+        for (challenge_date, challenge_id), future in zip(items, futures):
+            try:
+                games.append(future.result())
+            except Exception as e:
+                failures.append((challenge_date, challenge_id, e))
+
+    return games, failures
@@ -0,0 +1,123 @@
+"""On-disk cache of finished game responses."""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import get_data_dir
+
+
+class GameCache:
+    """Size-bounded LRU cache of raw game responses keyed by challenge token.
+
+    Entries are gzip-compressed JSON files named after the SHA-256 of the
+    token. A file's mtime is bumped on every hit, so eviction removes the
+    least recently used entries first.
+    """
+
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            directory (Path, optional): Cache directory. Defaults to
+                                       ``cache/games`` under the data dir.
+            max_bytes (int): Total size above which entries are evicted
+        """
+        self.directory = (
+            Path(directory) if directory else get_data_dir() / "cache" / "games"
+        )
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+        self._lock = threading.Lock()
+
+    def _path(self, token: str) -> Path:
+        digest = hashlib.sha256(token.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json.gz"
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a token, or None on a miss.
+
+        Args:
+            token (str): The challenge token/ID
+
+        Returns:
+            dict or None: Decoded game response
+        """
+        path = self._path(token)
+        try:
+            with gzip.open(path, "rb") as f:
+                payload = json.loads(f.read())
+            os.utime(path)
+        except FileNotFoundError:
+            payload = None
+        except (OSError, ValueError):
+            # Corrupt entry: drop it and fetch again
+            path.unlink(missing_ok=True)
+            payload = None
+
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """Store a response and evict old entries if the cache is too big.
+
+        Args:
+            token (str): The challenge token/ID
+            payload (dict): Decoded game response
+        """
+        path = self._path(token)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(json.dumps(payload, separators=(",", ":")).encode())
+
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._size is None:
+                self._size = self._total_size()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        return [(p, p.stat()) for p in self.directory.glob("*/*.json.gz")]
+
+    def _total_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        size = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+        self._size = size
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit and miss counters.
+
+        Returns:
+            Dict[str, int]: Number of hits and misses since creation
+        """
+        return {"hits": self.hits, "misses": self.misses}
@@ -1,61 +1,174 @@
 """Command-line interface for GeoGuessr Tracker."""
 
 import argparse
+import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, List, NoReturn, Optional
 
-from .api import GeoGuessrAPI
-from .config import get_config
-from .sheets import GoogleSheetsWriter
-from .utils import get_previous_challenges, save_to_csv
+from .config import Config, get_config, load_config
 
+# Everything else is imported where it is used so that commands which do
+# not need the API client or Google Sheets start quickly.
+if TYPE_CHECKING:
+    from .api import GeoGuessrAPI
+    from .sheets import GoogleSheetsWriter
+    from .storage import Storage
 
-def setup_sheets() -> Optional[GoogleSheetsWriter]:
+
+def setup_sheets(config=None) -> Optional["GoogleSheetsWriter"]:
     """Initialize and return Google Sheets writer if enabled.
 
+    Args:
+        config (dict, optional): Configuration to use. Defaults to the
+                                 cached settings from load_config().
+
     Returns:
         GoogleSheetsWriter or None: Sheets writer instance if enabled
     """
-    config = get_config()
-    if config.get("USE_GSHEETS", "").lower() == "true":
+    settings = load_config() if config is None else Config.from_dict(config)
+    if settings.use_gsheets:
         try:
-            return GoogleSheetsWriter()
+            from .sheets import GoogleSheetsWriter
+
+            return GoogleSheetsWriter(settings.gsheet_id, settings.gsheet_credentials)
         except Exception as e:
             print(f"Warning: Failed to initialize Google Sheets: {e}")
     return None
 
 
-def fill_daily_challenge(api: GeoGuessrAPI, sheets_writer, date, challenge_id):
-    """Fill challenge data for a specific date and challenge ID.
+def fill_previous_dates(
+    api: "GeoGuessrAPI", sheet, workers: int = 1, storage: "Storage" = None
+):
+    """Fill previous dates using challenge IDs from CSV.
+
+    Games are fetched concurrently and then saved in date order once all
+    downloads have finished. A failed challenge is reported but does not
+    stop the rest of the backfill.
 
     Args:
         api (GeoGuessrAPI): API client instance
-        sheets_writer: GoogleSheetsWriter instance or None
-        date (datetime.date): The date of the challenge
-        challenge_id (str): The challenge ID from the URL
+        sheet: GoogleSheetsWriter instance or None
+        workers (int): Number of games to fetch in parallel
+        storage (Storage, optional): Store to save into. Defaults to the
+                                     configured backend.
+    """
+    from .backfill import fetch_games
+    from .storage import get_storage
+    from .utils import get_previous_challenges
+
+    challenges = get_previous_challenges()
+    games, failures = fetch_games(api, challenges, workers=workers)
+
+    storage = storage or get_storage()
+    storage.save_games(games)
+    if sheet:
+        sheet.save_games(games)
+
+    for date, challenge_id, error in failures:
+        print(f"Error filling challenge {challenge_id} for {date}: {str(error)}")
+    print(f"Filled {len(games)} challenges ({len(failures)} failed)")
+    if api.cache is not None:
+        stats = api.cache.stats()
+        print(f"Cache: {stats['hits']} hits, {stats['misses']} misses")
+
+
+def save_leaderboard(payload: dict, directory=None) -> None:
+    """Store the leaderboards of a daily challenge response.
+
+    Failures are reported but never abort tracking.
+
+    Args:
+        payload (dict): Decoded daily challenge response
+        directory (Path, optional): Leaderboard store directory
     """
+    from .leaderboard import LeaderboardStore
+
     try:
-        game = api.get_game_details(challenge_id)
-        game.date = date
-        save_to_csv(game)
-        if sheets_writer:
-            sheets_writer.save_game(game)
-        print(f"Successfully saved challenge results for {date}")
+        LeaderboardStore(directory).save(payload)
     except Exception as e:
-        print(f"Error filling challenge for {date}: {str(e)}")
+        print(f"Warning: could not store leaderboard: {str(e)}", file=sys.stderr)
 
 
-def fill_previous_dates(api: GeoGuessrAPI, sheet):
-    """Fill previous dates using challenge IDs from CSV.
+def track_all_accounts(
+    accounts, strict: bool = False, archive: bool = True
+) -> List[str]:
+    """Track today's challenge for every configured account concurrently.
+
+    All accounts share one pooled HTTP session and one rate limiter. A
+    failure in one account is reported and does not affect the others.
 
     Args:
-        api (GeoGuessrAPI): API client instance
-        sheet: GoogleSheetsWriter instance or None
+        accounts (List[dict]): Account configurations from get_accounts()
+        strict (bool): Fully validate API responses
+        archive (bool): Archive raw responses next to each account's store
+
+    Returns:
+        List[str]: Names of the accounts that failed
     """
-    challenges = get_previous_challenges()
-    for date, challenge_id in challenges.items():
-        print(f"Filling data for {date} with challenge {challenge_id}")
-        fill_daily_challenge(api, sheet, date, challenge_id)
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    from .api import (
+        GeoGuessrAPI,
+        create_session,
+        parse_challenge_start,
+        parse_daily_challenge,
+    )
+    from .archive import ResponseArchive
+    from .ratelimit import RateLimiter
+    from .storage import get_storage
+
+    def track_account(account):
+        data_dir = Path(account["STORAGE_PATH"]).parent
+        api = GeoGuessrAPI(
+            cookie=account["NCFA_COOKIE"],
+            session=session,
+            strict=strict,
+            rate_limiter=rate_limiter,
+            archive=ResponseArchive(data_dir / "archive") if archive else None,
+        )
+        payload = api.get_daily_challenge_payload()
+        token = parse_daily_challenge(payload, strict)
+        save_leaderboard(payload, data_dir / "leaderboards")
+        game = api.get_game_details(token)
+        game.date = parse_challenge_start(payload).date()
+        with get_storage(account) as storage:
+            storage.save_game(game)
+        sheet = setup_sheets(account)
+        if sheet:
+            sheet.save_game(game)
+        return game
+
+    # One limiter for every account, so together they stay within RATE_LIMIT
+    rate_limiter = RateLimiter.from_config()
+    failed = []
+    workers = max(1, min(len(accounts), 16))
+    with (
+        create_session(pool_size=workers) as session,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
+        futures = [
+            (account["name"], executor.submit(track_account, account))
+            for account in accounts
+        ]
+        for name, future in futures:
+            try:
+                game = future.result()
+                print(f"[{name}] Successfully saved challenge results for {game.date}")
+            except Exception as e:
+                print(f"[{name}] Error: {str(e)}", file=sys.stderr)
+                failed.append(name)
+    return failed
+
+
+def _mask_cookie(settings: dict) -> dict:
+    """Copy of settings with NCFA_COOKIE reduced to its last four characters."""
+    masked = dict(settings)
+    if "NCFA_COOKIE" in masked:
+        masked["NCFA_COOKIE"] = (
+            "****" + masked["NCFA_COOKIE"][-4:] if masked["NCFA_COOKIE"] else None
+        )
+    return masked
 
 
 def configure_command(args):
@@ -68,13 +181,12 @@ def configure_command(args):
 
     if args.show:
         # Hide sensitive values when showing config
-        display_config = config.copy()
-        if "NCFA_COOKIE" in display_config:
-            display_config["NCFA_COOKIE"] = (
-                "****" + display_config["NCFA_COOKIE"][-4:]
-                if display_config["NCFA_COOKIE"]
-                else None
-            )
+        display_config = _mask_cookie(config)
+        if isinstance(display_config.get("ACCOUNTS"), list):
+            display_config["ACCOUNTS"] = [
+                _mask_cookie(account) if isinstance(account, dict) else account
+                for account in display_config["ACCOUNTS"]
+            ]
         print("Current configuration:")
         for key, value in display_config.items():
             print(f"  {key}: {value}")
@@ -108,22 +220,500 @@ def configure_command(args):
         if creds_path:
             config["GSHEET_CREDENTIALS"] = creds_path
 
+    storage_backend = input(
+        f"Storage backend (csv/sqlite) [{config.get('STORAGE_BACKEND') or 'csv'}]: "
+    )
+    if storage_backend:
+        config["STORAGE_BACKEND"] = storage_backend.lower()
+
     from .config import save_config
 
     save_config(config)
     print("Configuration saved successfully")
 
 
+def migrate_command():
+    """Handle the migrate command."""
+    from .storage import CsvStorage, get_storage, migrate_from_csv
+
+    with get_storage() as storage:
+        if isinstance(storage, CsvStorage):
+            print("STORAGE_BACKEND is csv; nothing to migrate")
+            return
+        added = migrate_from_csv(storage)
+    print(f"Migrated {added} games from CSV")
+
+
+def missing_extra(error: ImportError, extra: str) -> NoReturn:
+    """Exit with an install hint when an optional dependency is missing.
+
+    Args:
+        error (ImportError): The failed import
+        extra (str): Name of the extra that provides the dependency
+    """
+    print(
+        f"Error: {error.name or error} is not installed. Install it with: "
+        f"pip install geoguessr-daily-tracker[{extra}]",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+def export_command(args):
+    """Handle the export command.
+
+    Args:
+        args: Command-line arguments
+    """
+    try:
+        from .parquet_store import ParquetHistory
+    except ImportError as e:
+        missing_extra(e, "parquet")
+    from .storage import get_storage
+
+    history = ParquetHistory(args.output)
+    with get_storage() as storage:
+        added = history.append(storage.iter_games())
+    print(f"Exported {added} new games to {history.directory}")
+
+
+def stats_command(args):
+    """Handle the stats command.
+
+    Args:
+        args: Command-line arguments
+    """
+    try:
+        from .stats import PERCENTILES, compute_stats
+    except ImportError as e:
+        missing_extra(e, "stats")
+    from .storage import get_storage
+
+    with get_storage() as storage:
+        stats = compute_stats(storage.iter_games(), window=args.window)
+
+    if not stats["games"]:
+        print("No games stored yet")
+        return
+
+    print(f"Games: {stats['games']}")
+    print(f"Average score: {stats['average']:,.0f}")
+    if stats["rolling_average"] is not None:
+        print(f"Last {args.window}-game average: {stats['rolling_average']:,.0f}")
+    medals = stats["medals"]
+    print(
+        f"Medals: {medals['gold']} gold, {medals['silver']} silver, "
+        f"{medals['bronze']} bronze"
+    )
+    print(
+        f"Streak: {stats['streaks']['current']} days "
+        f"(longest {stats['streaks']['longest']})"
+    )
+    for name in ("best", "worst"):
+        # None when no stored game has round scores
+        if stats[name] is None:
+            print(f"{name.capitalize()} round: no games")
+            continue
+        day, number, score = stats[name]
+        print(f"{name.capitalize()} round: {score:,} (round {number} on {day})")
+
+    print("Round scores:")
+    print("  round   mean " + " ".join(f"{f'p{p}':>6}" for p in PERCENTILES))
+    for i, mean in enumerate(stats["round_averages"]):
+        values = " ".join(f"{v:>6.0f}" for v in stats["round_percentiles"][:, i])
+        print(f"  {i + 1:>5} {mean:>6.0f} {values}")
+
+
+def regions_command(args):
+    """Handle the regions command.
+
+    Args:
+        args: Command-line arguments
+    """
+    try:
+        import numpy as np
+
+        from .geo import (
+            SpatialIndex,
+            error_directions,
+            haversine,
+            load_rounds,
+            loss_by_country,
+            loss_by_region,
+        )
+    except ImportError as e:
+        missing_extra(e, "stats")
+    from .storage import get_storage
+
+    with get_storage() as storage:
+        rounds = load_rounds(storage.iter_games())
+
+    if args.box and len(rounds["scores"]):
+        inside = SpatialIndex(rounds["lat"], rounds["lng"]).query(*args.box)
+        rounds = {name: column[inside] for name, column in rounds.items()}
+
+    if not len(rounds["scores"]):
+        if args.box:
+            print("No rounds with coordinates inside the box")
+        else:
+            print("No rounds with coordinates stored yet")
+        return
+
+    if args.by == "country":
+        losses = loss_by_country(rounds)
+        label = "country"
+    else:
+        losses = loss_by_region(rounds, args.cell_size)
+        label = f"{args.cell_size:g}° cell (SW corner)"
+
+    errors = haversine(
+        rounds["lat"], rounds["lng"], rounds["guess_lat"], rounds["guess_lng"]
+    )
+    print(f"Rounds with coordinates: {len(errors)}")
+    print(f"Median error: {np.median(errors) / 1000:,.0f} km")
+    print(f"{label:<24} {'rounds':>6} {'avg lost':>9} {'total lost':>11}")
+    for key, count, average, total in losses[: args.top]:
+        if isinstance(key, tuple):
+            key = f"{key[0]:+.0f}, {key[1]:+.0f}"
+        print(f"{key:<24} {count:>6} {average:>9,.0f} {total:>11,}")
+
+    directions = error_directions(rounds)
+    print(
+        "Guesses missed towards: "
+        + ", ".join(f"{d} {n}" for d, n in directions.items())
+    )
+
+
+def leaderboard_command(args):
+    """Handle the leaderboard command.
+
+    Args:
+        args: Command-line arguments
+    """
+    from .leaderboard import LeaderboardStore
+    from .storage import get_storage
+
+    with get_storage() as storage:
+        scores = {game.date: game.totalScore for game in storage.iter_games()}
+
+    history = LeaderboardStore().rank_history(scores, scope=args.scope)
+    if not history:
+        print("No leaderboard snapshots for your games yet")
+        return
+
+    # Only the top of each list is returned, so ranks and percentiles are
+    # relative to the listed entries; participants is the day's total
+    print(
+        f"{'date':<10} {'score':>6} {'rank':>6} {'of':>6} "
+        f"{'list pct':>8} {'players':>8}"
+    )
+    for day, rank, percentile, entries, participants in history:
+        print(
+            f"{day.isoformat():<10} {scores[day]:>6} {rank:>6} {entries:>6} "
+            f"{percentile:>7.1f}% {participants:>8}"
+        )
+
+
+def reprocess_command(args):
+    """Handle the reprocess command.
+
+    Args:
+        args: Command-line arguments
+    """
+    from pathlib import Path
+
+    from .archive import ResponseArchive
+
+    if not (args.all or args.account):
+        reprocess_store(ResponseArchive(), None, args)
+        return
+
+    from .config import get_accounts
+
+    try:
+        accounts = get_accounts()
+    except ValueError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    if not args.all:
+        accounts = [account for account in accounts if account["name"] == args.account]
+        if not accounts:
+            print(f"Error: no account named {args.account!r}", file=sys.stderr)
+            sys.exit(1)
+    for account in accounts:
+        # Where track --all archives each account's responses
+        archive = ResponseArchive(Path(account["STORAGE_PATH"]).parent / "archive")
+        print(f"[{account['name']}]")
+        reprocess_store(archive, account, args)
+
+
+def reprocess_store(archive, config, args) -> None:
+    """Rebuild one store from one archive.
+
+    Args:
+        archive (ResponseArchive): Archive to read
+        config (dict, optional): Configuration of the store. Defaults to
+                                 the configured store.
+        args: Command-line arguments
+    """
+    from .archive import reprocess
+    from .storage import get_storage
+    from .utils import get_previous_challenges
+
+    if not len(archive):
+        print(f"No archived responses in {archive.directory}")
+        return
+
+    with get_storage(config) as storage:
+        # Game responses carry no date, so take it from what we know
+        dates = {token: day for day, token in get_previous_challenges().items()}
+        dates.update((game.token, game.date) for game in storage.iter_games())
+
+        games, errors = reprocess(
+            archive, dates, workers=args.workers, strict=args.strict
+        )
+        storage.replace_games(games)
+
+    for token, error in errors.items():
+        print(f"Warning: could not reprocess {token}: {error}")
+    unknown = len(archive.tokens("game")) - len(games) - len(errors)
+    print(
+        f"Rebuilt {len(games)} games from the archive"
+        + (f" ({unknown} without a known date skipped)" if unknown else "")
+    )
+
+
+def sync_command(args):
+    """Handle the sync command.
+
+    Args:
+        args: Command-line arguments
+    """
+    from .storage import get_storage
+
+    sheet = setup_sheets()
+    if sheet is None:
+        print("Error: Google Sheets is not enabled", file=sys.stderr)
+        sys.exit(1)
+
+    with get_storage() as storage:
+        added, updated, sheet_only = sheet.sync_games(storage.iter_games())
+        print(f"Added {len(added)} and updated {len(updated)} rows in the spreadsheet")
+
+        if not sheet_only:
+            return
+        if not args.pull:
+            print(f"{len(sheet_only)} rows exist only in the spreadsheet (use --pull)")
+            return
+
+        games = []
+        for row in sheet_only:
+            try:
+                games.append(sheet.row_to_game(row))
+            except (ValueError, TypeError, IndexError) as e:
+                print(f"Warning: skipping sheet row {row[:1]}: {str(e)}")
+        pulled = storage.save_games(games)
+    print(f"Pulled {len(pulled)} games from the spreadsheet")
+
+
+def enable_metrics(path: str) -> None:
+    """Collect metrics for this run and write them to ``path`` on exit.
+
+    Args:
+        path (str): Output file
+    """
+    import atexit
+
+    from .metrics import metrics
+
+    def write():
+        try:
+            metrics.write(path)
+        except OSError as e:
+            print(f"Warning: could not write metrics: {str(e)}", file=sys.stderr)
+
+    metrics.enabled = True
+    atexit.register(write)
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
 def main():
     """Main entry point for the command-line interface."""
     parser = argparse.ArgumentParser(description="GeoGuessr Daily Challenge Tracker")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fully validate API responses (slower, for debugging)",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="Write request timings and counts to FILE when the run ends "
+        "(Prometheus textfile if it ends in .prom, JSON otherwise)",
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Do not append raw API responses to the response archive",
+    )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     # Track command
-    subparsers.add_parser("track", help="Track today's daily challenge")
+    track_parser = subparsers.add_parser("track", help="Track today's daily challenge")
+    track_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Track every account listed under ACCOUNTS in the config file",
+    )
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Keep running and save each daily challenge once finished"
+    )
+    watch_parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=60.0,
+        help="Shortest delay between polls in seconds (default: 60)",
+    )
+    watch_parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=1800.0,
+        help="Longest delay between polls in seconds (default: 1800)",
+    )
 
     # Fill command
-    subparsers.add_parser("fill", help="Fill previous dates from CSV file")
+    fill_parser = subparsers.add_parser(
+        "fill", help="Fill previous dates from CSV file"
+    )
+    fill_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of games to fetch in parallel (default: 1)",
+    )
+    fill_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the local game cache",
+    )
+    fill_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-download games and overwrite their cached copies",
+    )
+
+    # Migrate command
+    subparsers.add_parser(
+        "migrate",
+        help="Copy the CSV history into the configured storage backend",
+    )
+
+    # Export command
+    export_parser = subparsers.add_parser(
+        "export", help="Export the game history for analytics"
+    )
+    export_parser.add_argument(
+        "--format",
+        choices=["parquet"],
+        default="parquet",
+        help="Output format (default: parquet)",
+    )
+    export_parser.add_argument(
+        "--output",
+        help="Output directory (default: history/ in the data directory)",
+    )
+
+    # Stats command
+    stats_parser = subparsers.add_parser("stats", help="Show score statistics")
+    stats_parser.add_argument(
+        "--window",
+        type=positive_int,
+        default=7,
+        help="Number of games in the rolling average (default: 7)",
+    )
+
+    # Regions command
+    regions_parser = subparsers.add_parser(
+        "regions", help="Show where you lose the most points (needs the [stats] extra)"
+    )
+    regions_parser.add_argument(
+        "--by",
+        choices=["country", "cell"],
+        default="country",
+        help="Group rounds by country or by grid cell (default: country)",
+    )
+    regions_parser.add_argument(
+        "--cell-size",
+        type=float,
+        default=10.0,
+        help="Grid cell size in degrees for --by cell (default: 10)",
+    )
+    regions_parser.add_argument(
+        "--box",
+        nargs=4,
+        type=float,
+        metavar=("MIN_LAT", "MAX_LAT", "MIN_LNG", "MAX_LNG"),
+        help="Only count rounds whose true location is inside this box",
+    )
+    regions_parser.add_argument(
+        "--top", type=int, default=10, help="Number of rows to show (default: 10)"
+    )
+
+    # Leaderboard command
+    leaderboard_parser = subparsers.add_parser(
+        "leaderboard", help="Show your daily leaderboard rank over time"
+    )
+    leaderboard_parser.add_argument(
+        "--scope",
+        choices=["leaderboard", "friends", "country"],
+        default="leaderboard",
+        help="Which leaderboard to rank against (default: leaderboard)",
+    )
+
+    # Reprocess command
+    reprocess_parser = subparsers.add_parser(
+        "reprocess",
+        help="Rebuild stored games from archived API responses (no network)",
+    )
+    reprocess_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    reprocess_accounts = reprocess_parser.add_mutually_exclusive_group()
+    reprocess_accounts.add_argument(
+        "--account",
+        metavar="NAME",
+        help="Rebuild the store of one account listed under ACCOUNTS",
+    )
+    reprocess_accounts.add_argument(
+        "--all",
+        action="store_true",
+        help="Rebuild the store of every account listed under ACCOUNTS",
+    )
+
+    # Sync command
+    sync_parser = subparsers.add_parser(
+        "sync", help="Reconcile the spreadsheet with the local store"
+    )
+    sync_parser.add_argument(
+        "--pull",
+        action="store_true",
+        help="Also copy games found only in the spreadsheet into the local store",
+    )
 
     # Configure command
     config_parser = subparsers.add_parser("configure", help="Configure the application")
@@ -133,26 +723,125 @@ def main():
 
     args = parser.parse_args()
 
+    if args.metrics:
+        enable_metrics(args.metrics)
+
     if args.command == "configure":
         configure_command(args)
         return
 
+    # Validate the settings once, before any work starts
     try:
-        api = GeoGuessrAPI()
-        sheet = setup_sheets()
-
-        if args.command == "fill":
-            fill_previous_dates(api, sheet)
-        elif args.command == "track" or args.command is None:
-            # Default command is track
-            token = api.get_daily_challenge()
-            game = api.get_game_details(token)
-            save_to_csv(game)
-            if sheet:
-                sheet.save_game(game)
-            print(f"Successfully saved challenge results for {game.date}")
-        else:
-            parser.print_help()
+        load_config()
+    except ValueError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "track" and args.all:
+        from .config import get_accounts
+
+        try:
+            accounts = get_accounts()
+        except ValueError as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        if not accounts:
+            print("Error: no ACCOUNTS configured", file=sys.stderr)
+            sys.exit(1)
+        if track_all_accounts(
+            accounts, strict=args.strict, archive=not args.no_archive
+        ):
+            sys.exit(1)
+        return
+
+    if args.command == "migrate":
+        migrate_command()
+        return
+
+    if args.command == "export":
+        export_command(args)
+        return
+
+    if args.command == "stats":
+        stats_command(args)
+        return
+
+    if args.command == "leaderboard":
+        leaderboard_command(args)
+        return
+
+    if args.command == "regions":
+        regions_command(args)
+        return
+
+    if args.command == "reprocess":
+        reprocess_command(args)
+        return
+
+    if args.command == "sync":
+        try:
+            sync_command(args)
+        except Exception as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    from .api import GeoGuessrAPI
+    from .archive import ResponseArchive
+    from .cache import GameCache
+    from .ratelimit import RateLimiter
+    from .storage import get_storage
+
+    try:
+        workers = getattr(args, "workers", 1)
+        cache = None
+        if args.command == "fill" and not args.no_cache:
+            cache = GameCache()
+        with (
+            GeoGuessrAPI(
+                pool_size=max(10, workers),
+                cache=cache,
+                refresh_cache=getattr(args, "refresh", False),
+                strict=args.strict,
+                rate_limiter=RateLimiter.from_config(),
+                archive=None if args.no_archive else ResponseArchive(),
+            ) as api,
+            get_storage() as storage,
+        ):
+            sheet = setup_sheets()
+
+            if args.command == "fill":
+                fill_previous_dates(api, sheet, workers=workers, storage=storage)
+            elif args.command == "track" or args.command is None:
+                # Default command is track
+                from .api import parse_challenge_start, parse_daily_challenge
+
+                payload = api.get_daily_challenge_payload()
+                token = parse_daily_challenge(payload, api.strict)
+                save_leaderboard(payload)
+                game = api.get_game_details(token)
+                # The challenge's own (UTC) date, as watch stores it
+                game.date = parse_challenge_start(payload).date()
+                storage.save_game(game)
+                if sheet:
+                    sheet.save_game(game)
+                print(f"Successfully saved challenge results for {game.date}")
+            elif args.command == "watch":
+                from .watch import Watcher
+
+                watcher = Watcher(
+                    api,
+                    storage,
+                    sheet,
+                    min_interval=args.min_interval,
+                    max_interval=args.max_interval,
+                )
+                try:
+                    watcher.run()
+                except KeyboardInterrupt:
+                    print("Stopped watching")
+            else:
+                parser.print_help()
 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
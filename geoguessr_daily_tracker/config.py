@@ -2,40 +2,236 @@
 
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 CONFIG_FILE = Path.home() / ".geoguessr_daily_tracker.json"
 
+# Environment variables that override keys of the config file
+ENV_KEYS = (
+    "NCFA_COOKIE",
+    "USE_GSHEETS",
+    "GSHEET_ID",
+    "GSHEET_CREDENTIALS",
+    "STORAGE_BACKEND",
+    "STORAGE_PATH",
+    "RATE_LIMIT",
+    "RATE_LIMIT_LOCK",
+)
+
+STORAGE_BACKENDS = ("csv", "sqlite")
+
+# Requests per second when RATE_LIMIT names only some endpoints
+DEFAULT_RATE = 5.0
+
+
+class RateLimit(NamedTuple):
+    """Parsed RATE_LIMIT setting."""
+
+    rate: float
+    endpoint_rates: Mapping[str, float]
+
+
+def _parse_rate_limit(setting: Any) -> Optional[RateLimit]:
+    """Parse RATE_LIMIT: a rate, a mapping of endpoint to rate, or "2,game=5"."""
+    if setting in (None, ""):
+        return None
+
+    rate = DEFAULT_RATE
+    endpoint_rates = {}
+    try:
+        if isinstance(setting, dict):
+            endpoint_rates = {k: float(v) for k, v in setting.items()}
+        elif isinstance(setting, (int, float)):
+            rate = float(setting)
+        else:
+            for part in str(setting).split(","):
+                name, sep, value = part.strip().rpartition("=")
+                if sep:
+                    endpoint_rates[name.strip()] = float(value)
+                else:
+                    rate = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid RATE_LIMIT: {setting!r}") from None
+
+    if not min(endpoint_rates.values(), default=rate) > 0 or not rate > 0:
+        raise ValueError(f"Invalid RATE_LIMIT: {setting!r}, rates must be positive")
+    return RateLimit(rate, MappingProxyType(endpoint_rates))
+
+
+class Config(NamedTuple):
+    """Validated settings from the config file and environment."""
+
+    ncfa_cookie: Optional[str]
+    use_gsheets: bool
+    gsheet_id: Optional[str]
+    gsheet_credentials: Optional[str]
+    storage_backend: str
+    storage_path: Optional[Path]
+    rate_limit: Optional[RateLimit]
+    rate_limit_lock: Optional[Path]
+    accounts: Tuple[Mapping[str, Any], ...]
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, Any]) -> "Config":
+        """Validate raw settings.
+
+        Args:
+            values (Mapping[str, Any]): Merged file and environment settings
+
+        Returns:
+            Config: The typed settings
+
+        Raises:
+            ValueError: If a setting has the wrong type or an unknown value
+        """
+
+        def text(key):
+            value = values.get(key)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"Invalid configuration: {key} must be a string")
+            return value or None
+
+        use_gsheets = values.get("USE_GSHEETS") or False
+        if isinstance(use_gsheets, str):
+            use_gsheets = use_gsheets.lower() == "true"
+        elif not isinstance(use_gsheets, bool):
+            raise ValueError("Invalid configuration: USE_GSHEETS must be true or false")
+
+        backend = (text("STORAGE_BACKEND") or "csv").lower()
+        if backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"Unknown STORAGE_BACKEND {backend!r}, "
+                f"expected one of {', '.join(STORAGE_BACKENDS)}"
+            )
+
+        accounts = values.get("ACCOUNTS") or []
+        if not isinstance(accounts, list) or not all(
+            isinstance(entry, dict) for entry in accounts
+        ):
+            raise ValueError(
+                "Invalid configuration: ACCOUNTS must be a list of objects"
+            )
+
+        storage_path = text("STORAGE_PATH")
+        lock_file = text("RATE_LIMIT_LOCK")
+        return cls(
+            ncfa_cookie=text("NCFA_COOKIE"),
+            use_gsheets=use_gsheets,
+            gsheet_id=text("GSHEET_ID"),
+            gsheet_credentials=text("GSHEET_CREDENTIALS"),
+            storage_backend=backend,
+            storage_path=Path(storage_path) if storage_path else None,
+            rate_limit=_parse_rate_limit(values.get("RATE_LIMIT")),
+            rate_limit_lock=Path(lock_file) if lock_file else None,
+            accounts=tuple(MappingProxyType(entry) for entry in accounts),
+        )
+
+
+class _Loaded(NamedTuple):
+    key: Any
+    values: Mapping[str, Any]
+    config: Optional[Config]
+    error: Optional[ValueError]
+
+
+_loaded: Optional[_Loaded] = None
+_load_lock = threading.Lock()
+
+
+def _cache_key():
+    try:
+        stat = CONFIG_FILE.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    except OSError:
+        file_key = None
+    return str(CONFIG_FILE), file_key, tuple(os.environ.get(k) for k in ENV_KEYS)
+
+
+def _read() -> Dict[str, Any]:
+    config = {}
+
+    # Try to load from config file
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    # Environment variables take precedence
+    config.update({k: os.environ[k] for k in ENV_KEYS if k in os.environ})
+    return config
+
+
+def _load() -> _Loaded:
+    """Return the cached settings, re-reading them if anything changed.
+
+    The config file is only re-parsed when its mtime, size or inode
+    changes, or when one of the environment overrides does.
+    """
+    global _loaded
+    key = _cache_key()
+    loaded = _loaded
+    if loaded is not None and loaded.key == key:
+        return loaded
+
+    with _load_lock:
+        loaded = _loaded
+        if loaded is not None and loaded.key == key:
+            return loaded
+        values = _read()
+        try:
+            config, error = Config.from_dict(values), None
+        except ValueError as e:
+            config, error = None, e
+        # If the file changed while it was read, reload on the next call
+        loaded = _Loaded(
+            key if _cache_key() == key else None,
+            MappingProxyType(values),
+            config,
+            error,
+        )
+        _loaded = loaded
+        return loaded
+
+
+def refresh_config() -> None:
+    """Forget the cached settings so the next call reads them again."""
+    global _loaded
+    with _load_lock:
+        _loaded = None
+
 
 def get_config() -> Dict[str, Any]:
     """Get configuration from environment variables and config file.
 
+    The settings are cached and only re-read when the config file or an
+    environment override changes. Each call returns a new dict, so the
+    caller may modify it.
+
     Returns:
         Dict[str, Any]: Configuration dictionary
     """
-    config = {}
+    return dict(_load().values)
 
-    # Try to load from config file
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-        except json.JSONDecodeError:
-            pass
 
-    # Environment variables take precedence
-    env_vars = {
-        "NCFA_COOKIE": os.getenv("NCFA_COOKIE"),
-        "USE_GSHEETS": os.getenv("USE_GSHEETS"),
-        "GSHEET_ID": os.getenv("GSHEET_ID"),
-        "GSHEET_CREDENTIALS": os.getenv("GSHEET_CREDENTIALS"),
-    }
+def load_config() -> Config:
+    """Get the validated, typed configuration.
 
-    # Update config with non-None environment variables
-    config.update({k: v for k, v in env_vars.items() if v is not None})
+    Validation runs once per change of the underlying settings.
 
-    return config
+    Returns:
+        Config: The current settings
+
+    Raises:
+        ValueError: If the settings are invalid
+    """
+    loaded = _load()
+    if loaded.error is not None:
+        raise loaded.error
+    return loaded.config
 
 
 def save_config(config: Dict[str, Any]) -> None:
@@ -46,6 +242,7 @@ def save_config(config: Dict[str, Any]) -> None:
     """
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=2)
+    refresh_config()
 
 
 def get_data_dir() -> Path:
@@ -63,3 +260,68 @@ def get_data_dir() -> Path:
     user_data_dir = Path.home() / ".geoguessr_daily_tracker"
     user_data_dir.mkdir(exist_ok=True)
     return user_data_dir
+
+
+def get_accounts(config: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Get the per-account settings for multi-account tracking.
+
+    Accounts are listed under ``ACCOUNTS`` in the config file, each with a
+    ``name`` and its own ``NCFA_COOKIE``. Other keys (credentials, storage
+    backend) fall back to the top-level value, except GSHEET_ID: sheets
+    dedupe by date, so accounts sharing one would overwrite each other's
+    days. Accounts without a STORAGE_PATH get their own file under
+    ``accounts/<name>/`` in the data directory.
+
+    Args:
+        config (Dict[str, Any], optional): Configuration. Defaults to get_config().
+
+    Returns:
+        List[Dict[str, Any]]: One merged configuration per account
+
+    Raises:
+        ValueError: If an account is missing a name or cookie, a name is
+                    repeated or not usable as a directory name, or Sheets is
+                    enabled without a GSHEET_ID of the account's own
+    """
+    config = get_config() if config is None else config
+    defaults = {
+        k: v
+        for k, v in config.items()
+        if k not in ("ACCOUNTS", "STORAGE_PATH", "GSHEET_ID")
+    }
+
+    accounts = []
+    names = set()
+    sheets: Dict[str, str] = {}
+    for entry in config.get("ACCOUNTS", []):
+        name = entry.get("name")
+        if not name or name in (".", "..") or "/" in name or "\\" in name:
+            raise ValueError(f"Invalid account name: {name!r}")
+        if name in names:
+            raise ValueError(f"Duplicate account name: {name!r}")
+        if not entry.get("NCFA_COOKIE"):
+            raise ValueError(f"NCFA_COOKIE is required for account {name!r}")
+        names.add(name)
+
+        account = {**defaults, **entry}
+        if str(account.get("USE_GSHEETS", "")).lower() == "true":
+            sheet_id = account.get("GSHEET_ID")
+            if not sheet_id:
+                raise ValueError(f"GSHEET_ID is required for account {name!r}")
+            if sheet_id in sheets:
+                raise ValueError(
+                    f"Accounts {sheets[sheet_id]!r} and {name!r} share a GSHEET_ID"
+                )
+            sheets[sheet_id] = name
+
+        if not account.get("STORAGE_PATH"):
+            backend = (account.get("STORAGE_BACKEND") or "csv").lower()
+            filename = (
+                "daily_challenges.db" if backend == "sqlite" else "daily_challenges.csv"
+            )
+            account_dir = get_data_dir() / "accounts" / name
+            account_dir.mkdir(parents=True, exist_ok=True)
+            account["STORAGE_PATH"] = str(account_dir / filename)
+        accounts.append(account)
+
+    return accounts
@@ -0,0 +1,247 @@
+"""Spatial analytics over round locations and guesses.
+
+Requires the optional ``numpy`` dependency
+(``pip install geoguessr-daily-tracker[stats]``).
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .models import DailyChallengeGame
+
+EARTH_RADIUS_METERS = 6_371_008.8
+MAX_ROUND_SCORE = 5000
+COMPASS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
+def load_rounds(games: Iterable[DailyChallengeGame]) -> Dict[str, np.ndarray]:
+    """Convert the rounds that have coordinates into column arrays.
+
+    Args:
+        games (Iterable[DailyChallengeGame]): Games to convert
+
+    Returns:
+        Dict[str, np.ndarray]: ``dates`` (datetime64[D]), ``round_numbers``,
+        ``scores``, ``lat``, ``lng``, ``guess_lat``, ``guess_lng`` and
+        ``countries`` (empty string when unknown)
+    """
+    columns = {
+        name: []
+        for name in (
+            "dates",
+            "round_numbers",
+            "scores",
+            "lat",
+            "lng",
+            "guess_lat",
+            "guess_lng",
+            "countries",
+        )
+    }
+    # Only primitives are kept, so games can be streamed from storage
+    for game in games:
+        for r in game.rounds:
+            if None in (r.lat, r.lng, r.guessLat, r.guessLng):
+                continue
+            columns["dates"].append(game.date)
+            columns["round_numbers"].append(r.roundNumber)
+            columns["scores"].append(r.score)
+            columns["lat"].append(r.lat)
+            columns["lng"].append(r.lng)
+            columns["guess_lat"].append(r.guessLat)
+            columns["guess_lng"].append(r.guessLng)
+            columns["countries"].append((r.countryCode or "").lower())
+
+    return {
+        "dates": np.array(columns["dates"], dtype="datetime64[D]"),
+        "round_numbers": np.array(columns["round_numbers"], dtype=np.int64),
+        "scores": np.array(columns["scores"], dtype=np.int64),
+        "lat": np.array(columns["lat"], dtype=np.float64),
+        "lng": np.array(columns["lng"], dtype=np.float64),
+        "guess_lat": np.array(columns["guess_lat"], dtype=np.float64),
+        "guess_lng": np.array(columns["guess_lng"], dtype=np.float64),
+        "countries": np.array(columns["countries"], dtype=str),
+    }
+
+
+def haversine(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Great-circle distance in meters between arrays of points.
+
+    Args:
+        lat1, lng1, lat2, lng2 (array-like): Coordinates in degrees
+
+    Returns:
+        np.ndarray: Distances in meters
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def initial_bearing(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Initial bearing in degrees (0 = north, clockwise) from point 1 to 2.
+
+    Args:
+        lat1, lng1, lat2, lng2 (array-like): Coordinates in degrees
+
+    Returns:
+        np.ndarray: Bearings in [0, 360)
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    dlng = lng2 - lng1
+    x = np.sin(dlng) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlng)
+    return np.degrees(np.arctan2(x, y)) % 360
+
+
+def error_directions(rounds: Dict[str, np.ndarray]) -> Dict[str, int]:
+    """Count in which compass direction each guess missed the location.
+
+    Args:
+        rounds (Dict[str, np.ndarray]): Output of load_rounds
+
+    Returns:
+        Dict[str, int]: Rounds per compass sector, from the true location
+        towards the guess
+    """
+    bearings = initial_bearing(
+        rounds["lat"], rounds["lng"], rounds["guess_lat"], rounds["guess_lng"]
+    )
+    width = 360 / len(COMPASS)
+    sectors = ((bearings + width / 2) // width).astype(np.int64) % len(COMPASS)
+    counts = np.bincount(sectors, minlength=len(COMPASS))
+    return dict(zip(COMPASS, counts.tolist()))
+
+
+def grid_cells(lat, lng, cell_degrees: float) -> np.ndarray:
+    """Bucket coordinates into a regular lat/lng grid.
+
+    Cells are numbered row by row from the south-west corner, so cells
+    of one latitude band are consecutive.
+
+    Args:
+        lat, lng (array-like): Coordinates in degrees
+        cell_degrees (float): Cell size in degrees
+
+    Returns:
+        np.ndarray: Cell number of each point
+    """
+    columns = int(np.ceil(360 / cell_degrees))
+    rows = int(np.ceil(180 / cell_degrees))
+    row = np.clip(
+        ((np.asarray(lat) + 90) // cell_degrees).astype(np.int64), 0, rows - 1
+    )
+    column = ((np.asarray(lng) + 180) // cell_degrees).astype(np.int64) % columns
+    return row * columns + column
+
+
+def cell_origin(cell: int, cell_degrees: float) -> Tuple[float, float]:
+    """South-west corner (lat, lng) of a grid cell."""
+    columns = int(np.ceil(360 / cell_degrees))
+    row, column = divmod(int(cell), columns)
+    return row * cell_degrees - 90, column * cell_degrees - 180
+
+
+class SpatialIndex:
+    """Grid index over true round locations for fast box queries."""
+
+    def __init__(self, lat, lng, cell_degrees: float = 5.0):
+        """Build the index.
+
+        Args:
+            lat, lng (array-like): True locations in degrees
+            cell_degrees (float): Grid cell size in degrees
+        """
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lng = np.asarray(lng, dtype=np.float64)
+        self.cell_degrees = cell_degrees
+        self.columns = int(np.ceil(360 / cell_degrees))
+        cells = grid_cells(self.lat, self.lng, cell_degrees)
+        self.order = np.argsort(cells, kind="stable")
+        self.cells = cells[self.order]
+
+    def cell(self, cell: int) -> np.ndarray:
+        """Indices of the points in one grid cell."""
+        lo, hi = np.searchsorted(self.cells, [cell, cell + 1])
+        return self.order[lo:hi]
+
+    def query(
+        self, min_lat: float, max_lat: float, min_lng: float, max_lng: float
+    ) -> np.ndarray:
+        """Indices of the points inside a lat/lng box, in ascending order.
+
+        Only the grid rows the box touches are searched; within each row
+        the candidate cells are one contiguous range of the sorted index.
+        Boxes crossing the antimeridian are not supported.
+        """
+        size = self.cell_degrees
+        rows = int(np.ceil(180 / size))
+        first_row, last_row = np.clip(
+            (np.array([min_lat, max_lat]) + 90) // size, 0, rows - 1
+        ).astype(np.int64)
+        # Clipped rather than wrapped, so lng=180 stays in the last column
+        first_column, last_column = np.clip(
+            (np.array([min_lng, max_lng]) + 180) // size, 0, self.columns - 1
+        ).astype(np.int64)
+        row_starts = np.arange(first_row, last_row + 1) * self.columns
+        lo = np.searchsorted(self.cells, row_starts + first_column)
+        hi = np.searchsorted(self.cells, row_starts + last_column + 1)
+        candidates = np.concatenate(
+            [self.order[a:b] for a, b in zip(lo, hi)] or [self.order[:0]]
+        )
+        inside = (
+            (self.lat[candidates] >= min_lat)
+            & (self.lat[candidates] <= max_lat)
+            & (self.lng[candidates] >= min_lng)
+            & (self.lng[candidates] <= max_lng)
+        )
+        return np.sort(candidates[inside])
+
+
+def losses_by(keys: np.ndarray, scores: np.ndarray) -> List[Tuple]:
+    """Points lost per group, worst first.
+
+    Args:
+        keys (np.ndarray): Group of each round
+        scores (np.ndarray): Score of each round
+
+    Returns:
+        List[Tuple]: (key, rounds, average points lost, total points lost)
+    """
+    if not len(keys):
+        return []
+    groups, inverse = np.unique(keys, return_inverse=True)
+    lost = np.bincount(inverse, weights=MAX_ROUND_SCORE - scores)
+    counts = np.bincount(inverse)
+    order = np.argsort(-lost, kind="stable")
+    return [
+        (groups[i].item(), int(counts[i]), lost[i] / counts[i], int(lost[i]))
+        for i in order
+    ]
+
+
+def loss_by_country(rounds: Dict[str, np.ndarray]) -> List[Tuple]:
+    """Points lost per country of the true location, worst first.
+
+    Rounds without a known country are left out.
+    """
+    known = rounds["countries"] != ""
+    return losses_by(rounds["countries"][known], rounds["scores"][known])
+
+
+def loss_by_region(
+    rounds: Dict[str, np.ndarray], cell_degrees: float = 10.0
+) -> List[Tuple]:
+    """Points lost per grid cell of the true location, worst first.
+
+    Keys are the (lat, lng) south-west corners of the cells.
+    """
+    cells = grid_cells(rounds["lat"], rounds["lng"], cell_degrees)
+    return [
+        (cell_origin(cell, cell_degrees), *rest)
+        for cell, *rest in losses_by(cells, rounds["scores"])
+    ]
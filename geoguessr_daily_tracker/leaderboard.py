@@ -0,0 +1,261 @@
+"""Compact storage of daily challenge leaderboards."""
+
+import json
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_data_dir
+
+# Lists of the daily challenge response, stored as bit flags per entry
+SCOPES = ("leaderboard", "friends", "country")
+
+
+class PlayerTable:
+    """Interns player ids to small integers shared by every snapshot."""
+
+    def __init__(self, path: Path):
+        """Load the table from disk, or start empty.
+
+        Args:
+            path (Path): JSON file backing the table
+        """
+        self.path = path
+        self.ids: List[str] = []
+        self.nicks: List[str] = []
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.ids = data["ids"]
+            self.nicks = data["nicks"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+        self._index = {player_id: i for i, player_id in enumerate(self.ids)}
+
+    def intern(self, player_id: str, nick: str) -> int:
+        """Return the number for a player, adding them if new."""
+        index = self._index.get(player_id)
+        if index is None:
+            index = self._index[player_id] = len(self.ids)
+            self.ids.append(player_id)
+            self.nicks.append(nick)
+        else:
+            self.nicks[index] = nick
+        return index
+
+    def lookup(self, player_id: str) -> Optional[int]:
+        """Return the number for a known player, or None."""
+        return self._index.get(player_id)
+
+    def save(self) -> None:
+        """Persist the table."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"ids": self.ids, "nicks": self.nicks}, f)
+
+
+class LeaderboardSnapshot:
+    """One day's leaderboard entries as parallel arrays.
+
+    Entries appearing in several lists are stored once, with a bit per
+    list in ``scopes``. Rows are sorted by score so rank queries are a
+    bisect away.
+    """
+
+    # (attribute, array typecode)
+    COLUMNS = (
+        ("players", "I"),
+        ("scores", "i"),
+        ("distances", "d"),
+        ("times", "i"),
+        ("scopes", "B"),
+    )
+
+    def __init__(self, day: date, token: str, participants: int, columns=None):
+        self.date = day
+        self.token = token
+        self.participants = participants
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, (columns or {}).get(name, array(typecode)))
+        self._sorted_scores: Dict[str, array] = {}
+
+    @classmethod
+    def from_payload(
+        cls, payload: Dict[str, Any], players: PlayerTable
+    ) -> "LeaderboardSnapshot":
+        """Build a snapshot from a daily challenge response.
+
+        Args:
+            payload (dict): Decoded /challenges/daily-challenges/today response
+            players (PlayerTable): Table used to intern player ids
+
+        Returns:
+            LeaderboardSnapshot: The snapshot
+        """
+        entries: Dict[int, list] = {}
+        for bit, scope in enumerate(SCOPES):
+            for entry in payload.get(scope) or []:
+                player = players.intern(entry["id"], entry.get("nick", ""))
+                row = entries.get(player)
+                if row is None:
+                    entries[player] = [
+                        player,
+                        entry["totalScore"],
+                        entry["totalDistance"],
+                        entry["totalTime"],
+                        1 << bit,
+                    ]
+                else:
+                    row[4] |= 1 << bit
+
+        rows = sorted(entries.values(), key=lambda row: row[1])
+        columns = {
+            name: array(typecode, (row[i] for row in rows))
+            for i, (name, typecode) in enumerate(cls.COLUMNS)
+        }
+        day = datetime.fromisoformat(payload["date"].replace("Z", "+00:00")).date()
+        return cls(day, payload["token"], payload.get("participants", 0), columns)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compressed header plus raw column bytes."""
+        header = {
+            "date": self.date.isoformat(),
+            "token": self.token,
+            "participants": self.participants,
+            "count": len(self.players),
+            "byteorder": sys.byteorder,
+        }
+        body = b"".join(getattr(self, name).tobytes() for name, _ in self.COLUMNS)
+        return zlib.compress(json.dumps(header).encode() + b"\n" + body)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LeaderboardSnapshot":
+        """Deserialize a snapshot written by to_bytes."""
+        raw = zlib.decompress(data)
+        header_end = raw.index(b"\n")
+        header = json.loads(raw[:header_end])
+        offset = header_end + 1
+        columns = {}
+        for name, typecode in cls.COLUMNS:
+            column = array(typecode)
+            size = column.itemsize * header["count"]
+            column.frombytes(raw[offset : offset + size])
+            if header["byteorder"] != sys.byteorder:
+                column.byteswap()
+            columns[name] = column
+            offset += size
+        return cls(
+            date.fromisoformat(header["date"]),
+            header["token"],
+            header["participants"],
+            columns,
+        )
+
+    def sorted_scores(self, scope: str = "leaderboard") -> array:
+        """Scores of the entries in a list, in ascending order."""
+        if scope not in self._sorted_scores:
+            bit = 1 << SCOPES.index(scope)
+            # Rows are already sorted by score, so filtering keeps the order
+            self._sorted_scores[scope] = array(
+                "i",
+                (s for s, flags in zip(self.scores, self.scopes) if flags & bit),
+            )
+        return self._sorted_scores[scope]
+
+    def rank(self, score: int, scope: str = "leaderboard") -> int:
+        """1-based rank a score would have in a list (ties share a rank)."""
+        scores = self.sorted_scores(scope)
+        return len(scores) - bisect_right(scores, score) + 1
+
+    def list_percentile(self, score: int, scope: str = "leaderboard") -> float:
+        """Percentage of the listed entries that scored below ``score``.
+
+        The API only returns the top of each list, so this is relative to
+        the returned entries, not to every participant of the day.
+        """
+        scores = self.sorted_scores(scope)
+        if not scores:
+            return 0.0
+        return 100.0 * bisect_left(scores, score) / len(scores)
+
+
+class LeaderboardStore:
+    """Directory of daily snapshots sharing one player table."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        """Initialize the store.
+
+        Args:
+            directory (Path, optional): Store directory. Defaults to
+                                       ``leaderboards`` under the data dir.
+        """
+        self.directory = (
+            Path(directory) if directory else get_data_dir() / "leaderboards"
+        )
+        self.players = PlayerTable(self.directory / "players.json")
+
+    def _path(self, day: date) -> Path:
+        return self.directory / f"{day.isoformat()}.lb"
+
+    def save(self, payload: Dict[str, Any]) -> LeaderboardSnapshot:
+        """Store the leaderboards of a daily challenge response.
+
+        A later snapshot of the same day replaces the earlier one.
+
+        Args:
+            payload (dict): Decoded /challenges/daily-challenges/today response
+
+        Returns:
+            LeaderboardSnapshot: The stored snapshot
+        """
+        snapshot = LeaderboardSnapshot.from_payload(payload, self.players)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.players.save()
+        with open(self._path(snapshot.date), "wb") as f:
+            f.write(snapshot.to_bytes())
+        return snapshot
+
+    def load(self, day: date) -> Optional[LeaderboardSnapshot]:
+        """Load the snapshot of a day, or None if there is none."""
+        try:
+            with open(self._path(day), "rb") as f:
+                return LeaderboardSnapshot.from_bytes(f.read())
+        except FileNotFoundError:
+            return None
+
+    def dates(self) -> List[date]:
+        """Dates with a stored snapshot, in order."""
+        return sorted(date.fromisoformat(p.stem) for p in self.directory.glob("*.lb"))
+
+    def rank_history(
+        self, scores: Dict[date, int], scope: str = "leaderboard"
+    ) -> List[Tuple[date, int, float, int, int]]:
+        """Rank and list percentile of your scores on every stored day.
+
+        Args:
+            scores (Dict[date, int]): Your total score per day
+            scope (str): Which list to rank against
+
+        Returns:
+            List[Tuple]: (date, rank, list percentile, entries, participants)
+                         for each day with both a score and a snapshot
+        """
+        history = []
+        for day in self.dates():
+            if day not in scores:
+                continue
+            snapshot = self.load(day)
+            history.append(
+                (
+                    day,
+                    snapshot.rank(scores[day], scope),
+                    snapshot.list_percentile(scores[day], scope),
+                    len(snapshot.sorted_scores(scope)),
+                    snapshot.participants,
+                )
+            )
+        return history
@@ -54,6 +54,12 @@ class Round(BaseModel):
     score: int
     distance: float
     roundNumber: int
+    # True location, guess and the location's country, when known
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    guessLat: Optional[float] = None
+    guessLng: Optional[float] = None
+    countryCode: Optional[str] = None
 
 
 class DailyChallengeGame(BaseModel):
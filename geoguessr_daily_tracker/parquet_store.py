@@ -0,0 +1,177 @@
+"""Columnar Parquet copy of the game history for analytics.
+
+Requires the optional ``pyarrow`` dependency
+(``pip install geoguessr-daily-tracker[parquet]``).
+"""
+
+import uuid
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .config import get_data_dir
+from .models import DailyChallengeGame
+
+ROUNDS = 5
+
+SCHEMA = pa.schema(
+    [
+        ("date", pa.date32()),
+        ("token", pa.string()),
+        ("total_score", pa.int32()),
+        ("total_distance", pa.float64()),
+    ]
+    + [
+        field
+        for number in range(1, ROUNDS + 1)
+        for field in (
+            (f"round{number}_score", pa.int32()),
+            (f"round{number}_distance", pa.float64()),
+        )
+    ]
+)
+
+
+class ParquetHistory:
+    """Game history stored as Parquet files partitioned by year.
+
+    Each append writes new files under ``year=YYYY/``; once a year has
+    more than MAX_PARTS files they are compacted into one.
+    """
+
+    MAX_PARTS = 32
+    CHUNK_ROWS = 10_000
+
+    def __init__(self, directory: Optional[Path] = None):
+        """Initialize the store.
+
+        Args:
+            directory (Path, optional): Root directory. Defaults to
+                                       ``history`` under the data dir.
+        """
+        self.directory = Path(directory) if directory else get_data_dir() / "history"
+
+    def _dataset(self) -> Optional[ds.Dataset]:
+        if not any(self.directory.glob("year=*/*.parquet")):
+            return None
+        return ds.dataset(
+            self.directory,
+            schema=SCHEMA.append(pa.field("year", pa.int32())),
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([("year", pa.int32())]), flavor="hive"
+            ),
+        )
+
+    def append(self, games: Iterable[DailyChallengeGame]) -> int:
+        """Append games whose date is not stored yet.
+
+        Games are consumed lazily and written in chunks of CHUNK_ROWS, so
+        a large history can be streamed in.
+
+        Args:
+            games (Iterable[DailyChallengeGame]): Games to add
+
+        Returns:
+            int: Number of games written
+        """
+        existing = set(self.read(columns=["date"]).column("date").to_pylist())
+        pending = {}
+        written = 0
+        for game in games:
+            if game.date not in existing:
+                existing.add(game.date)
+                pending[game.date] = game
+                if len(pending) >= self.CHUNK_ROWS:
+                    written += self._write(pending)
+                    pending = {}
+        return written + self._write(pending)
+
+    def _write(self, games_by_date: dict) -> int:
+        """Write one file per year for a chunk of new games."""
+        ordered = [games_by_date[key] for key in sorted(games_by_date)]
+        for year, year_games in groupby(ordered, key=lambda game: game.date.year):
+            partition = self.directory / f"year={year}"
+            partition.mkdir(parents=True, exist_ok=True)
+            pq.write_table(
+                self._to_table(list(year_games)),
+                partition / f"part-{uuid.uuid4().hex}.parquet",
+            )
+            if len(list(partition.glob("*.parquet"))) > self.MAX_PARTS:
+                self._compact(partition)
+
+        return len(ordered)
+
+    @staticmethod
+    def _to_table(games: List[DailyChallengeGame]) -> pa.Table:
+        columns = {
+            "date": [game.date for game in games],
+            "token": [game.token for game in games],
+            "total_score": [game.totalScore for game in games],
+            "total_distance": [game.totalDistance for game in games],
+        }
+        for number in range(1, ROUNDS + 1):
+            by_number = [
+                {r.roundNumber: r for r in game.rounds}.get(number) for game in games
+            ]
+            columns[f"round{number}_score"] = [r and r.score for r in by_number]
+            columns[f"round{number}_distance"] = [r and r.distance for r in by_number]
+        return pa.table(columns, schema=SCHEMA)
+
+    def _compact(self, partition: Path) -> None:
+        """Rewrite all files of a partition into a single sorted file."""
+        parts = sorted(partition.glob("*.parquet"))
+        table = pa.concat_tables(pq.read_table(part, schema=SCHEMA) for part in parts)
+        target = partition / f"part-{uuid.uuid4().hex}.parquet"
+        pq.write_table(table.sort_by("date"), target)
+        for part in parts:
+            part.unlink()
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> pa.Table:
+        """Read the history, loading only the requested columns.
+
+        Args:
+            columns (List[str], optional): Columns to load. Defaults to all.
+            start (date, optional): First date to include
+            end (date, optional): Last date to include
+
+        Returns:
+            pa.Table: Matching rows sorted by date
+        """
+        dataset = self._dataset()
+        if dataset is None:
+            schema = (
+                SCHEMA
+                if columns is None
+                else pa.schema([SCHEMA.field(name) for name in columns])
+            )
+            return schema.empty_table()
+
+        condition = None
+        if start is not None:
+            condition = ds.field("date") >= start
+        if end is not None:
+            upper = ds.field("date") <= end
+            condition = upper if condition is None else condition & upper
+
+        # Partition pruning on year keeps range reads from opening every file
+        if start is not None or end is not None:
+            years = ds.field("year") >= (start.year if start else 0)
+            if end is not None:
+                years = years & (ds.field("year") <= end.year)
+            condition = condition & years
+
+        needed = list(columns) if columns is not None else SCHEMA.names
+        load = needed if "date" in needed else needed + ["date"]
+        table = dataset.to_table(columns=load, filter=condition).sort_by("date")
+        return table.select(needed)
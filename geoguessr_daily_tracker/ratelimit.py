@@ -0,0 +1,267 @@
+"""Client-side rate limiting for GeoGuessr API requests.
+
+One RateLimiter can be shared by every thread and asyncio task of a
+process, and optionally by several processes through a lock file.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .config import DEFAULT_RATE, Config, load_config
+from .metrics import metrics
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class RateLimiter:
+    """Per-endpoint token bucket that adapts to 429 responses.
+
+    Scheduling follows the generic cell rate algorithm: each endpoint
+    keeps the time its next request is due, and callers reserve a slot
+    under a short lock before sleeping outside it, so blocked threads
+    and tasks never hold the lock. A 429 halves the endpoint's rate and
+    blocks it until any ``Retry-After`` has passed; every success then
+    wins back a fraction of the configured rate.
+
+    With ``lock_file`` the schedule is kept in that file under an
+    exclusive ``flock`` so concurrent processes share one budget.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        endpoint_rates: Optional[Dict[str, float]] = None,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        recovery: float = 0.05,
+        lock_file=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rate (float): Requests per second for endpoints without their own rate
+            endpoint_rates (Dict[str, float], optional): Requests per second
+                                   keyed by endpoint name ("game", "daily_challenge")
+            burst (int): Requests that may be sent back to back
+            min_rate (float, optional): Lowest rate 429s can push an endpoint
+                                   to. Defaults to 1/16 of its configured rate.
+            recovery (float): Fraction of the configured rate regained per
+                              successful request after a 429
+            lock_file (str or Path, optional): File shared between processes
+            clock (Callable): Wall-clock time source; wall time is used so
+                              the schedule is comparable across processes
+
+        Raises:
+            ValueError: If a rate is not positive, or a lock file is requested
+                        on a platform without ``fcntl``
+        """
+        self.rate = rate
+        self.endpoint_rates = dict(endpoint_rates or {})
+        if min(self.endpoint_rates.values(), default=rate) <= 0 or rate <= 0:
+            raise ValueError("Rate limits must be positive")
+        if lock_file is not None and fcntl is None:
+            raise ValueError("A rate limit lock file needs fcntl (POSIX only)")
+
+        self.burst = max(1, burst)
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self.lock_file = Path(lock_file) if lock_file is not None else None
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._states: Dict[str, dict] = {}
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Dict[str, Any]] = None
+    ) -> Optional["RateLimiter"]:
+        """Build a limiter from the RATE_LIMIT and RATE_LIMIT_LOCK settings.
+
+        RATE_LIMIT is either a number of requests per second, a mapping
+        of endpoint to rate, or a string such as ``"2,game=5"``.
+
+        Args:
+            config (Dict[str, Any], optional): Configuration. Defaults to the
+                                   cached settings from load_config().
+
+        Returns:
+            RateLimiter: The limiter, or None if RATE_LIMIT is not set
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        settings = load_config() if config is None else Config.from_dict(config)
+        if settings.rate_limit is None:
+            return None
+        return cls(
+            settings.rate_limit.rate,
+            dict(settings.rate_limit.endpoint_rates),
+            lock_file=settings.rate_limit_lock,
+        )
+
+    def max_rate(self, endpoint: str) -> float:
+        """Configured requests per second for an endpoint."""
+        return self.endpoint_rates.get(endpoint, self.rate)
+
+    def current_rate(self, endpoint: str) -> float:
+        """Requests per second currently allowed after adaptation."""
+        return self._update(endpoint, lambda state, now: state["rate"])
+
+    def _update(self, endpoint: str, change: Callable[[dict, float], Any]) -> Any:
+        """Apply ``change(state, now)`` to an endpoint's state atomically."""
+        with self._lock:
+            if self.lock_file is None:
+                state = self._states.get(endpoint)
+                if state is None:
+                    state = self._states[endpoint] = self._new_state(endpoint)
+                return change(state, self.clock())
+
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        states = json.loads(f.read() or "{}")
+                    except json.JSONDecodeError:
+                        states = {}
+                    state = states.get(endpoint) or self._new_state(endpoint)
+                    result = change(state, self.clock())
+                    states[endpoint] = state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(states))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            return result
+
+    def _new_state(self, endpoint: str) -> dict:
+        return {"rate": self.max_rate(endpoint), "due": 0.0, "blocked_until": 0.0}
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve the next request slot for an endpoint.
+
+        Args:
+            endpoint (str): Endpoint name
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+
+        def change(state, now):
+            # Another process may have been configured with a higher rate
+            rate = min(state["rate"], self.max_rate(endpoint))
+            interval = 1.0 / rate
+            due = max(state["due"], now, state["blocked_until"])
+            state["due"] = due + interval
+            return max(
+                due - now - (self.burst - 1) * interval,
+                state["blocked_until"] - now,
+                0.0,
+            )
+
+        wait = self._update(endpoint, change)
+        if wait:
+            metrics.observe("rate_limit_wait_seconds", wait, endpoint=endpoint)
+        return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """Block the calling thread until a request may be sent.
+
+        Args:
+            endpoint (str): Endpoint name
+
+        Returns:
+            float: Seconds waited
+        """
+        wait = self.reserve(endpoint)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def _off_loop(self, fn: Callable, *args) -> Any:
+        # With a lock file every update takes an flock and reads and writes
+        # the file, which must not stall the event loop
+        if self.lock_file is None:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """Wait, without blocking the event loop, until a request may be sent.
+
+        Args:
+            endpoint (str): Endpoint name
+
+        Returns:
+            float: Seconds waited
+        """
+        wait = await self._off_loop(self.reserve, endpoint)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def record_response_async(
+        self, endpoint: str, status: int, retry_after: Optional[float] = None
+    ) -> None:
+        """Adapt to the status of a response without blocking the event loop.
+
+        Args:
+            endpoint (str): Endpoint name
+            status (int): HTTP status code
+            retry_after (float, optional): Seconds from the Retry-After header
+        """
+        await self._off_loop(self.record_response, endpoint, status, retry_after)
+
+    def record_response(
+        self, endpoint: str, status: int, retry_after: Optional[float] = None
+    ) -> None:
+        """Adapt to the status of a response.
+
+        Args:
+            endpoint (str): Endpoint name
+            status (int): HTTP status code
+            retry_after (float, optional): Seconds from the Retry-After header
+        """
+        if status == 429:
+            self.throttled(endpoint, retry_after)
+        elif status < 400:
+            self.succeeded(endpoint)
+
+    def throttled(self, endpoint: str, retry_after: Optional[float] = None) -> None:
+        """Slow an endpoint down after a 429 response.
+
+        Args:
+            endpoint (str): Endpoint name
+            retry_after (float, optional): Seconds from the Retry-After header
+        """
+        floor = self.min_rate or self.max_rate(endpoint) / 16
+
+        def change(state, now):
+            state["rate"] = max(floor, state["rate"] / 2)
+            if retry_after:
+                state["blocked_until"] = max(state["blocked_until"], now + retry_after)
+
+        self._update(endpoint, change)
+        metrics.inc("rate_limit_throttled_total", endpoint=endpoint)
+
+    def succeeded(self, endpoint: str) -> None:
+        """Recover part of an endpoint's rate after a successful request.
+
+        Args:
+            endpoint (str): Endpoint name
+        """
+        ceiling = self.max_rate(endpoint)
+
+        def change(state, now):
+            if state["rate"] < ceiling:
+                state["rate"] = min(ceiling, state["rate"] + ceiling * self.recovery)
+
+        self._update(endpoint, change)
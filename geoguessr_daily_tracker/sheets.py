@@ -1,18 +1,102 @@
 """Google Sheets integration for GeoGuessr Tracker."""
 
-from typing import List
+import hashlib
+import json
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from .config import get_data_dir, load_config
+from .metrics import metrics
+from .models import DailyChallengeGame, Round
 
-from .config import get_config
-from .models import DailyChallengeGame
+
+class SheetMirror:
+    """Local copy of the sheet's date column and the row each date is on.
+
+    The mirror is persisted as JSON so later runs only need to read rows
+    added since the previous one.
+    """
+
+    def __init__(self, path: Path):
+        """Load the mirror from disk, or start empty.
+
+        Args:
+            path (Path): JSON file backing the mirror
+        """
+        self.path = path
+        self.reset()
+        self.validated_at = 0.0
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.rows = data["rows"]
+            self.row_count = data["row_count"]
+            self.validated_at = data["validated_at"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+    def reset(self) -> None:
+        """Forget all known rows."""
+        self.rows: Dict[str, int] = {}
+        # Last row number seen, including the header row
+        self.row_count = 1
+
+    def extend(self, first_row: int, values: List[list]) -> None:
+        """Record date values read starting at a given row number.
+
+        Args:
+            first_row (int): Sheet row number of ``values[0]``
+            values (List[list]): Rows as returned by values().get
+        """
+        for offset, row in enumerate(values):
+            if row and row[0]:
+                self.rows[row[0]] = first_row + offset
+        self.row_count = max(self.row_count, first_row + len(values) - 1)
+
+    def save(self) -> None:
+        """Persist the mirror."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "rows": self.rows,
+                    "row_count": self.row_count,
+                    "validated_at": self.validated_at,
+                },
+                f,
+            )
 
 
 class GoogleSheetsWriter:
     """Class to handle writing game data to Google Sheets."""
 
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+    # Total score needed for a gold/silver highlight
+    GOLD_THRESHOLD = 22500
+    SILVER_THRESHOLD = 20000
+    # Rows per values().append call, well under the API request size limit
+    APPEND_CHUNK_ROWS = 1000
+    # How often the mirror re-reads the whole date column
+    FULL_REFRESH_SECONDS = 24 * 60 * 60
+    HEADERS = [
+        "Date",
+        "Total Score",
+        "Round 1 Score",
+        "Round 1 Distance",
+        "Round 2 Score",
+        "Round 2 Distance",
+        "Round 3 Score",
+        "Round 3 Distance",
+        "Round 4 Score",
+        "Round 4 Distance",
+        "Round 5 Score",
+        "Round 5 Distance",
+        "Total Distance",
+        "Link",
+    ]
 
     def __init__(self, spreadsheet_id=None, credentials_path=None):
         """Initialize the Google Sheets writer.
@@ -21,37 +105,59 @@ class GoogleSheetsWriter:
             spreadsheet_id (str, optional): Google Sheets ID
             credentials_path (str, optional): Path to service account credentials
         """
-        config = get_config()
-        self.spreadsheet_id = spreadsheet_id or config.get("GSHEET_ID")
-        credentials_path = credentials_path or config.get("GSHEET_CREDENTIALS")
+        config = load_config()
+        self.spreadsheet_id = spreadsheet_id or config.gsheet_id
+        credentials_path = credentials_path or config.gsheet_credentials
 
         if not self.spreadsheet_id or not credentials_path:
             raise ValueError("GSHEET_ID and GSHEET_CREDENTIALS are required")
 
+        # Imported here because the Google client libraries are slow to load
+        from google.oauth2.service_account import Credentials
+        from googleapiclient.discovery import build
+
         self.credentials = Credentials.from_service_account_file(
             credentials_path, scopes=self.SCOPES
         )
         self.service = build("sheets", "v4", credentials=self.credentials)
-        self.GOLD_THRESHOLD = 22500
-        self.SILVER_THRESHOLD = 20000
+        self.layout_file = get_data_dir() / "sheet_layout.json"
+        self.mirror = SheetMirror(
+            get_data_dir() / "sheet_mirror" / f"{self.spreadsheet_id}.json"
+        )
 
     def _get_existing_dates(self) -> List[str]:
         """Get list of dates already in the spreadsheet.
 
+        Dates come from the local mirror, which is brought up to date with
+        an incremental read of any rows added since the last refresh.
+
         Returns:
             List[str]: List of date strings in YYYY-MM-DD format
         """
-        result = (
-            self.service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self.spreadsheet_id, range="A2:A")
-            .execute()
-        )
+        self.refresh_mirror()
+        return list(self.mirror.rows)
 
-        if "values" not in result:
-            return []
+    def refresh_mirror(self, full: bool = False) -> None:
+        """Bring the local mirror of the date column up to date.
 
-        return [row[0] for row in result.get("values", [])]
+        Only rows past the last known row are read, unless a full
+        revalidation is requested or FULL_REFRESH_SECONDS have passed
+        since the last one.
+
+        Args:
+            full (bool): Re-read the whole date column
+        """
+        mirror = self.mirror
+        if full or time.time() - mirror.validated_at > self.FULL_REFRESH_SECONDS:
+            result = self._get_sheet_values("A2:A")
+            mirror.reset()
+            mirror.extend(2, result.get("values", []))
+            mirror.validated_at = time.time()
+        else:
+            first_row = mirror.row_count + 1
+            result = self._get_sheet_values(f"A{first_row}:A")
+            mirror.extend(first_row, result.get("values", []))
+        mirror.save()
 
     def _get_sheet_values(self, range_name):
         """Get values from the sheet.
@@ -62,31 +168,37 @@ class GoogleSheetsWriter:
         Returns:
             dict: API response with values
         """
-        return (
+        return self._execute(
             self.service.spreadsheets()
             .values()
-            .get(spreadsheetId=self.spreadsheet_id, range=range_name)
-            .execute()
+            .get(spreadsheetId=self.spreadsheet_id, range=range_name),
+            "values.get",
         )
 
-    def format_sheet(self):
-        """Apply all sheet formatting including headers, colors, column widths and number formats."""
-        headers = [
-            "Date",
-            "Total Score",
-            "Round 1 Score",
-            "Round 1 Distance",
-            "Round 2 Score",
-            "Round 2 Distance",
-            "Round 3 Score",
-            "Round 3 Distance",
-            "Round 4 Score",
-            "Round 4 Distance",
-            "Round 5 Score",
-            "Round 5 Distance",
-            "Total Distance",
-            "Link",
-        ]
+    def _execute(self, request, call: str) -> dict:
+        """Execute a prepared API request, recording its latency.
+
+        Args:
+            request: Request object returned by the service
+            call (str): Metric label naming the API method
+
+        Returns:
+            dict: API response
+        """
+        with metrics.timer("sheets_api_request_seconds", call=call):
+            return request.execute()
+
+    def _build_format_requests(self, write_headers: bool) -> List[dict]:
+        """Build the batchUpdate requests that lay out and format the sheet.
+
+        Args:
+            write_headers (bool): Whether to (re)write the header row values
+                                  or only apply formatting to it
+
+        Returns:
+            List[dict]: Sheets API batchUpdate requests
+        """
+        headers = self.HEADERS
 
         requests = []
 
@@ -105,12 +217,8 @@ class GoogleSheetsWriter:
             }
         )
 
-        # Get current values in first row
-        result = self._get_sheet_values("A1:N1")
-        first_row = result.get("values", [[]])[0] if "values" in result else []
-
         # Only update headers if they're missing or different
-        if not first_row or first_row != headers:
+        if write_headers:
             requests.append(
                 {
                     "updateCells": {
@@ -391,20 +499,98 @@ class GoogleSheetsWriter:
             ]
         )
 
-        # Apply all formatting
-        self.service.spreadsheets().batchUpdate(
-            spreadsheetId=self.spreadsheet_id, body={"requests": requests}
-        ).execute()
+        return requests
 
-    def save_game(self, game: DailyChallengeGame):
-        """Save game results to the spreadsheet.
+    def _layout_fingerprint(self) -> str:
+        """Hash of everything that determines the sheet layout."""
+        layout = json.dumps(
+            self._build_format_requests(write_headers=True), sort_keys=True
+        )
+        return hashlib.sha256(layout.encode()).hexdigest()
+
+    def _load_layout_fingerprints(self) -> Dict[str, str]:
+        try:
+            with open(self.layout_file, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _is_managed_rule(self, rule: dict) -> bool:
+        """Whether a conditional format rule is one added by format_sheet."""
+        # The API omits sheetId when it is 0, so compare with defaults filled in
+        ranges = [{"sheetId": 0, **r} for r in rule.get("ranges", [])]
+        return ranges == [{"sheetId": 0, "startColumnIndex": 1, "endColumnIndex": 2}]
+
+    def format_sheet(self, force: bool = False) -> bool:
+        """Apply all sheet formatting including headers, colors, column widths and number formats.
+
+        Formatting is skipped when the layout fingerprint matches the one
+        recorded the last time this spreadsheet was formatted. Previously
+        added score rules are replaced instead of piling up.
 
         Args:
-            game (DailyChallengeGame): Game data to save
+            force (bool): Reformat even if the layout has not changed
+
+        Returns:
+            bool: True if formatting was applied
         """
-        # Apply formatting first
-        self.format_sheet()
+        fingerprint = self._layout_fingerprint()
+        fingerprints = self._load_layout_fingerprints()
+        if not force and fingerprints.get(self.spreadsheet_id) == fingerprint:
+            return False
+
+        # Read the header row and existing conditional rules in one call
+        result = self._execute(
+            self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=["A1:N1"],
+                fields=(
+                    "sheets(properties.sheetId,conditionalFormats,"
+                    "data.rowData.values.formattedValue)"
+                ),
+            ),
+            "get",
+        )
+        sheet = next(
+            (
+                sheet
+                for sheet in result.get("sheets", [])
+                if sheet.get("properties", {}).get("sheetId", 0) == 0
+            ),
+            {},
+        )
+        row_data = (sheet.get("data") or [{}])[0].get("rowData") or [{}]
+        first_row = [v.get("formattedValue") for v in row_data[0].get("values", [])]
+
+        # Delete from the end so earlier indexes stay valid
+        requests = [
+            {"deleteConditionalFormatRule": {"sheetId": 0, "index": index}}
+            for index, rule in reversed(
+                list(enumerate(sheet.get("conditionalFormats", [])))
+            )
+            if self._is_managed_rule(rule)
+        ]
+        requests.extend(
+            self._build_format_requests(write_headers=first_row != self.HEADERS)
+        )
 
+        # Apply all formatting
+        self._execute(
+            self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id, body={"requests": requests}
+            ),
+            "batchUpdate",
+        )
+
+        fingerprints[self.spreadsheet_id] = fingerprint
+        self.layout_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.layout_file, "w") as f:
+            json.dump(fingerprints, f, indent=2)
+        return True
+
+    @staticmethod
+    def _game_to_row(game: DailyChallengeGame) -> list:
+        """Build the sheet row for a game, in HEADERS order."""
         row_data = [game.date.strftime("%Y-%m-%d"), game.totalScore]
 
         for round in game.rounds:
@@ -413,6 +599,38 @@ class GoogleSheetsWriter:
         # Add total distance and link with hyperlink formula
         link_url = f"https://www.geoguessr.com/results/{game.token}"
         row_data.extend([game.totalDistance, link_url])
+        return row_data
+
+    def _append_rows(self, rows: List[list]) -> None:
+        """Append rows after the last row of the table in one request."""
+        result = self._execute(
+            self.service.spreadsheets()
+            .values()
+            .append(
+                spreadsheetId=self.spreadsheet_id,
+                range="A1",
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": rows},
+            ),
+            "values.append",
+        )
+
+        # Record where the rows landed, e.g. "Sheet1!A5:N7"
+        updated_range = result.get("updates", {}).get("updatedRange", "")
+        match = re.search(r"![A-Z]+(\d+)", updated_range)
+        if match and int(match.group(1)) == self.mirror.row_count + 1:
+            self.mirror.extend(int(match.group(1)), [row[:1] for row in rows])
+            self.mirror.save()
+
+    def save_game(self, game: DailyChallengeGame):
+        """Save game results to the spreadsheet.
+
+        Args:
+            game (DailyChallengeGame): Game data to save
+        """
+        # Apply formatting first
+        self.format_sheet()
 
         existing_dates = self._get_existing_dates()
         if game.date.strftime("%Y-%m-%d") in existing_dates:
@@ -421,14 +639,177 @@ class GoogleSheetsWriter:
             )
             return
 
-        self.service.spreadsheets().values().append(
-            spreadsheetId=self.spreadsheet_id,
-            range="A1",
-            valueInputOption="RAW",
-            insertDataOption="INSERT_ROWS",
-            body={"values": [row_data]},
-        ).execute()
+        self._append_rows([self._game_to_row(game)])
 
         print(
             f"Added new entry for {game.date.strftime('%Y-%m-%d')} to the spreadsheet"
         )
+
+    def save_games(
+        self, games: Iterable[DailyChallengeGame]
+    ) -> List[DailyChallengeGame]:
+        """Save many games, appending all missing dates in date order.
+
+        Existing dates are fetched once and rows are written with as few
+        append calls as the request size limit allows.
+
+        Args:
+            games (Iterable[DailyChallengeGame]): Games to save
+
+        Returns:
+            List[DailyChallengeGame]: The games that were actually added
+        """
+        self.format_sheet()
+
+        seen = set(self._get_existing_dates())
+        added = []
+        for game in sorted(games, key=lambda g: g.date):
+            date_str = game.date.strftime("%Y-%m-%d")
+            if date_str not in seen:
+                seen.add(date_str)
+                added.append(game)
+
+        rows = [self._game_to_row(game) for game in added]
+        for start in range(0, len(rows), self.APPEND_CHUNK_ROWS):
+            self._append_rows(rows[start : start + self.APPEND_CHUNK_ROWS])
+
+        print(f"Added {len(added)} new entries to the spreadsheet")
+        return added
+
+    @staticmethod
+    def _cell_key(value):
+        """Normalize a cell so sheet values compare equal to local ones."""
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                return value.strip()
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return round(float(value), 6)
+        return value
+
+    @classmethod
+    def _row_key(cls, row: list) -> tuple:
+        """Comparable form of a row, ignoring trailing empty cells."""
+        keys = [cls._cell_key(value) for value in row]
+        while keys and keys[-1] in ("", None):
+            keys.pop()
+        return tuple(keys)
+
+    def row_to_game(self, row: list) -> DailyChallengeGame:
+        """Rebuild a game from a sheet row written by _game_to_row.
+
+        Raises:
+            ValueError: If the row is not a complete game row
+        """
+        if len(row) != len(self.HEADERS):
+            raise ValueError(f"expected {len(self.HEADERS)} cells, got {len(row)}")
+        pairs = row[2:-2]
+        rounds = [
+            Round(score=int(pairs[i]), distance=float(pairs[i + 1]), roundNumber=n)
+            for n, i in enumerate(range(0, len(pairs), 2), start=1)
+        ]
+        return DailyChallengeGame(
+            token=str(row[-1]).rstrip("/").rsplit("/", 1)[-1],
+            totalScore=int(row[1]),
+            totalDistance=float(row[-2]),
+            rounds=rounds,
+            date=datetime.strptime(str(row[0]), "%Y-%m-%d").date(),
+        )
+
+    def sync_games(
+        self, games: Iterable[DailyChallengeGame]
+    ) -> Tuple[List[DailyChallengeGame], List[DailyChallengeGame], list]:
+        """Make the sheet match the given games with a minimal diff.
+
+        The whole table is read once. Rows whose values differ from the
+        local game are overwritten, and missing dates are written in date
+        order after the last row read, all in a single
+        values().batchUpdate, so a sync costs one read and at most one
+        write however long the history is.
+
+        Args:
+            games (Iterable[DailyChallengeGame]): Games from the local store
+
+        Returns:
+            Tuple: (games appended, games updated, rows only in the sheet)
+        """
+        self.format_sheet()
+
+        last_column = chr(ord("A") + len(self.HEADERS) - 1)
+        result = self._execute(
+            self.service.spreadsheets()
+            .values()
+            .get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"A2:{last_column}",
+                valueRenderOption="UNFORMATTED_VALUE",
+            ),
+            "values.get",
+        )
+        values = result.get("values", [])
+
+        # The full read doubles as a mirror revalidation
+        self.mirror.reset()
+        self.mirror.extend(2, [row[:1] for row in values])
+        self.mirror.validated_at = time.time()
+        self.mirror.save()
+
+        sheet_rows = {}
+        for offset, row in enumerate(values):
+            if row and row[0] and str(row[0]) not in sheet_rows:
+                sheet_rows[str(row[0])] = (offset + 2, row)
+
+        added, updated, data = [], [], []
+        local_dates = set()
+        for game in sorted(games, key=lambda g: g.date):
+            date_str = game.date.strftime("%Y-%m-%d")
+            if date_str in local_dates:
+                continue
+            local_dates.add(date_str)
+            row = self._game_to_row(game)
+            if date_str not in sheet_rows:
+                added.append(game)
+                continue
+            row_number, sheet_row = sheet_rows[date_str]
+            if self._row_key(row) != self._row_key(sheet_row):
+                updated.append(game)
+                data.append(
+                    {
+                        "range": f"A{row_number}:{last_column}{row_number}",
+                        "values": [row],
+                    }
+                )
+
+        # The table was just read, so the next free row is known
+        rows = [self._game_to_row(game) for game in added]
+        first_row = len(values) + 2
+        if rows:
+            last_row = first_row + len(rows) - 1
+            data.append(
+                {
+                    "range": f"A{first_row}:{last_column}{last_row}",
+                    "values": rows,
+                }
+            )
+
+        if data:
+            self._execute(
+                self.service.spreadsheets()
+                .values()
+                .batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={"valueInputOption": "RAW", "data": data},
+                ),
+                "values.batchUpdate",
+            )
+        if rows:
+            self.mirror.extend(first_row, [row[:1] for row in rows])
+            self.mirror.save()
+
+        sheet_only = [
+            row
+            for date_str, (_, row) in sheet_rows.items()
+            if date_str not in local_dates
+        ]
+        return added, updated, sheet_only
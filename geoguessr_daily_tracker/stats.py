@@ -0,0 +1,184 @@
+"""Vectorized statistics over the game history.
+
+Requires the optional ``numpy`` dependency
+(``pip install geoguessr-daily-tracker[stats]``).
+"""
+
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from .models import DailyChallengeGame
+from .sheets import GoogleSheetsWriter
+
+ROUNDS = 5
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def load_arrays(games: Iterable[DailyChallengeGame]) -> Dict[str, np.ndarray]:
+    """Convert games into column arrays sorted by date.
+
+    Args:
+        games (Iterable[DailyChallengeGame]): Games to convert
+
+    Returns:
+        Dict[str, np.ndarray]: ``dates`` (datetime64[D]), ``totals``,
+        ``distances`` and ``round_scores`` (n x 5, NaN where a round is
+        missing)
+    """
+    dates = []
+    totals = []
+    distances = []
+    scores = []
+    # Only primitives are kept, so games can be streamed from storage
+    for game in games:
+        dates.append(game.date)
+        totals.append(game.totalScore)
+        distances.append(game.totalDistance)
+        row = [np.nan] * ROUNDS
+        for r in game.rounds:
+            if 1 <= r.roundNumber <= ROUNDS:
+                row[r.roundNumber - 1] = r.score
+        scores.append(row)
+
+    dates = np.array(dates, dtype="datetime64[D]")
+    totals = np.array(totals, dtype=np.int64)
+    distances = np.array(distances, dtype=np.float64)
+    round_scores = np.array(scores, dtype=np.float64).reshape(-1, ROUNDS)
+
+    order = np.argsort(dates, kind="stable")
+    return {
+        "dates": dates[order],
+        "totals": totals[order],
+        "distances": distances[order],
+        "round_scores": round_scores[order],
+    }
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of every ``window`` consecutive values.
+
+    Args:
+        values (np.ndarray): 1-D values
+        window (int): Window length
+
+    Returns:
+        np.ndarray: ``len(values) - window + 1`` means (empty if too short)
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if len(values) < window:
+        return np.empty(0)
+    sums = np.cumsum(np.concatenate(([0.0], values.astype(np.float64))))
+    return (sums[window:] - sums[:-window]) / window
+
+
+def round_percentiles(
+    round_scores: np.ndarray, percentiles: Sequence[float] = PERCENTILES
+) -> np.ndarray:
+    """Score percentiles for each round.
+
+    Returns:
+        np.ndarray: ``len(percentiles)`` x 5 array
+    """
+    if not len(round_scores):
+        return np.full((len(percentiles), ROUNDS), np.nan)
+    return np.nanpercentile(round_scores, percentiles, axis=0)
+
+
+def medal_counts(
+    totals: np.ndarray,
+    gold: int = GoogleSheetsWriter.GOLD_THRESHOLD,
+    silver: int = GoogleSheetsWriter.SILVER_THRESHOLD,
+) -> Dict[str, int]:
+    """Count games per medal, using the sheet's highlight thresholds."""
+    gold_count = int(np.count_nonzero(totals >= gold))
+    silver_count = int(np.count_nonzero((totals >= silver) & (totals < gold)))
+    return {
+        "gold": gold_count,
+        "silver": silver_count,
+        "bronze": len(totals) - gold_count - silver_count,
+    }
+
+
+def streaks(dates: np.ndarray, today: Optional[date] = None) -> Dict[str, int]:
+    """Longest run of games on consecutive days, and the one still going.
+
+    The latest run only counts as current if it reaches today or
+    yesterday, since today's challenge may not have been played yet.
+
+    Args:
+        dates (np.ndarray): Game dates
+        today (date, optional): Defaults to the current UTC date, the
+                                date challenges are stored under
+    """
+    days = np.unique(dates.astype("datetime64[D]").astype(np.int64))
+    if not len(days):
+        return {"current": 0, "longest": 0}
+    # Indexes where a new run starts, plus the end sentinel
+    starts = np.flatnonzero(np.diff(days) != 1) + 1
+    bounds = np.concatenate(([0], starts, [len(days)]))
+    lengths = np.diff(bounds)
+
+    today = today or datetime.now(timezone.utc).date()
+    today_number = np.datetime64(today, "D").astype(np.int64)
+    current = int(lengths[-1]) if days[-1] >= today_number - 1 else 0
+    return {"current": current, "longest": int(lengths.max())}
+
+
+def extreme_rounds(dates: np.ndarray, round_scores: np.ndarray) -> Dict[str, Any]:
+    """Best and worst single rounds.
+
+    Returns:
+        Dict[str, Any]: ``best``/``worst`` as (date, round number, score)
+    """
+    if not np.isfinite(round_scores).any():
+        return {"best": None, "worst": None}
+    result = {}
+    for name, index in (
+        ("best", np.nanargmax(round_scores)),
+        ("worst", np.nanargmin(round_scores)),
+    ):
+        row, col = np.unravel_index(index, round_scores.shape)
+        result[name] = (
+            dates[row].item(),
+            int(col) + 1,
+            int(round_scores[row, col]),
+        )
+    return result
+
+
+def compute_stats(
+    games: Iterable[DailyChallengeGame],
+    window: int = 7,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """Compute all summary statistics for a history.
+
+    Args:
+        games (Iterable[DailyChallengeGame]): Games to analyse
+        window (int): Rolling average window in games
+        today (date, optional): Date the current streak must reach;
+                                defaults to the current UTC date
+
+    Returns:
+        Dict[str, Any]: Summary statistics
+    """
+    arrays = load_arrays(games)
+    totals = arrays["totals"]
+    rolling = rolling_mean(totals, window)
+    return {
+        "games": len(totals),
+        "average": float(totals.mean()) if len(totals) else None,
+        "rolling_average": float(rolling[-1]) if len(rolling) else None,
+        "round_averages": (
+            np.nanmean(arrays["round_scores"], axis=0)
+            if len(totals)
+            else np.full(ROUNDS, np.nan)
+        ),
+        "round_percentiles": round_percentiles(arrays["round_scores"]),
+        "medals": medal_counts(totals),
+        "streaks": streaks(arrays["dates"], today),
+        **extreme_rounds(arrays["dates"], arrays["round_scores"]),
+    }
@@ -0,0 +1,455 @@
+"""Storage backends for game history."""
+
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .config import Config, get_data_dir, load_config
+from .models import DailyChallengeGame, Round
+from .utils import (
+    append_rows,
+    iter_date_groups,
+    iter_games,
+    save_many,
+    save_to_csv,
+    write_games,
+)
+
+
+class Storage(ABC):
+    """Interface shared by all game stores.
+
+    Games are keyed by date. ``save_games`` only adds dates that are not
+    stored yet and never changes a stored game; ``replace_games``
+    overwrites them. Tokens are unique too: saving a game whose token is
+    stored under another date skips it like a duplicate, and replacing
+    moves the token to the new date.
+    """
+
+    def save_game(self, game: DailyChallengeGame) -> None:
+        """Save a single game.
+
+        Args:
+            game (DailyChallengeGame): The game results to save
+        """
+        self.save_games([game])
+
+    @abstractmethod
+    def save_games(
+        self, games: Iterable[DailyChallengeGame]
+    ) -> List[DailyChallengeGame]:
+        """Save many games at once, skipping dates that are already stored.
+
+        Args:
+            games (Iterable[DailyChallengeGame]): The game results to save
+
+        Returns:
+            List[DailyChallengeGame]: Games whose date was not stored before
+        """
+
+    @abstractmethod
+    def replace_games(self, games: Iterable[DailyChallengeGame]) -> None:
+        """Save games, overwriting any stored game with the same date.
+
+        Args:
+            games (Iterable[DailyChallengeGame]): The game results to save
+        """
+
+    @abstractmethod
+    def iter_games(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> Iterator[DailyChallengeGame]:
+        """Lazily yield stored games in date order.
+
+        Args:
+            start (date, optional): First date to include
+            end (date, optional): Last date to include
+        """
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvStorage(Storage):
+    """Store games in daily_challenges.csv (the default backend).
+
+    Round coordinates do not fit the fixed CSV (and sheet) layout, so they
+    go to a ``<name>_locations.csv`` sidecar with one row per round.
+    """
+
+    LOCATION_HEADERS = [
+        "date",
+        "round",
+        "lat",
+        "lng",
+        "guess_lat",
+        "guess_lng",
+        "country_code",
+    ]
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the CSV store.
+
+        Args:
+            path (Path, optional): CSV file. If None, uses default location.
+        """
+        self.path = path
+
+    @property
+    def csv_path(self) -> Path:
+        """CSV file holding the games."""
+        return Path(self.path) if self.path else get_data_dir() / "daily_challenges.csv"
+
+    @property
+    def locations_path(self) -> Path:
+        """Sidecar file holding the round coordinates."""
+        path = self.csv_path
+        return path.with_name(f"{path.stem}_locations.csv")
+
+    def save_game(self, game: DailyChallengeGame) -> None:
+        if save_to_csv(game, self.path):
+            self._save_locations([game])
+
+    def save_games(
+        self, games: Iterable[DailyChallengeGame]
+    ) -> List[DailyChallengeGame]:
+        added = save_many(games, self.path)
+        self._save_locations(added)
+        return added
+
+    def replace_games(self, games: Iterable[DailyChallengeGame]) -> None:
+        # Both files are rebuilt next to the originals, then swapped in
+        replacements = {game.date: game for game in games}
+        tokens = {game.token for game in replacements.values()}
+        merged = [
+            replacements.pop(game.date, game)
+            for game in self.iter_games()
+            # A replaced token moves to its new date
+            if game.date in replacements or game.token not in tokens
+        ]
+        merged.extend(replacements.values())
+
+        path = self.csv_path
+        rebuilt = CsvStorage(path.with_name(f"{path.stem}.rebuild{path.suffix}"))
+        rebuilt.locations_path.unlink(missing_ok=True)
+        write_games(merged, rebuilt.path)
+        rebuilt._save_locations(merged)
+        if rebuilt.locations_path.exists():
+            os.replace(rebuilt.locations_path, self.locations_path)
+        else:
+            self.locations_path.unlink(missing_ok=True)
+        os.replace(rebuilt.path, path)
+
+    def _save_locations(self, games: List[DailyChallengeGame]) -> None:
+        rows = [
+            [
+                game.date.strftime("%Y-%m-%d"),
+                r.roundNumber,
+                r.lat,
+                r.lng,
+                r.guessLat,
+                r.guessLng,
+                r.countryCode,
+            ]
+            for game in games
+            for r in game.rounds
+            if r.lat is not None or r.guessLat is not None
+        ]
+        append_rows(self.locations_path, self.LOCATION_HEADERS, rows)
+
+    def iter_games(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> Iterator[DailyChallengeGame]:
+        # Both readers yield in date order, so the coordinates are merged
+        # in while streaming instead of being loaded up front
+        groups = iter_date_groups(self.locations_path, start, end)
+        with closing(groups) as locations:
+            pending = next(locations, None)
+            for game in iter_games(self.path, start, end):
+                date_str = game.date.strftime("%Y-%m-%d")
+                while pending is not None and pending[0] < date_str:
+                    pending = next(locations, None)
+                if pending is not None and pending[0] == date_str:
+                    by_round = {int(row["round"]): row for row in pending[1]}
+                    for r in game.rounds:
+                        row = by_round.get(r.roundNumber)
+                        if row:
+                            r.lat = _optional_float(row["lat"])
+                            r.lng = _optional_float(row["lng"])
+                            r.guessLat = _optional_float(row["guess_lat"])
+                            r.guessLng = _optional_float(row["guess_lng"])
+                            r.countryCode = row["country_code"] or None
+                yield game
+
+
+def _optional_float(value: str) -> Optional[float]:
+    return float(value) if value else None
+
+
+class SqliteStorage(Storage):
+    """Store games in a SQLite database in WAL mode.
+
+    Games and rounds live in separate tables, and both dates and tokens
+    are unique.
+    """
+
+    PAGE_SIZE = 500
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL UNIQUE,
+            token TEXT NOT NULL UNIQUE,
+            total_score INTEGER NOT NULL,
+            total_distance REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS rounds (
+            game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+            round_number INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            distance REAL NOT NULL,
+            lat REAL,
+            lng REAL,
+            guess_lat REAL,
+            guess_lng REAL,
+            country_code TEXT,
+            PRIMARY KEY (game_id, round_number)
+        );
+    """
+
+    # Added after the first release; older databases gain them on open
+    LOCATION_COLUMNS = (
+        ("lat", "REAL"),
+        ("lng", "REAL"),
+        ("guess_lat", "REAL"),
+        ("guess_lng", "REAL"),
+        ("country_code", "TEXT"),
+    )
+
+    def __init__(self, path: Optional[Path] = None):
+        """Open (and create if needed) the database.
+
+        Args:
+            path (Path, optional): Database file. Defaults to
+                                   daily_challenges.db in the data dir.
+        """
+        self.path = path or get_data_dir() / "daily_challenges.db"
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(self.SCHEMA)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self) -> None:
+        columns = {
+            row[1] for row in self.connection.execute("PRAGMA table_info(rounds)")
+        }
+        with self.connection:
+            for name, sql_type in self.LOCATION_COLUMNS:
+                if name not in columns:
+                    self.connection.execute(
+                        f"ALTER TABLE rounds ADD COLUMN {name} {sql_type}"
+                    )
+
+    def save_games(
+        self, games: Iterable[DailyChallengeGame]
+    ) -> List[DailyChallengeGame]:
+        return self._write(games, replace=False)
+
+    def replace_games(self, games: Iterable[DailyChallengeGame]) -> None:
+        self._write(games, replace=True)
+
+    def _write(
+        self, games: Iterable[DailyChallengeGame], replace: bool
+    ) -> List[DailyChallengeGame]:
+        """Insert games in one transaction, overwriting stored dates if asked.
+
+        Returns:
+            List[DailyChallengeGame]: Games whose date was not stored before
+        """
+        games = sorted(games, key=lambda game: game.date)
+        added = []
+        with self._lock, self.connection:
+            for game in games:
+                date_str = game.date.strftime("%Y-%m-%d")
+                values = (date_str, game.token, game.totalScore, game.totalDistance)
+                if not replace:
+                    # Conflicts on either the date or the token skip the game
+                    cursor = self.connection.execute(
+                        """
+                        INSERT INTO games (date, token, total_score, total_distance)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT DO NOTHING
+                        """,
+                        values,
+                    )
+                    if not cursor.rowcount:
+                        continue
+                    added.append(game)
+                    game_id = cursor.lastrowid
+                else:
+                    self.connection.execute(
+                        "DELETE FROM games WHERE token = ? AND date != ?",
+                        (game.token, date_str),
+                    )
+                    existing = self.connection.execute(
+                        "SELECT id FROM games WHERE date = ?", (date_str,)
+                    ).fetchone()
+                    self.connection.execute(
+                        """
+                        INSERT INTO games (date, token, total_score, total_distance)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(date) DO UPDATE SET
+                            token = excluded.token,
+                            total_score = excluded.total_score,
+                            total_distance = excluded.total_distance
+                        """,
+                        values,
+                    )
+                    if existing is None:
+                        added.append(game)
+                        (game_id,) = self.connection.execute(
+                            "SELECT id FROM games WHERE date = ?", (date_str,)
+                        ).fetchone()
+                    else:
+                        game_id = existing[0]
+                        self.connection.execute(
+                            "DELETE FROM rounds WHERE game_id = ?", (game_id,)
+                        )
+                self.connection.executemany(
+                    """
+                    INSERT INTO rounds (
+                        game_id, round_number, score, distance,
+                        lat, lng, guess_lat, guess_lng, country_code
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            game_id,
+                            r.roundNumber,
+                            r.score,
+                            r.distance,
+                            r.lat,
+                            r.lng,
+                            r.guessLat,
+                            r.guessLng,
+                            r.countryCode,
+                        )
+                        for r in game.rounds
+                    ],
+                )
+        return added
+
+    def iter_games(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> Iterator[DailyChallengeGame]:
+        # Page through games by date so memory stays bounded and the lock
+        # is never held while the caller consumes results
+        last_date = start.strftime("%Y-%m-%d") if start else ""
+        include_last = True
+        end_str = end.strftime("%Y-%m-%d") if end else "9999-12-31"
+        while True:
+            with self._lock:
+                games = self.connection.execute(
+                    f"""
+                    SELECT id, date, token, total_score, total_distance
+                    FROM games
+                    WHERE date {">=" if include_last else ">"} ? AND date <= ?
+                    ORDER BY date
+                    LIMIT ?
+                    """,
+                    (last_date, end_str, self.PAGE_SIZE),
+                ).fetchall()
+                rounds: Dict[int, List[Round]] = {}
+                if games:
+                    ids = [game[0] for game in games]
+                    for row in self.connection.execute(
+                        f"""
+                        SELECT game_id, round_number, score, distance,
+                               lat, lng, guess_lat, guess_lng, country_code
+                        FROM rounds
+                        WHERE game_id IN ({",".join("?" * len(ids))})
+                        ORDER BY game_id, round_number
+                        """,
+                        ids,
+                    ):
+                        rounds.setdefault(row[0], []).append(
+                            Round(
+                                roundNumber=row[1],
+                                score=row[2],
+                                distance=row[3],
+                                lat=row[4],
+                                lng=row[5],
+                                guessLat=row[6],
+                                guessLng=row[7],
+                                countryCode=row[8],
+                            )
+                        )
+
+            for game_id, date_str, token, total_score, total_distance in games:
+                yield DailyChallengeGame(
+                    token=token,
+                    totalScore=total_score,
+                    totalDistance=total_distance,
+                    rounds=rounds.get(game_id, []),
+                    date=datetime.strptime(date_str, "%Y-%m-%d").date(),
+                )
+
+            if len(games) < self.PAGE_SIZE:
+                return
+            last_date = games[-1][1]
+            include_last = False
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def get_storage(config: Optional[Dict[str, Any]] = None) -> Storage:
+    """Create the storage backend selected in the configuration.
+
+    Uses STORAGE_BACKEND ("csv" or "sqlite", default "csv") and the
+    optional STORAGE_PATH.
+
+    Args:
+        config (Dict[str, Any], optional): Configuration. Defaults to the
+                                   cached settings from load_config().
+
+    Returns:
+        Storage: The configured store
+
+    Raises:
+        ValueError: If the configuration is invalid
+    """
+    settings = load_config() if config is None else Config.from_dict(config)
+    if settings.storage_backend == "sqlite":
+        return SqliteStorage(settings.storage_path)
+    return CsvStorage(settings.storage_path)
+
+
+def migrate_from_csv(storage: Storage, csv_path: Optional[Path] = None) -> int:
+    """Copy every game from a CSV history into another store.
+
+    Args:
+        storage (Storage): Destination store
+        csv_path (Path, optional): CSV file. If None, uses default location.
+
+    Returns:
+        int: Number of games newly added to the destination
+    """
+    return len(storage.save_games(CsvStorage(csv_path).iter_games()))
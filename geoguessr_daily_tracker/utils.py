@@ -1,42 +1,99 @@
 """Utility functions for GeoGuessr Tracker."""
 
 import csv
+import io
+import itertools
 import os
-from datetime import datetime
+import threading
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .config import get_data_dir
-from .models import DailyChallengeGame
+from .metrics import metrics
+from .models import DailyChallengeGame, Round
 
+CSV_HEADERS = [
+    "date",
+    "total_score",
+    "total_distance",
+    "round1_score",
+    "round1_distance",
+    "round2_score",
+    "round2_distance",
+    "round3_score",
+    "round3_distance",
+    "round4_score",
+    "round4_distance",
+    "round5_score",
+    "round5_distance",
+    "link",
+]
 
-def save_to_csv(game: DailyChallengeGame, filename: Optional[Path] = None) -> None:
-    """Save game results to CSV file.
 
-    Args:
-        game (DailyChallengeGame): The game results to save
-        filename (Path, optional): Path to CSV file. If None, uses default location.
+class _CsvIndex:
+    """In-process index of the dates and tokens stored in a CSV file.
+
+    The index remembers the file's (mtime, size) after every read or
+    write; if the file changes behind our back it is rebuilt.
     """
-    if filename is None:
-        filename = get_data_dir() / "daily_challenges.csv"
 
-    headers = [
-        "date",
-        "total_score",
-        "total_distance",
-        "round1_score",
-        "round1_distance",
-        "round2_score",
-        "round2_distance",
-        "round3_score",
-        "round3_distance",
-        "round4_score",
-        "round4_distance",
-        "round5_score",
-        "round5_distance",
-        "link",
-    ]
+    __slots__ = ("dates", "tokens", "stat_key", "last_date", "is_sorted")
 
+    def __init__(self):
+        self.dates = set()
+        self.tokens = set()
+        self.stat_key = None
+        self.last_date = None
+        self.is_sorted = True
+
+    def add(self, date_str: str, token: str) -> None:
+        if self.last_date is not None and date_str < self.last_date:
+            self.is_sorted = False
+        else:
+            self.last_date = date_str
+        self.dates.add(date_str)
+        self.tokens.add(token)
+
+
+_indexes: Dict[Path, _CsvIndex] = {}
+_index_lock = threading.RLock()
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_index(path: Path) -> _CsvIndex:
+    """Return an up-to-date index for a CSV file, rebuilding it if stale.
+
+    Must be called with ``_index_lock`` held.
+    """
+    stat_key = _stat_key(path)
+    index = _indexes.get(path)
+    if index is not None and index.stat_key == stat_key:
+        return index
+
+    index = _CsvIndex()
+    if stat_key is not None:
+        with open(path, mode="r", newline="") as file:
+            reader = csv.reader(file)
+            header = next(reader, None) or CSV_HEADERS
+            date_col = header.index("date")
+            link_col = header.index("link")
+            for row in reader:
+                if row:
+                    index.add(row[date_col], row[link_col].rsplit("/", 1)[-1])
+    index.stat_key = stat_key
+    _indexes[path] = index
+    return index
+
+
+def _game_to_row(game: DailyChallengeGame) -> Dict[str, object]:
     row_data = {
         "date": game.date.strftime("%Y-%m-%d"),
         "link": f"https://www.geoguessr.com/results/{game.token}",
@@ -48,26 +105,398 @@ def save_to_csv(game: DailyChallengeGame, filename: Optional[Path] = None) -> No
         row_data[f"round{round.roundNumber}_score"] = round.score
         row_data[f"round{round.roundNumber}_distance"] = round.distance
 
-    file_exists = os.path.isfile(filename)
+    return row_data
 
-    if file_exists:
-        with open(filename, mode="r", newline="") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                if row["date"] == game.date.strftime("%Y-%m-%d"):
-                    print(
-                        f"Entry for {game.date.strftime('%Y-%m-%d')} already exists in the CSV file"
-                    )
-                    return
 
-    with open(filename, mode="a", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=headers)
+def row_to_game(row: Dict[str, str]) -> DailyChallengeGame:
+    """Build a game from a CSV row as written by save_to_csv."""
+    rounds = [
+        Round(
+            score=int(row[f"round{number}_score"]),
+            distance=float(row[f"round{number}_distance"]),
+            roundNumber=number,
+        )
+        for number in range(1, 6)
+        if row.get(f"round{number}_score")
+    ]
+    return DailyChallengeGame(
+        token=row["link"].rsplit("/", 1)[-1],
+        totalScore=int(row["total_score"]),
+        totalDistance=float(row["total_distance"]),
+        rounds=rounds,
+        date=datetime.strptime(row["date"], "%Y-%m-%d").date(),
+    )
 
-        if not file_exists:
+
+def _append_games(
+    games: Iterable[DailyChallengeGame], filename: Optional[Path]
+) -> Tuple[List[DailyChallengeGame], List[DailyChallengeGame]]:
+    """Append games whose date and token are not yet stored, with one file open.
+
+    Returns:
+        Tuple: Games that were added and games skipped as duplicates
+    """
+    if filename is None:
+        filename = get_data_dir() / "daily_challenges.csv"
+    path = Path(filename).resolve()
+
+    added = []
+    skipped = []
+    with _index_lock:
+        index = _get_index(path)
+        batch_dates = set()
+        batch_tokens = set()
+        for game in sorted(games, key=lambda g: g.date):
+            date_str = game.date.strftime("%Y-%m-%d")
+            if (
+                date_str in index.dates
+                or date_str in batch_dates
+                or game.token in index.tokens
+                or game.token in batch_tokens
+            ):
+                skipped.append(game)
+            else:
+                batch_dates.add(date_str)
+                batch_tokens.add(game.token)
+                added.append(game)
+
+        if not added:
+            return added, skipped
+
+        # Append-only, so rows written by other processes are never lost;
+        # readers cope with files that end up out of date order
+        file_exists = index.stat_key is not None
+        with open(path, mode="a", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=CSV_HEADERS)
+            if not file_exists:
+                writer.writeheader()
+            for game in added:
+                writer.writerow(_game_to_row(game))
+                index.add(game.date.strftime("%Y-%m-%d"), game.token)
+        index.stat_key = _stat_key(path)
+
+    return added, skipped
+
+
+def write_games(games: Iterable[DailyChallengeGame], filename: Path) -> None:
+    """Replace a CSV file with the given games, sorted by date.
+
+    Args:
+        games (Iterable[DailyChallengeGame]): Every game the file should hold
+        filename (Path): Path to CSV file
+    """
+    path = Path(filename).resolve()
+    # Unique per process and thread, so concurrent writers never share one
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with _index_lock:
+        with open(tmp_path, mode="w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=CSV_HEADERS)
             writer.writeheader()
+            for game in sorted(games, key=lambda g: g.date):
+                writer.writerow(_game_to_row(game))
+        os.replace(tmp_path, path)
+        _indexes.pop(path, None)
+
+
+def _seek_date(file: BinaryIO, start: bytes, lo: int, hi: int) -> int:
+    """Find the offset of the first line dated on or after ``start``.
+
+    ``file`` must be sorted by date with the date at the start of each
+    line, and ``lo`` must be the start of a line. Bisection narrows the
+    range down to a few KiB, which are then scanned line by line.
+    """
+    while hi - lo > 4096:
+        mid = (lo + hi) // 2
+        file.seek(mid)
+        file.readline()  # Skip the line containing mid
+        line_start = file.tell()
+        line = file.readline()
+        if line and line[: len(start)] < start:
+            # Every line up to and including this one is too early
+            lo = line_start + len(line)
+        else:
+            hi = mid
+
+    file.seek(lo)
+    while True:
+        line = file.readline()
+        if not line or line[: len(start)] >= start:
+            return lo
+        lo += len(line)
+
+
+def _line_date(line: bytes) -> bytes:
+    return line.split(b",", 1)[0]
+
+
+# Whether a date-first CSV file is sorted, with the (mtime, size) checked
+_sorted_files: Dict[Path, Tuple[Tuple[int, int], bool]] = {}
+
+
+def _is_sorted(path: Path) -> bool:
+    """Whether a CSV file whose rows start with their date is sorted.
+
+    Checked with one streaming pass, remembered until the file changes.
+    Must be called with ``_index_lock`` held.
+    """
+    stat_key = _stat_key(path)
+    cached = _sorted_files.get(path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    in_order = True
+    with open(path, mode="rb") as file:
+        file.readline()
+        previous = b""
+        for line in file:
+            line_date = _line_date(line)
+            if line_date < previous:
+                in_order = False
+                break
+            previous = line_date
+    _sorted_files[path] = (stat_key, in_order)
+    return in_order
+
+
+def append_rows(filename: Path, header: List[str], rows: List[list]) -> None:
+    """Append rows to a CSV file whose first column is the date.
 
-        writer.writerow(row_data)
+    The file is only ever appended to. Rows are written in date order,
+    and whether the file is still sorted is remembered for readers.
+
+    Args:
+        filename (Path): Path to CSV file, created with ``header`` if missing
+        header (List[str]): Column names, starting with "date"
+        rows (List[list]): Rows to append
+    """
+    if not rows:
+        return
+    path = Path(filename).resolve()
+    rows = sorted(rows, key=lambda row: row[0])
+    with _index_lock:
+        stat_key = _stat_key(path)
+        cached = _sorted_files.get(path)
+        if stat_key is None:
+            in_order = True
+        elif cached is not None and cached[0] == stat_key:
+            in_order = cached[1]
+        else:
+            in_order = None  # Unknown until a reader checks
+        with open(path, mode="a+b") as file:
+            size = file.seek(0, os.SEEK_END)
+            file.seek(max(0, size - 4096))
+            last_date = _line_date(file.read().splitlines()[-1]) if size else b""
+            # A header-only file has no last date to compare with
+            if last_date not in (b"", header[0].encode()) and (
+                last_date.decode() > rows[0][0]
+            ):
+                in_order = False
+            text = io.StringIO(newline="")
+            writer = csv.writer(text)
+            if stat_key is None:
+                writer.writerow(header)
+            writer.writerows(rows)
+            file.write(text.getvalue().encode())
+        if in_order is not None:
+            _sorted_files[path] = (_stat_key(path), in_order)
+
+
+def iter_date_groups(
+    filename: Path, start: Optional[date] = None, end: Optional[date] = None
+) -> Iterator[Tuple[str, List[Dict[str, str]]]]:
+    """Lazily yield the rows of a CSV file whose first column is the date.
+
+    Sorted files are streamed from the first row on or after ``start``,
+    found by binary search. Files that are not sorted are scanned in full
+    and the rows in the range grouped in memory. Files are never changed.
+
+    Args:
+        filename (Path): Path to CSV file
+        start (date, optional): First date to include
+        end (date, optional): Last date to include
+
+    Yields:
+        Tuple[str, List[Dict[str, str]]]: Date and its rows, in date order
+    """
+    path = Path(filename).resolve()
+    start_str = start.strftime("%Y-%m-%d") if start else ""
+    end_str = end.strftime("%Y-%m-%d") if end else "9999-12-31"
+    with _index_lock:
+        if _stat_key(path) is None:
+            return
+        is_sorted = _is_sorted(path)
+    try:
+        file = open(path, mode="rb")
+    except FileNotFoundError:
+        return
+
+    with file:
+        header_line = file.readline()
+        header = next(csv.reader([header_line.decode()]), None)
+        if is_sorted and start_str:
+            size = os.fstat(file.fileno()).st_size
+            file.seek(_seek_date(file, start_str.encode(), len(header_line), size))
+        rows = (
+            dict(zip(header, row))
+            for row in csv.reader(line.decode() for line in file)
+            if row
+        )
+        if is_sorted:
+            for date_str, group in itertools.groupby(rows, key=lambda row: row["date"]):
+                if date_str > end_str:
+                    return
+                yield date_str, list(group)
+            return
+
+        groups: Dict[str, List[Dict[str, str]]] = {}
+        for row in rows:
+            if start_str <= row["date"] <= end_str:
+                groups.setdefault(row["date"], []).append(row)
+    for date_str in sorted(groups):
+        yield date_str, groups[date_str]
+
+
+def iter_games(
+    filename: Optional[Path] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Iterator[DailyChallengeGame]:
+    """Lazily yield stored games, optionally limited to a date range.
+
+    Games are usually saved in date order, and while a file is sorted
+    the first game of the range is found by binary search and reading
+    stops after ``end``. Files that are not sorted (backfilled, legacy or
+    hand-edited) are never rewritten: they are scanned in full and the
+    games in the range are sorted in memory. A date stored twice yields
+    only its first row.
+
+    Args:
+        filename (Path, optional): Path to CSV file. If None, uses default location.
+        start (date, optional): First date to include
+        end (date, optional): Last date to include
+
+    Yields:
+        DailyChallengeGame: Games in date order
+    """
+    if filename is None:
+        filename = get_data_dir() / "daily_challenges.csv"
+    path = Path(filename).resolve()
+    start_str = start.strftime("%Y-%m-%d") if start else None
+    end_str = end.strftime("%Y-%m-%d") if end else None
+
+    with _index_lock:
+        # Cached by (mtime, size) and kept current by our own appends
+        if _stat_key(path) is None:
+            return
+        is_sorted = _get_index(path).is_sorted
+    if not is_sorted:
+        yield from _scan_games(path, start_str, end_str, set())
+        return
+
+    try:
+        file = open(path, mode="rb")
+    except FileNotFoundError:
+        return
+
+    yielded = set()
+    with file:
+        header_line = file.readline()
+        header = next(csv.reader([header_line.decode()]), None) or CSV_HEADERS
+        date_col = header.index("date")
+        if start_str and date_col == 0:
+            size = os.fstat(file.fileno()).st_size
+            file.seek(_seek_date(file, start_str.encode(), len(header_line), size))
+
+        last_date = ""
+        for row in csv.reader(line.decode() for line in file):
+            if not row:
+                continue
+            date_str = row[date_col]
+            if date_str < last_date:
+                break  # Changed while reading: fall back to a full scan below
+            last_date = date_str
+            if end_str and date_str > end_str:
+                return
+            if (start_str and date_str < start_str) or date_str in yielded:
+                continue
+            yielded.add(date_str)
+            yield row_to_game(dict(zip(header, row)))
+        else:
+            return
+
+    yield from _scan_games(path, start_str, end_str, yielded)
+
+
+def _scan_games(
+    path: Path, start_str: Optional[str], end_str: Optional[str], skip: set
+) -> Iterator[DailyChallengeGame]:
+    """Read a whole CSV file and yield the games in a date range, sorted.
+
+    Only the first row of each date is used, and dates in ``skip`` are
+    left out.
+    """
+    rows = {}
+    with open(path, mode="r", newline="") as file:
+        for row in csv.DictReader(file):
+            date_str = row["date"]
+            if date_str in skip or date_str in rows:
+                continue
+            if (start_str and date_str < start_str) or (end_str and date_str > end_str):
+                continue
+            rows[date_str] = row
+    for date_str in sorted(rows):
+        yield row_to_game(rows[date_str])
+
+
+def _count_rows(added: list, skipped: list) -> None:
+    metrics.inc("csv_rows_total", len(added), result="added")
+    metrics.inc("csv_rows_total", len(skipped), result="skipped")
+
+
+def save_to_csv(game: DailyChallengeGame, filename: Optional[Path] = None) -> bool:
+    """Save game results to CSV file.
+
+    Args:
+        game (DailyChallengeGame): The game results to save
+        filename (Path, optional): Path to CSV file. If None, uses default location.
+
+    Returns:
+        bool: Whether the game was added (False if its date was already stored)
+    """
+    with metrics.timer("csv_save_seconds", call="save_to_csv"):
+        added, skipped = _append_games([game], filename)
+    _count_rows(added, skipped)
+    if added:
         print(f"Added new entry for {game.date.strftime('%Y-%m-%d')} to the CSV file")
+    else:
+        print(
+            f"Entry for {game.date.strftime('%Y-%m-%d')} already exists in the CSV file"
+        )
+    return bool(added)
+
+
+def save_many(
+    games: Iterable[DailyChallengeGame], filename: Optional[Path] = None
+) -> List[DailyChallengeGame]:
+    """Save a batch of game results to CSV file, skipping known dates.
+
+    New games are appended in date order with a single file open.
+
+    Args:
+        games (Iterable[DailyChallengeGame]): The game results to save
+        filename (Path, optional): Path to CSV file. If None, uses default location.
+
+    Returns:
+        List[DailyChallengeGame]: The games that were actually added
+    """
+    with metrics.timer("csv_save_seconds", call="save_many"):
+        added, skipped = _append_games(games, filename)
+    _count_rows(added, skipped)
+    print(
+        f"Added {len(added)} new entries to the CSV file "
+        f"({len(skipped)} already existed)"
+    )
+    return added
 
 
 def get_previous_challenges() -> Dict[datetime.date, str]:
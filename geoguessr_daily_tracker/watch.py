@@ -0,0 +1,158 @@
+"""Long-running tracker that polls for the daily challenge result."""
+
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Optional
+
+import requests
+
+from .api import (
+    GeoGuessrAPI,
+    parse_challenge_start,
+    parse_daily_challenge,
+    parse_game_details,
+)
+from .leaderboard import LeaderboardStore
+from .storage import Storage
+
+
+class Watcher:
+    """Poll today's challenge and save the result once it is finished.
+
+    The API client, storage and Sheets writer are created once by the
+    caller and reused for every poll. Polling backs off exponentially
+    while the game has not been started, polls at the minimum interval
+    while it is being played and sleeps until the next challenge once
+    the result has been written.
+    """
+
+    def __init__(
+        self,
+        api: GeoGuessrAPI,
+        storage: Storage,
+        sheet=None,
+        leaderboard_dir=None,
+        min_interval: float = 60.0,
+        max_interval: float = 1800.0,
+        sleep: Callable[[float], None] = time.sleep,
+        now: Optional[Callable[[], datetime]] = None,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            api (GeoGuessrAPI): API client
+            storage (Storage): Store the results are saved to
+            sheet (GoogleSheetsWriter, optional): Sheet the results are saved to
+            leaderboard_dir (Path, optional): Leaderboard store directory
+            min_interval (float): Shortest delay between polls, in seconds
+            max_interval (float): Longest delay between polls, in seconds
+            sleep (Callable): Sleep function, replaceable for tests
+            now (Callable, optional): Returns the current UTC time
+        """
+        self.api = api
+        self.storage = storage
+        self.sheet = sheet
+        self.leaderboard_dir = leaderboard_dir
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.sleep = sleep
+        self.now = now or (lambda: datetime.now(timezone.utc))
+
+        self.token: Optional[str] = None
+        self.day: Optional[date] = None
+        self.rollover: Optional[datetime] = None
+        self.written: Optional[str] = None
+        self.writes = 0
+        self.misses = 0
+
+    def _backoff(self) -> float:
+        delay = min(self.max_interval, self.min_interval * 2**self.misses)
+        self.misses += 1
+        return delay
+
+    def _until_rollover(self) -> float:
+        seconds = (self.rollover - self.now()).total_seconds() + self.min_interval
+        return max(self.min_interval, min(self.max_interval, seconds))
+
+    def _is_stored(self, token: str) -> bool:
+        return any(game.token == token for game in self.storage.iter_games(self.day))
+
+    def _refresh_challenge(self) -> bool:
+        """Fetch today's challenge; return True if it is a new one."""
+        payload = self.api.get_daily_challenge_payload()
+        token = parse_daily_challenge(payload, self.api.strict)
+        if token == self.token:
+            return False
+
+        start = parse_challenge_start(payload)
+        self.token = token
+        self.day = start.date()
+        self.rollover = start + timedelta(days=1)
+        self.misses = 0
+        if self._is_stored(token):
+            self.written = token
+        print(f"Watching daily challenge for {self.day}")
+        return True
+
+    def _write(self, payload: dict) -> None:
+        game = parse_game_details(self.token, payload, self.api.strict)
+        game.date = self.day
+        self.storage.save_game(game)
+        if self.sheet:
+            self.sheet.save_game(game)
+        self.written = self.token
+        self.writes += 1
+        print(f"Successfully saved challenge results for {game.date}")
+
+        # The leaderboard is most complete once our own result is in
+        try:
+            daily = self.api.get_daily_challenge_payload()
+            LeaderboardStore(self.leaderboard_dir).save(daily)
+        except Exception as e:
+            print(f"Warning: could not store leaderboard: {str(e)}", file=sys.stderr)
+
+    def poll_once(self) -> float:
+        """Run one polling step.
+
+        Returns:
+            float: Seconds to wait before the next step
+        """
+        try:
+            if self.token is None or self.now() >= self.rollover:
+                if not self._refresh_challenge() and self.written == self.token:
+                    # The next challenge has not been published yet
+                    return self._backoff()
+            if self.written == self.token:
+                return self._until_rollover()
+
+            payload = self.api.get_game_payload(self.token)
+        except (requests.RequestException, ValueError) as e:
+            # Includes the error returned before the game has been started
+            print(f"Poll failed: {str(e)}", file=sys.stderr)
+            return self._backoff()
+
+        state = payload.get("state")
+        if state != "finished":
+            if state == "started":
+                # Being played right now, so the result is close
+                self.misses = 0
+                return self.min_interval
+            return self._backoff()
+
+        try:
+            self._write(payload)
+        except Exception as e:
+            print(f"Error saving results: {str(e)}", file=sys.stderr)
+            return self._backoff()
+        self.misses = 0
+        return self._until_rollover()
+
+    def run(self, stop: Callable[[], bool] = lambda: False) -> None:
+        """Poll until ``stop`` returns True.
+
+        Args:
+            stop (Callable): Checked before every step
+        """
+        while not stop():
+            self.sleep(self.poll_once())
@@ -26,6 +26,12 @@ setup(
         "google-auth>=2.22.0",
         "google-api-python-client>=2.52.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "fast": ["orjson>=3.6"],
+        "parquet": ["pyarrow>=10.0"],
+        "stats": ["numpy>=1.22"],
+    },
     entry_points={
         "console_scripts": [
             "geoguessr-daily-tracker=geoguessr_daily_tracker.cli:main",
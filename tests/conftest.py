@@ -0,0 +1,169 @@
+"""Shared fixtures for GeoGuessr Tracker tests."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+def make_game_payload(token, scores=(5000, 4000, 3000, 2000, 1000)):
+    """Build a minimal but valid /challenges/{token}/game response."""
+    guesses = [
+        {
+            "lat": 10.0 + i,
+            "lng": 20.0 + i,
+            "timedOut": False,
+            "timedOutWithGuess": False,
+            "skippedRound": False,
+            "roundScore": {"amount": str(score), "unit": "points"},
+            "roundScoreInPercentage": score / 50,
+            "roundScoreInPoints": score,
+            "distance": {
+                "meters": {"amount": str(i * 100), "unit": "m"},
+                "miles": {"amount": str(i * 0.06), "unit": "miles"},
+            },
+            "distanceInMeters": float(i * 100),
+            "stepsCount": 0,
+            "time": 30,
+        }
+        for i, score in enumerate(scores)
+    ]
+    return {
+        "token": token,
+        "type": "challenge",
+        "mode": "standard",
+        "state": "finished",
+        "roundCount": len(scores),
+        "timeLimit": 0,
+        "forbidMoving": False,
+        "forbidZooming": False,
+        "forbidRotating": False,
+        "streakType": "countrystreak",
+        "map": "daily",
+        "mapName": "Daily Challenge",
+        "panoramaProvider": 1,
+        "bounds": {"min": {"lat": -90.0, "lng": -180.0}},
+        "round": len(scores),
+        "rounds": [
+            {
+                "lat": 11.0 + i,
+                "lng": 21.0 + i,
+                "panoId": f"pano{i}",
+                "heading": 0.0,
+                "pitch": 0.0,
+                "zoom": 0.0,
+                "startTime": "2025-01-01T00:00:00Z",
+            }
+            for i in range(len(scores))
+        ],
+        "player": {
+            "totalScore": {"amount": str(sum(scores)), "unit": "points"},
+            "totalDistance": {
+                "meters": {"amount": "1000", "unit": "m"},
+                "miles": {"amount": "0.6", "unit": "miles"},
+            },
+            "totalDistanceInMeters": float(sum(i * 100 for i in range(len(scores)))),
+            "totalStepsCount": 0,
+            "totalTime": 150,
+            "totalStreak": 0,
+            "guesses": guesses,
+            "isLeader": False,
+            "currentPosition": 1,
+            "pin": {},
+            "id": "player_id",
+            "nick": "player",
+            "isVerified": False,
+            "flair": 0,
+            "countryCode": "es",
+        },
+    }
+
+
+def make_daily_payload(token="daily_token"):
+    """Build a minimal /challenges/daily-challenges/today response."""
+    return {
+        "authorCreator": {
+            "id": "test_id",
+            "name": "Test User",
+            "avatarImage": "test_image",
+            "signupAssetIds": [],
+            "signupCoins": 0,
+            "youtubeLink": "",
+            "twitchLink": "",
+            "twitterLink": "",
+            "instagramLink": "",
+        },
+        "date": "2025-01-01T00:00:00Z",
+        "participants": 1000,
+        "token": token,
+        "pickedWinner": False,
+        "leaderboard": [],
+        "friends": [],
+        "country": [],
+    }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serve canned payloads.
+
+    Tokens listed in ``failing`` return 500 and Cookie headers listed in
+    ``rejected_cookies`` return 401. The next ``throttle`` game requests
+    return 429.
+    """
+
+    protocol_version = "HTTP/1.1"
+    game_path = re.compile(r"^/api/v3/challenges/([^/]+)/game$")
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        server.clients.add(self.client_address)
+        match = self.game_path.match(self.path)
+        if self.headers.get("Cookie") in server.rejected_cookies:
+            self.send_error(401)
+            return
+        if self.path == "/api/v3/challenges/daily-challenges/today":
+            payload = make_daily_payload()
+        elif not match:
+            self.send_error(404)
+            return
+        elif match.group(1) in server.failing:
+            self.send_error(500)
+            return
+        elif server.throttle:
+            server.throttle -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            payload = make_game_payload(match.group(1))
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Run a local GeoGuessr stub server; yields it with a ``base_url``."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.requests = []
+    server.clients = set()
+    server.rejected_cookies = set()
+    server.failing = set()
+    server.throttle = 0
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v3"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,153 @@
+"""Tests for multi-account tracking."""
+
+import json
+import sys
+from datetime import date
+
+import pytest
+
+from geoguessr_daily_tracker import config
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.cli import main, track_all_accounts
+from geoguessr_daily_tracker.config import get_accounts, refresh_config
+from geoguessr_daily_tracker.utils import iter_games
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the data directory at a temp dir."""
+    monkeypatch.setattr("geoguessr_daily_tracker.config.get_data_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_get_accounts_merges_defaults(data_dir):
+    """Test that accounts inherit top-level settings and get their own store."""
+    config = {
+        "NCFA_COOKIE": "default",
+        "GSHEET_CREDENTIALS": "creds.json",
+        "ACCOUNTS": [
+            {"name": "alice", "NCFA_COOKIE": "a", "GSHEET_ID": "sheet_a"},
+            {"name": "bob", "NCFA_COOKIE": "b", "STORAGE_BACKEND": "sqlite"},
+        ],
+    }
+
+    alice, bob = get_accounts(config)
+
+    assert alice["NCFA_COOKIE"] == "a"
+    assert alice["GSHEET_CREDENTIALS"] == "creds.json"
+    assert alice["STORAGE_PATH"] == str(
+        data_dir / "accounts" / "alice" / "daily_challenges.csv"
+    )
+    assert bob["STORAGE_PATH"].endswith("bob/daily_challenges.db")
+    assert "ACCOUNTS" not in alice
+
+
+def test_get_accounts_does_not_share_a_sheet(data_dir):
+    """Test that the top-level GSHEET_ID is not inherited by accounts."""
+    config = {
+        "USE_GSHEETS": "true",
+        "GSHEET_ID": "shared",
+        "ACCOUNTS": [{"name": "alice", "NCFA_COOKIE": "a"}],
+    }
+    with pytest.raises(ValueError, match="GSHEET_ID is required"):
+        get_accounts(config)
+
+    config["ACCOUNTS"][0]["GSHEET_ID"] = "sheet_a"
+    assert get_accounts(config)[0]["GSHEET_ID"] == "sheet_a"
+
+
+@pytest.mark.parametrize(
+    "accounts",
+    [
+        [{"name": "a"}],
+        [{"name": "../x", "NCFA_COOKIE": "c"}],
+        [{"name": "a", "NCFA_COOKIE": "c"}, {"name": "a", "NCFA_COOKIE": "d"}],
+        [{"name": "a", "NCFA_COOKIE": "c", "USE_GSHEETS": "true"}],
+        [
+            {"name": "a", "NCFA_COOKIE": "c", "USE_GSHEETS": True, "GSHEET_ID": "s"},
+            {"name": "b", "NCFA_COOKIE": "d", "USE_GSHEETS": True, "GSHEET_ID": "s"},
+        ],
+    ],
+)
+def test_get_accounts_validates(accounts, data_dir):
+    """Test that bad account entries are rejected up front."""
+    with pytest.raises(ValueError):
+        get_accounts({"ACCOUNTS": accounts})
+
+
+def test_track_all_accounts_isolates_failures(data_dir, stub_server, monkeypatch):
+    """Test that each account is tracked into its own store."""
+    monkeypatch.setattr(GeoGuessrAPI, "BASE_URL", stub_server.base_url)
+    stub_server.rejected_cookies.add("_ncfa=bad")
+    accounts = get_accounts(
+        {
+            "ACCOUNTS": [
+                {"name": "alice", "NCFA_COOKIE": "a"},
+                {"name": "broken", "NCFA_COOKIE": "bad"},
+                {"name": "carol", "NCFA_COOKIE": "c"},
+            ]
+        }
+    )
+
+    failed = track_all_accounts(accounts)
+
+    assert failed == ["broken"]
+    for name in ("alice", "carol"):
+        path = data_dir / "accounts" / name / "daily_challenges.csv"
+        # Stored under the challenge's own date, like watch does
+        assert [(game.date, game.token) for game in iter_games(path)] == [
+            (date(2025, 1, 1), "daily_token")
+        ]
+    assert not (data_dir / "accounts" / "broken" / "daily_challenges.csv").exists()
+
+
+def test_track_all_accounts_share_one_rate_limiter(data_dir, stub_server, monkeypatch):
+    """Test that every account's client draws from the same rate budget."""
+    monkeypatch.setattr(GeoGuessrAPI, "BASE_URL", stub_server.base_url)
+    monkeypatch.setenv("RATE_LIMIT", "1000")
+    limiters = []
+    init = GeoGuessrAPI.__init__
+
+    def spy(self, *args, **kwargs):
+        limiters.append(kwargs.get("rate_limiter"))
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(GeoGuessrAPI, "__init__", spy)
+    accounts = get_accounts(
+        {
+            "ACCOUNTS": [
+                {"name": "alice", "NCFA_COOKIE": "a"},
+                {"name": "bob", "NCFA_COOKIE": "b"},
+            ]
+        }
+    )
+
+    assert track_all_accounts(accounts) == []
+    assert len(limiters) == 2
+    assert limiters[0] is not None and limiters[0] is limiters[1]
+
+
+def test_configure_show_masks_account_cookies(tmp_path, monkeypatch, capsys):
+    """Test that configure --show hides every account's cookie."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "NCFA_COOKIE": "topsecretcookie000",
+                "ACCOUNTS": [{"name": "bob", "NCFA_COOKIE": "supersecretcookie123"}],
+            }
+        )
+    )
+    monkeypatch.setattr(config, "CONFIG_FILE", config_file)
+    monkeypatch.delenv("NCFA_COOKIE", raising=False)
+    monkeypatch.setattr(sys, "argv", ["geoguessr-daily-tracker", "configure", "--show"])
+    refresh_config()
+
+    try:
+        main()
+    finally:
+        refresh_config()
+
+    out = capsys.readouterr().out
+    assert "supersecretcookie" not in out and "topsecretcookie" not in out
+    assert "'NCFA_COOKIE': '****e123'" in out
@@ -1,10 +1,18 @@
 """Tests for the GeoGuessr API client."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.api import (
+    GeoGuessrAPI,
+    parse_daily_challenge,
+    parse_game_details,
+    retry_delay,
+)
+from tests.conftest import make_game_payload
 
 
 @pytest.fixture
@@ -28,31 +36,34 @@ def test_api_init_with_cookie():
     assert api.headers == {"Cookie": "_ncfa=test_cookie"}
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_daily_challenge(mock_get, mock_api):
     """Test getting the daily challenge token."""
     # Setup mock response
     mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "authorCreator": {
-            "id": "test_id",
-            "name": "Test User",
-            "avatarImage": "test_image",
-            "signupAssetIds": [],
-            "signupCoins": 0,
-            "youtubeLink": "",
-            "twitchLink": "",
-            "twitterLink": "",
-            "instagramLink": "",
-        },
-        "date": "2025-01-01T00:00:00Z",
-        "participants": 1000,
-        "token": "test_token",
-        "pickedWinner": False,
-        "leaderboard": [],
-        "friends": [],
-        "country": [],
-    }
+    mock_response.content = json.dumps(
+        {
+            "authorCreator": {
+                "id": "test_id",
+                "name": "Test User",
+                "avatarImage": "test_image",
+                "signupAssetIds": [],
+                "signupCoins": 0,
+                "youtubeLink": "",
+                "twitchLink": "",
+                "twitterLink": "",
+                "instagramLink": "",
+            },
+            "date": "2025-01-01T00:00:00Z",
+            "participants": 1000,
+            "token": "test_token",
+            "pickedWinner": False,
+            "leaderboard": [],
+            "friends": [],
+            "country": [],
+        }
+    ).encode()
+    mock_response.status_code = 200
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
 
@@ -64,4 +75,88 @@ def test_get_daily_challenge(mock_get, mock_api):
     mock_get.assert_called_once_with(
         "https://www.geoguessr.com/api/v3/challenges/daily-challenges/today",
         headers={"Cookie": "_ncfa=test_cookie"},
+        timeout=(5, 30),
     )
+
+
+def _response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@patch("time.sleep")
+def test_get_retries_and_honours_retry_after(mock_sleep, mock_api):
+    """Test that 429/5xx responses are retried using Retry-After."""
+    ok = _response(200)
+    with patch.object(
+        mock_api.session,
+        "get",
+        side_effect=[_response(429, {"Retry-After": "7"}), _response(503), ok],
+    ) as mock_get:
+        assert mock_api._get("/challenges/daily-challenges/today") is ok
+
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_args_list[0].args == (7.0,)
+    assert 0 <= mock_sleep.call_args_list[1].args[0] <= mock_api.backoff_factor * 2
+
+
+@patch("time.sleep")
+def test_get_does_not_retry_client_errors(mock_sleep, mock_api):
+    """Test that a 4xx other than 429 fails immediately."""
+    not_found = _response(404)
+    not_found.raise_for_status.side_effect = requests.HTTPError("404")
+    with patch.object(mock_api.session, "get", return_value=not_found):
+        with pytest.raises(requests.HTTPError):
+            mock_api._get("/challenges/missing/game")
+
+    mock_sleep.assert_not_called()
+
+
+def test_retry_delay_is_bounded():
+    """Test that backoff delays never exceed the configured cap."""
+    assert retry_delay(0, "120", max_backoff=30) == 30
+    assert all(0 <= retry_delay(10, max_backoff=5) <= 5 for _ in range(50))
+
+
+def test_context_manager_closes_owned_session_only():
+    """Test that the client only closes sessions it created."""
+    with GeoGuessrAPI(cookie="test_cookie") as api:
+        session = api.session
+    with patch.object(session, "close") as mock_close:
+        api.close()
+    mock_close.assert_called_once()
+
+    shared = MagicMock()
+    with GeoGuessrAPI(cookie="test_cookie", session=shared):
+        pass
+    shared.close.assert_not_called()
+
+
+def test_lean_parsing_matches_strict():
+    """Test that the lean parser builds the same game as full validation."""
+    payload = make_game_payload("abc")
+
+    lean = parse_game_details("abc", payload)
+    strict = parse_game_details("abc", payload, strict=True)
+
+    assert lean == strict
+    assert lean.totalScore == 15000
+    first = lean.rounds[0]
+    assert (first.lat, first.lng, first.guessLat, first.guessLng) == (11, 21, 10, 20)
+
+
+def test_lean_parsing_ignores_unused_fields():
+    """Test that only strict mode rejects problems in fields we do not store."""
+    payload = make_game_payload("abc")
+    del payload["player"]["pin"]
+    del payload["rounds"]
+
+    assert parse_game_details("abc", payload).totalScore == 15000
+    with pytest.raises(ValueError):
+        parse_game_details("abc", payload, strict=True)
+    with pytest.raises(ValueError):
+        parse_game_details("abc", {"player": {}})
+    with pytest.raises(ValueError):
+        parse_daily_challenge({"participants": 1})
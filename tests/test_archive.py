@@ -0,0 +1,140 @@
+"""Tests for the raw response archive and offline re-processing."""
+
+import json
+import sys
+from datetime import date
+
+from geoguessr_daily_tracker import config
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.archive import ResponseArchive, reprocess
+from geoguessr_daily_tracker.cli import main
+from geoguessr_daily_tracker.config import refresh_config
+from geoguessr_daily_tracker.storage import CsvStorage
+from tests.conftest import make_game_payload
+from tests.test_storage import make_located_game
+from tests.test_utils import make_game
+
+
+def body(token, scores=(5000, 4000, 3000, 2000, 1000)):
+    return json.dumps(make_game_payload(token, scores)).encode()
+
+
+def test_archive_appends_and_indexes_latest(tmp_path):
+    """Test that lookups return the latest record and segments rotate."""
+    archive = ResponseArchive(tmp_path, segment_bytes=1)
+    archive.put("game", "a", b"first")
+    archive.put("game", "b", b"other")
+    archive.put("game", "a", b"second")
+
+    assert archive.get("game", "a") == b"second"
+    assert archive.get("game", "missing") is None
+    assert archive.segments() == [1, 2, 3]
+
+    # A fresh instance reads the index; a lost index is rebuilt
+    assert ResponseArchive(tmp_path).get("game", "a") == b"second"
+    (tmp_path / "index.tsv").unlink()
+    reopened = ResponseArchive(tmp_path)
+    assert sorted(reopened.tokens("game")) == ["a", "b"]
+    assert reopened.get("game", "a") == b"second"
+
+
+def test_rebuild_index_stops_at_truncated_record(tmp_path):
+    """Test that a record cut short by a crash is ignored."""
+    archive = ResponseArchive(tmp_path)
+    archive.put("game", "a", b"complete")
+    archive.put("game", "b", b"cut short")
+    segment = tmp_path / "00000001.seg"
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    assert archive.rebuild_index() == 1
+    assert archive.get("game", "a") == b"complete"
+
+
+def test_api_archives_raw_responses(tmp_path, stub_server):
+    """Test that fetched game and daily challenge bodies are archived."""
+    archive = ResponseArchive(tmp_path)
+    api = GeoGuessrAPI(cookie="test_cookie", archive=archive)
+    api.BASE_URL = stub_server.base_url
+
+    api.get_game_details("token1")
+    api.get_daily_challenge()
+
+    assert json.loads(archive.get("game", "token1"))["token"] == "token1"
+    assert archive.tokens("daily_challenge") == ["daily_token"]
+
+
+def test_reprocess_rebuilds_games_in_parallel(tmp_path):
+    """Test that archived games are parsed again across worker processes."""
+    archive = ResponseArchive(tmp_path / "archive")
+    for day in range(1, 5):
+        archive.put("game", f"t{day}", body(f"t{day}", scores=(day,) * 5))
+    archive.put("game", "unfinished", b'{"state": "started"}')
+    archive.put("game", "undated", body("undated"))
+
+    dates = {f"t{day}": date(2025, 1, day) for day in range(1, 5)}
+    dates["unfinished"] = date(2025, 1, 9)
+    games, errors = reprocess(archive, dates, workers=2, batch_size=2)
+
+    assert [(g.date.day, g.totalScore) for g in games] == [
+        (day, 5 * day) for day in range(1, 5)
+    ]
+    assert errors == {"unfinished": "game not finished"}
+
+
+def test_reprocess_records_missing_segments(tmp_path):
+    """Test that an unreadable segment is reported instead of aborting."""
+    archive = ResponseArchive(tmp_path, segment_bytes=1)
+    archive.put("game", "t1", body("t1"))
+    archive.put("game", "t2", body("t2"))
+    (tmp_path / "00000001.seg").unlink()
+
+    dates = {"t1": date(2025, 1, 1), "t2": date(2025, 1, 2)}
+    games, errors = reprocess(archive, dates)
+
+    assert [g.token for g in games] == ["t2"]
+    assert list(errors) == ["t1"]
+
+
+def test_csv_replace_games_overwrites_dates(tmp_path):
+    """Test that replacing games rewrites rows and coordinates in place."""
+    storage = CsvStorage(tmp_path / "games.csv")
+    storage.save_games([make_game(1), make_game(2)])
+
+    storage.replace_games([make_located_game(2), make_game(3, score=3000)])
+
+    games = list(storage.iter_games())
+    assert [g.date.day for g in games] == [1, 2, 3]
+    assert games[1].rounds[0].countryCode == "es"
+    assert games[2].totalScore == make_game(3, score=3000).totalScore
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "games.csv",
+        "games_locations.csv",
+    ]
+
+
+def test_reprocess_command_reads_account_archives(tmp_path, monkeypatch):
+    """Test that an account's own archive rebuilds that account's store."""
+    monkeypatch.setattr(config, "get_data_dir", lambda: tmp_path)
+    monkeypatch.setattr("geoguessr_daily_tracker.utils.get_data_dir", lambda: tmp_path)
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        json.dumps({"ACCOUNTS": [{"name": "alice", "NCFA_COOKIE": "a"}]})
+    )
+    monkeypatch.setattr(config, "CONFIG_FILE", config_file)
+    account_dir = tmp_path / "accounts" / "alice"
+    account_dir.mkdir(parents=True)
+    CsvStorage(account_dir / "daily_challenges.csv").save_game(make_game(1))
+    ResponseArchive(account_dir / "archive").put(
+        "game", "token1", body("token1", scores=(4000,) * 5)
+    )
+    argv = ["geoguessr-daily-tracker", "reprocess", "--account", "alice"]
+    monkeypatch.setattr(sys, "argv", argv + ["--workers", "1"])
+    refresh_config()
+
+    try:
+        main()
+    finally:
+        refresh_config()
+
+    (game,) = CsvStorage(account_dir / "daily_challenges.csv").iter_games()
+    assert game.totalScore == 20000
@@ -0,0 +1,83 @@
+"""Tests for the asyncio GeoGuessr API client."""
+
+import asyncio
+import threading
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from geoguessr_daily_tracker.archive import ResponseArchive  # noqa: E402
+from geoguessr_daily_tracker.async_api import AsyncGeoGuessrAPI  # noqa: E402
+from geoguessr_daily_tracker.cache import GameCache  # noqa: E402
+from geoguessr_daily_tracker.config import Config  # noqa: E402
+
+
+def _gather(base_url, tokens, concurrency, **options):
+    async def run():
+        async with AsyncGeoGuessrAPI(
+            cookie="test_cookie", backoff_factor=0, **options
+        ) as api:
+            api.BASE_URL = base_url
+            return await api.gather_games(tokens, concurrency=concurrency)
+
+    return asyncio.run(run())
+
+
+def test_gather_games_returns_games_in_order(stub_server):
+    """Test that gathered games keep the order of the requested tokens."""
+    tokens = [f"token{i}" for i in range(20)]
+
+    games = _gather(stub_server.base_url, tokens, concurrency=4)
+
+    assert [game.token for game in games] == tokens
+    assert games[0].totalScore == 15000
+    assert [r.score for r in games[0].rounds] == [5000, 4000, 3000, 2000, 1000]
+    # Keep-alive connections are reused across requests
+    assert len(stub_server.clients) <= 4
+
+
+def test_gather_games_raises_on_failure(stub_server):
+    """Test that a game that keeps failing surfaces an error."""
+    stub_server.failing.add("bad")
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        _gather(stub_server.base_url, ["good", "bad"], concurrency=2)
+
+    assert stub_server.requests.count("/api/v3/challenges/bad/game") == 4
+
+
+def test_gather_games_caches_off_the_event_loop(tmp_path, stub_server):
+    """Test that cache and archive writes run in worker threads."""
+    cache = GameCache(tmp_path / "cache")
+    archive = ResponseArchive(tmp_path / "archive")
+    threads = set()
+    put = cache.put
+
+    def recording_put(token, payload):
+        threads.add(threading.current_thread())
+        put(token, payload)
+
+    cache.put = recording_put
+    tokens = ["token1", "token2"]
+    options = {"cache": cache, "archive": archive}
+
+    _gather(stub_server.base_url, tokens, concurrency=2, **options)
+    requests = len(stub_server.requests)
+    games = _gather(stub_server.base_url, tokens, concurrency=2, **options)
+
+    assert [game.token for game in games] == tokens
+    assert len(stub_server.requests) == requests
+    assert sorted(archive.tokens("game")) == tokens
+    assert threads and threading.main_thread() not in threads
+
+
+def test_async_api_requires_cookie(monkeypatch):
+    """Test that the async client requires a cookie."""
+    monkeypatch.delenv("NCFA_COOKIE", raising=False)
+    monkeypatch.setattr(
+        "geoguessr_daily_tracker.async_api.load_config",
+        lambda: Config.from_dict({}),
+    )
+    with pytest.raises(ValueError):
+        AsyncGeoGuessrAPI()
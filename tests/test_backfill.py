@@ -0,0 +1,59 @@
+"""Tests for the concurrent backfill engine."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.backfill import fetch_games
+from geoguessr_daily_tracker.cli import fill_previous_dates
+
+
+@pytest.fixture
+def stub_api(stub_server):
+    """Create an API client pointed at the local stub server."""
+    api = GeoGuessrAPI(cookie="test_cookie", backoff_factor=0)
+    api.BASE_URL = stub_server.base_url
+    return api
+
+
+def test_fetch_games_preserves_date_order(stub_api, stub_server):
+    """Test that games come back sorted by date regardless of completion order."""
+    challenges = {date(2025, 1, day): f"token{day}" for day in range(10, 0, -1)}
+
+    games, failures = fetch_games(stub_api, challenges, workers=4)
+
+    assert failures == []
+    assert [game.date for game in games] == sorted(challenges)
+    assert [game.token for game in games] == [f"token{d}" for d in range(1, 11)]
+    assert len(stub_server.requests) == 10
+
+
+def test_fetch_games_reports_failures(stub_api, stub_server):
+    """Test that a failing challenge is reported without aborting the rest."""
+    stub_server.failing.add("token2")
+    challenges = {date(2025, 1, day): f"token{day}" for day in range(1, 4)}
+
+    games, failures = fetch_games(stub_api, challenges, workers=2)
+
+    assert [game.token for game in games] == ["token1", "token3"]
+    assert len(failures) == 1
+    assert failures[0][:2] == (date(2025, 1, 2), "token2")
+
+
+def test_fill_previous_dates_saves_in_order(stub_api):
+    """Test that fill saves every fetched game in date order."""
+    challenges = {date(2025, 1, 2): "b", date(2025, 1, 1): "a"}
+    sheet = MagicMock()
+
+    storage = MagicMock()
+
+    with patch(
+        "geoguessr_daily_tracker.utils.get_previous_challenges",
+        return_value=challenges,
+    ):
+        fill_previous_dates(stub_api, sheet, workers=2, storage=storage)
+
+    assert [game.token for game in storage.save_games.call_args.args[0]] == ["a", "b"]
+    assert [game.token for game in sheet.save_games.call_args.args[0]] == ["a", "b"]
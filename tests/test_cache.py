@@ -0,0 +1,62 @@
+"""Tests for the on-disk game cache."""
+
+import os
+
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.cache import GameCache
+from tests.conftest import make_game_payload
+
+
+def test_cache_round_trip_and_counters(tmp_path):
+    """Test that stored responses are returned and hits/misses counted."""
+    cache = GameCache(tmp_path)
+    payload = make_game_payload("abc")
+
+    assert cache.get("abc") is None
+    cache.put("abc", payload)
+
+    assert cache.get("abc") == payload
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest unused entries are evicted when over budget."""
+    cache = GameCache(tmp_path)
+    cache.put("a", make_game_payload("a"))
+    entry_size = cache._total_size()
+    cache.max_bytes = entry_size * 2 + entry_size // 2  # room for two entries
+
+    cache.put("b", make_game_payload("b"))
+    os.utime(cache._path("a"), (1, 1))
+    os.utime(cache._path("b"), (2, 2))
+    cache.get("a")  # "a" becomes most recently used
+    cache.put("c", make_game_payload("c"))
+
+    assert cache._path("a").exists()
+    assert not cache._path("b").exists()
+    assert cache._path("c").exists()
+
+
+def test_cache_overwrite_counts_size_once(tmp_path):
+    """Test that storing a token again does not grow the tracked size."""
+    cache = GameCache(tmp_path)
+    for _ in range(3):
+        cache.put("a", make_game_payload("a"))
+
+    assert cache._size == cache._total_size()
+
+
+def test_api_uses_cache_for_finished_games(tmp_path, stub_server):
+    """Test that cached games are served without network requests."""
+    api = GeoGuessrAPI(cookie="test_cookie", cache=GameCache(tmp_path))
+    api.BASE_URL = stub_server.base_url
+
+    first = api.get_game_details("token1")
+    second = api.get_game_details("token1")
+
+    assert first.totalScore == second.totalScore
+    assert len(stub_server.requests) == 1
+
+    api.refresh_cache = True
+    api.get_game_details("token1")
+    assert len(stub_server.requests) == 2
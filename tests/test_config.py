@@ -0,0 +1,115 @@
+"""Tests for cached configuration loading."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from geoguessr_daily_tracker import config as config_module
+from geoguessr_daily_tracker.config import (
+    ENV_KEYS,
+    get_config,
+    load_config,
+    refresh_config,
+    save_config,
+)
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point the config file at a temp path and count file reads."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(config_module, "CONFIG_FILE", path)
+    for key in ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    reads = []
+    read = config_module._read
+    monkeypatch.setattr(config_module, "_read", lambda: reads.append(1) or read())
+    refresh_config()
+    yield path, reads
+    refresh_config()
+
+
+def test_config_is_cached_until_file_or_env_changes(config_file, monkeypatch):
+    """Test that the file is only re-read when something changed."""
+    path, reads = config_file
+    path.write_text(json.dumps({"GSHEET_ID": "a"}))
+
+    assert get_config()["GSHEET_ID"] == "a"
+    assert get_config()["GSHEET_ID"] == "a"
+    assert len(reads) == 1
+
+    path.write_text(json.dumps({"GSHEET_ID": "bb"}))
+    assert get_config()["GSHEET_ID"] == "bb"
+
+    monkeypatch.setenv("GSHEET_ID", "env")
+    assert get_config()["GSHEET_ID"] == "env"
+    assert len(reads) == 3
+
+    refresh_config()
+    get_config()
+    assert len(reads) == 4
+
+
+def test_get_config_returns_copies(config_file):
+    """Test that callers cannot modify the cached settings."""
+    get_config()["NCFA_COOKIE"] = "changed"
+    assert "NCFA_COOKIE" not in get_config()
+
+
+def test_save_config_is_visible_immediately(config_file):
+    """Test that saving refreshes the cache even within one mtime tick."""
+    save_config({"NCFA_COOKIE": "one"})
+    assert load_config().ncfa_cookie == "one"
+    save_config({"NCFA_COOKIE": "two"})
+    assert load_config().ncfa_cookie == "two"
+
+
+def test_load_config_types_and_validates(config_file, monkeypatch):
+    """Test typed values and that invalid settings are rejected."""
+    path, _ = config_file
+    path.write_text(json.dumps({"USE_GSHEETS": True, "STORAGE_PATH": "games.db"}))
+    monkeypatch.setenv("STORAGE_BACKEND", "SQLite")
+
+    config = load_config()
+
+    assert config.use_gsheets is True
+    assert config.storage_backend == "sqlite"
+    assert config.storage_path == Path("games.db")
+
+    monkeypatch.setenv("STORAGE_BACKEND", "mongo")
+    with pytest.raises(ValueError):
+        load_config()
+    # The raw settings stay readable so they can be fixed
+    assert get_config()["STORAGE_BACKEND"] == "mongo"
+
+
+def test_load_config_parses_rate_limit(config_file):
+    """Test that RATE_LIMIT is parsed up front and bad values fail validation."""
+    path, _ = config_file
+    path.write_text(json.dumps({"RATE_LIMIT": "2,game=5"}))
+    refresh_config()
+
+    rate_limit = load_config().rate_limit
+
+    assert rate_limit.rate == 2.0
+    assert dict(rate_limit.endpoint_rates) == {"game": 5.0}
+
+    for setting in ("game=fast", "0", {"game": -1}):
+        path.write_text(json.dumps({"RATE_LIMIT": setting}))
+        refresh_config()
+        with pytest.raises(ValueError, match="Invalid RATE_LIMIT"):
+            load_config()
+
+
+def test_concurrent_callers_share_one_load(config_file):
+    """Test that threads racing on a cold cache read the file once."""
+    path, reads = config_file
+    path.write_text(json.dumps({"GSHEET_ID": "a"}))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: load_config().gsheet_id, range(64)))
+
+    assert results == ["a"] * 64
+    assert len(reads) == 1
@@ -0,0 +1,105 @@
+"""Tests for the spatial analytics."""
+
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from geoguessr_daily_tracker import config  # noqa: E402
+from geoguessr_daily_tracker.cli import main  # noqa: E402
+from geoguessr_daily_tracker.config import refresh_config  # noqa: E402
+from geoguessr_daily_tracker.geo import (  # noqa: E402
+    SpatialIndex,
+    error_directions,
+    haversine,
+    initial_bearing,
+    load_rounds,
+    loss_by_country,
+    loss_by_region,
+)
+from geoguessr_daily_tracker.storage import CsvStorage  # noqa: E402
+from tests.test_storage import make_located_game  # noqa: E402
+from tests.test_utils import make_game  # noqa: E402
+
+
+def test_haversine_and_bearing():
+    """Test distances and bearings against known values."""
+    # Madrid to Paris is about 1,053 km, heading north-north-east
+    distance = haversine([40.4168], [-3.7038], [48.8566], [2.3522])
+    assert distance[0] == pytest.approx(1_053_000, rel=0.01)
+    bearing = initial_bearing([0, 0], [0, 0], [1, 0], [0, -1])
+    assert bearing.tolist() == pytest.approx([0, 270])
+
+
+def test_load_rounds_skips_rounds_without_coordinates():
+    """Test that only located rounds are loaded."""
+    rounds = load_rounds([make_game(1), make_located_game(2)])
+
+    assert len(rounds["scores"]) == 5
+    assert set(rounds["countries"]) == {"es"}
+
+
+def test_loss_rankings():
+    """Test that groups are ranked by total points lost."""
+    rounds = {
+        "scores": np.array([5000, 1000, 4000, 3000]),
+        "countries": np.array(["es", "br", "es", ""]),
+        "lat": np.array([40.0, -10.0, 41.0, 60.0]),
+        "lng": np.array([-3.0, -50.0, -4.0, 10.0]),
+    }
+
+    assert loss_by_country(rounds) == [("br", 1, 4000.0, 4000), ("es", 2, 500.0, 1000)]
+    regions = loss_by_region(rounds, cell_degrees=10)
+    assert regions[0] == ((-10.0, -50.0), 1, 4000.0, 4000)
+    assert regions[-1] == ((40.0, -10.0), 2, 500.0, 1000)
+
+
+def test_error_directions():
+    """Test compass sectors from the true location to the guess."""
+    rounds = {
+        "lat": np.zeros(3),
+        "lng": np.zeros(3),
+        "guess_lat": np.array([1.0, 0.0, -1.0]),
+        "guess_lng": np.array([0.0, 1.0, 0.0]),
+    }
+
+    directions = error_directions(rounds)
+
+    assert (directions["N"], directions["E"], directions["S"]) == (1, 1, 1)
+    assert sum(directions.values()) == 3
+
+
+def test_spatial_index_matches_brute_force():
+    """Test box queries against a full scan."""
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(-90, 90, 5000)
+    lng = rng.uniform(-180, 180, 5000)
+    index = SpatialIndex(lat, lng, cell_degrees=5)
+
+    for box in [(35, 44, -10, 5), (-90, 90, -180, 180), (10.5, 10.7, 3.1, 3.2)]:
+        min_lat, max_lat, min_lng, max_lng = box
+        expected = np.flatnonzero(
+            (lat >= min_lat) & (lat <= max_lat) & (lng >= min_lng) & (lng <= max_lng)
+        )
+        assert index.query(*box).tolist() == expected.tolist()
+
+
+def test_regions_command_box(tmp_path, monkeypatch, capsys):
+    """Test that --box only counts rounds located inside the box."""
+    monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "config.json")
+    monkeypatch.setenv("STORAGE_PATH", str(tmp_path / "games.csv"))
+    refresh_config()
+    CsvStorage(tmp_path / "games.csv").save_games(
+        [make_located_game(1), make_located_game(2)]
+    )
+    argv = ["geoguessr-daily-tracker", "regions", "--box", "40", "41.5", "-5", "0"]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    try:
+        main()
+    finally:
+        refresh_config()
+
+    out = capsys.readouterr().out
+    assert "Rounds with coordinates: 2" in out
@@ -0,0 +1,125 @@
+"""Tests for leaderboard snapshots."""
+
+import sys
+from datetime import date
+
+import pytest
+
+from geoguessr_daily_tracker import config
+from geoguessr_daily_tracker.cli import main
+from geoguessr_daily_tracker.config import refresh_config
+from geoguessr_daily_tracker.leaderboard import LeaderboardSnapshot, LeaderboardStore
+from geoguessr_daily_tracker.utils import save_many
+
+from .conftest import make_daily_payload
+from .test_utils import make_game
+
+
+def make_entry(player_id, score):
+    """Build a minimal leaderboard entry."""
+    return {
+        "id": player_id,
+        "nick": f"nick_{player_id}",
+        "totalScore": score,
+        "totalTime": 300,
+        "totalDistance": 1234.5,
+    }
+
+
+def make_payload(day="2025-01-01", token="daily_token"):
+    """Build a daily response with overlapping leaderboard lists."""
+    payload = make_daily_payload(token)
+    payload["date"] = f"{day}T00:00:00Z"
+    payload["leaderboard"] = [
+        make_entry("p1", 25000),
+        make_entry("p2", 20000),
+        make_entry("p3", 15000),
+        make_entry("p4", 10000),
+    ]
+    payload["friends"] = [make_entry("p2", 20000), make_entry("f1", 5000)]
+    payload["country"] = [make_entry("p3", 15000)]
+    return payload
+
+
+def test_snapshot_dedupes_players(tmp_path):
+    """Test that players in several lists are stored once."""
+    store = LeaderboardStore(tmp_path)
+
+    snapshot = store.save(make_payload())
+
+    assert len(snapshot.players) == 5
+    assert list(snapshot.scores) == sorted(snapshot.scores)
+    assert len(snapshot.sorted_scores("friends")) == 2
+    assert len(store.players.ids) == 5
+
+    store.save(make_payload(day="2025-01-02"))
+    assert len(LeaderboardStore(tmp_path).players.ids) == 5
+
+
+def test_snapshot_roundtrip(tmp_path):
+    """Test that snapshots load back unchanged."""
+    store = LeaderboardStore(tmp_path)
+    saved = store.save(make_payload())
+
+    loaded = store.load(date(2025, 1, 1))
+
+    assert loaded.token == "daily_token"
+    assert loaded.participants == 1000
+    for name, _ in LeaderboardSnapshot.COLUMNS:
+        assert getattr(loaded, name) == getattr(saved, name)
+    assert store.load(date(2025, 1, 2)) is None
+
+
+@pytest.mark.parametrize(
+    "score, scope, rank, percentile",
+    [
+        (25000, "leaderboard", 1, 75.0),
+        (17000, "leaderboard", 3, 50.0),
+        (15000, "leaderboard", 3, 25.0),
+        (0, "leaderboard", 5, 0.0),
+        (6000, "friends", 2, 50.0),
+    ],
+)
+def test_rank_and_percentile(tmp_path, score, scope, rank, percentile):
+    """Test rank and percentile queries against a snapshot."""
+    snapshot = LeaderboardStore(tmp_path).save(make_payload())
+
+    assert snapshot.rank(score, scope) == rank
+    assert snapshot.list_percentile(score, scope) == percentile
+
+
+def test_rank_history(tmp_path):
+    """Test that history covers days with both a score and a snapshot."""
+    store = LeaderboardStore(tmp_path)
+    store.save(make_payload(day="2025-01-01"))
+    store.save(make_payload(day="2025-01-03"))
+
+    history = store.rank_history(
+        {date(2025, 1, 1): 21000, date(2025, 1, 2): 1, date(2025, 1, 3): 9000}
+    )
+
+    assert history == [
+        (date(2025, 1, 1), 2, 75.0, 4, 1000),
+        (date(2025, 1, 3), 5, 0.0, 4, 1000),
+    ]
+
+
+def test_leaderboard_command(tmp_path, monkeypatch, capsys):
+    """Test the leaderboard command against a store holding games."""
+    monkeypatch.setattr(
+        "geoguessr_daily_tracker.leaderboard.get_data_dir", lambda: tmp_path
+    )
+    monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "config.json")
+    monkeypatch.setenv("STORAGE_PATH", str(tmp_path / "games.csv"))
+    refresh_config()
+    LeaderboardStore().save(make_payload())
+    save_many([make_game(1, score=4200)], tmp_path / "games.csv")
+    monkeypatch.setattr(sys, "argv", ["geoguessr-daily-tracker", "leaderboard"])
+
+    try:
+        main()
+    finally:
+        refresh_config()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-1].split() == ["2025-01-01", "21000", "2", "4", "75.0%", "1000"]
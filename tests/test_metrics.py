@@ -0,0 +1,67 @@
+"""Tests for metrics collection and export."""
+
+import json
+
+import pytest
+import requests
+
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.metrics import Metrics, metrics
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Enable the global registry for one test."""
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.enabled = False
+    metrics.reset()
+
+
+def test_disabled_registry_records_nothing():
+    """Test that a disabled registry ignores every call."""
+    registry = Metrics()
+    registry.inc("count")
+    registry.observe("latency", 0.1)
+    with registry.timer("latency"):
+        pass
+    assert registry.to_dict() == {"counters": {}, "histograms": {}}
+
+
+def test_api_requests_are_recorded(enabled_metrics, stub_server, monkeypatch):
+    """Test latency, status, bytes and retries around API requests."""
+    monkeypatch.setattr("geoguessr_daily_tracker.api.time.sleep", lambda s: None)
+    stub_server.failing.add("broken")
+    with GeoGuessrAPI(cookie="test", max_retries=1) as api:
+        api.BASE_URL = stub_server.base_url
+        api.get_game_details("game1")
+        with pytest.raises(requests.HTTPError):
+            api.get_game_details("broken")
+
+    counters = enabled_metrics.counters
+    requests_total = counters["geoguessr_api_requests_total"]
+    assert requests_total[(("endpoint", "game"), ("status", "200"))] == 1
+    assert requests_total[(("endpoint", "game"), ("status", "500"))] == 2
+    assert counters["geoguessr_api_retries_total"][(("endpoint", "game"),)] == 1
+    assert counters["geoguessr_api_response_bytes_total"][(("endpoint", "game"),)] > 0
+    histogram = enabled_metrics.histograms["geoguessr_api_request_seconds"]
+    assert histogram[(("endpoint", "game"),)].count == 3
+
+
+def test_write_prometheus_and_json(enabled_metrics, tmp_path):
+    """Test both export formats."""
+    enabled_metrics.inc("csv_rows_total", 2, result="added")
+    enabled_metrics.observe("csv_save_seconds", 0.003, call="save_many")
+
+    enabled_metrics.write(tmp_path / "run.prom")
+    text = (tmp_path / "run.prom").read_text()
+    assert "# TYPE csv_rows_total counter" in text
+    assert 'csv_rows_total{result="added"} 2' in text
+    assert 'csv_save_seconds_bucket{call="save_many",le="0.001"} 0' in text
+    assert 'csv_save_seconds_bucket{call="save_many",le="0.005"} 1' in text
+    assert 'csv_save_seconds_count{call="save_many"} 1' in text
+
+    enabled_metrics.write(tmp_path / "run.json")
+    data = json.loads((tmp_path / "run.json").read_text())
+    assert data["histograms"]["csv_save_seconds"][0]["buckets"]["+Inf"] == 1
@@ -0,0 +1,59 @@
+"""Tests for the Parquet history store."""
+
+from datetime import date
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from geoguessr_daily_tracker.parquet_store import ParquetHistory  # noqa: E402
+from tests.test_utils import make_game  # noqa: E402
+
+
+def game_on(day, score=1000):
+    game = make_game(1, token=f"t{day.isoformat()}", score=score)
+    game.date = day
+    return game
+
+
+def test_append_is_incremental_and_partitioned(tmp_path):
+    """Test that appends skip stored dates and split files by year."""
+    history = ParquetHistory(tmp_path)
+
+    assert history.append([game_on(date(2024, 12, 31)), game_on(date(2025, 1, 1))]) == 2
+    assert history.append([game_on(date(2025, 1, 1)), game_on(date(2025, 1, 2))]) == 1
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["year=2024", "year=2025"]
+    table = history.read()
+    assert table.column("date").to_pylist() == [
+        date(2024, 12, 31),
+        date(2025, 1, 1),
+        date(2025, 1, 2),
+    ]
+    assert table.column("round3_score").to_pylist() == [1000, 1000, 1000]
+
+
+def test_read_projects_columns_and_filters_dates(tmp_path):
+    """Test that only requested columns and dates are returned."""
+    history = ParquetHistory(tmp_path)
+    history.append(
+        [game_on(date(2025, 1, day), score=day * 100) for day in range(1, 11)]
+    )
+
+    table = history.read(
+        columns=["total_score"], start=date(2025, 1, 3), end=date(2025, 1, 5)
+    )
+
+    assert table.column_names == ["total_score"]
+    assert table.column("total_score").to_pylist() == [1500, 2000, 2500]
+
+
+def test_compacts_partitions(tmp_path):
+    """Test that many small appends are merged into one file per year."""
+    history = ParquetHistory(tmp_path)
+    history.MAX_PARTS = 2
+    for day in range(1, 5):
+        history.append([game_on(date(2025, 1, day))])
+
+    assert len(list((tmp_path / "year=2025").glob("*.parquet"))) <= 2
+    assert history.read(columns=["date"]).num_rows == 4
@@ -0,0 +1,127 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import threading
+
+import pytest
+
+from geoguessr_daily_tracker.api import GeoGuessrAPI
+from geoguessr_daily_tracker.ratelimit import DEFAULT_RATE, RateLimiter
+
+
+class FakeClock:
+    """Clock frozen at a settable time."""
+
+    def __init__(self):
+        self.time = 1000.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_reserve_spaces_requests():
+    """Test that slots are spaced by the rate, after the allowed burst."""
+    clock = FakeClock()
+    limiter = RateLimiter(2.0, {"daily_challenge": 1.0}, burst=2, clock=clock)
+
+    assert [limiter.reserve("game") for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    assert limiter.reserve("daily_challenge") == 0.0
+
+    clock.time += 10
+    assert limiter.reserve("game") == 0.0
+
+
+def test_throttle_adapts_and_recovers():
+    """Test that a 429 halves the rate and honours Retry-After."""
+    clock = FakeClock()
+    limiter = RateLimiter(4.0, recovery=0.25, clock=clock)
+
+    limiter.record_response("game", 429, retry_after=3.0)
+    assert limiter.current_rate("game") == 2.0
+    assert limiter.reserve("game") == 3.0
+
+    limiter.record_response("game", 200)
+    assert limiter.current_rate("game") == 3.0
+    limiter.record_response("game", 200)
+    limiter.record_response("game", 200)
+    assert limiter.current_rate("game") == 4.0
+
+
+def test_lock_file_shares_schedule(tmp_path):
+    """Test that limiters in different processes share one budget."""
+    clock = FakeClock()
+    lock_file = tmp_path / "ratelimit.json"
+    first = RateLimiter(2.0, lock_file=lock_file, clock=clock)
+    second = RateLimiter(2.0, lock_file=lock_file, clock=clock)
+
+    assert first.reserve("game") == 0.0
+    assert second.reserve("game") == 0.5
+    second.throttled("game")
+    assert first.current_rate("game") == 1.0
+
+
+def test_acquire_async_waits_for_lock_file_off_the_loop(tmp_path):
+    """Test that another process holding the lock file does not stall the loop."""
+    fcntl = pytest.importorskip("fcntl")
+    lock_file = tmp_path / "ratelimit.json"
+    limiter = RateLimiter(2.0, lock_file=lock_file, clock=FakeClock())
+    holder = open(lock_file, "a+")
+    fcntl.flock(holder, fcntl.LOCK_EX)
+    threading.Timer(0.2, holder.close).start()  # Closing releases the lock
+
+    async def run():
+        ticks = 0
+        task = asyncio.create_task(limiter.acquire_async("game"))
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks, await task
+
+    ticks, wait = asyncio.run(run())
+
+    assert ticks > 5
+    assert wait == 0.0
+
+
+@pytest.mark.parametrize(
+    "setting, rate, endpoint_rates",
+    [
+        ("3", 3.0, {}),
+        (2.5, 2.5, {}),
+        ("1,game=5", 1.0, {"game": 5.0}),
+        ({"daily_challenge": 1}, DEFAULT_RATE, {"daily_challenge": 1.0}),
+    ],
+)
+def test_from_config(setting, rate, endpoint_rates):
+    """Test the accepted RATE_LIMIT formats."""
+    limiter = RateLimiter.from_config({"RATE_LIMIT": setting})
+
+    assert limiter.rate == rate
+    assert limiter.endpoint_rates == endpoint_rates
+
+
+def test_from_config_rejects_bad_values():
+    """Test that unset and invalid settings are handled."""
+    assert RateLimiter.from_config({}) is None
+    with pytest.raises(ValueError):
+        RateLimiter.from_config({"RATE_LIMIT": "game=fast"})
+    with pytest.raises(ValueError):
+        RateLimiter.from_config({"RATE_LIMIT": "0"})
+
+
+def test_client_slows_down_on_429(stub_server, monkeypatch):
+    """Test that the client reports 429s to its limiter and retries."""
+    sleeps = []
+    monkeypatch.setattr("geoguessr_daily_tracker.api.time.sleep", sleeps.append)
+    monkeypatch.setattr("geoguessr_daily_tracker.ratelimit.time.sleep", sleeps.append)
+    stub_server.throttle = 1
+    limiter = RateLimiter(100.0)
+
+    with GeoGuessrAPI(cookie="test", rate_limiter=limiter) as api:
+        api.BASE_URL = stub_server.base_url
+        game = api.get_game_details("game1")
+
+    assert game.token == "game1"
+    assert limiter.current_rate("game") == pytest.approx(55.0)
+    # The retry waits for Retry-After
+    assert sleeps[0] == 1.0
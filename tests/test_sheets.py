@@ -1,10 +1,12 @@
 """Tests for the Google Sheets integration."""
 
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from geoguessr_daily_tracker.sheets import GoogleSheetsWriter
+from geoguessr_daily_tracker.models import DailyChallengeGame, Round
+from geoguessr_daily_tracker.sheets import GoogleSheetsWriter, SheetMirror
 
 
 @pytest.fixture
@@ -53,3 +55,178 @@ def test_sheets_init_with_config(
     writer = GoogleSheetsWriter()
     assert writer.spreadsheet_id == "test_sheet_id"
     mock_credentials.assert_called_once()
+
+
+@pytest.fixture
+def writer(mock_sheets_env, mock_credentials, mock_sheets_service, tmp_path):
+    """Create a writer whose layout fingerprints live in a temp dir."""
+    writer = GoogleSheetsWriter()
+    writer.service = mock_sheets_service
+    writer.layout_file = tmp_path / "sheet_layout.json"
+    writer.mirror = SheetMirror(tmp_path / "mirror.json")
+    return writer
+
+
+def test_format_sheet_only_runs_when_layout_changes(writer, mock_sheets_service):
+    """Test that formatting is skipped once the layout has been applied."""
+    spreadsheets = mock_sheets_service.spreadsheets.return_value
+    spreadsheets.get.return_value.execute.return_value = {"sheets": []}
+
+    assert writer.format_sheet() is True
+    assert writer.format_sheet() is False
+    assert spreadsheets.batchUpdate.call_count == 1
+
+    writer.GOLD_THRESHOLD = 23000
+    assert writer.format_sheet() is True
+    assert spreadsheets.batchUpdate.call_count == 2
+
+
+def test_format_sheet_replaces_existing_score_rules(writer, mock_sheets_service):
+    """Test that previously added score rules are deleted, not duplicated."""
+    ours = {"ranges": [{"startColumnIndex": 1, "endColumnIndex": 2}]}
+    theirs = {"ranges": [{"startColumnIndex": 5, "endColumnIndex": 6}]}
+    spreadsheets = mock_sheets_service.spreadsheets.return_value
+    spreadsheets.get.return_value.execute.return_value = {
+        "sheets": [
+            {
+                "properties": {},
+                "conditionalFormats": [ours, theirs, ours],
+                "data": [{"rowData": [{"values": [{"formattedValue": "Date"}]}]}],
+            }
+        ]
+    }
+
+    writer.format_sheet()
+
+    requests = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+    deletes = [r for r in requests if "deleteConditionalFormatRule" in r]
+    assert [d["deleteConditionalFormatRule"]["index"] for d in deletes] == [2, 0]
+    assert sum("addConditionalFormatRule" in r for r in requests) == 2
+
+
+def test_save_games_appends_missing_dates_in_chunks(writer, mock_sheets_service):
+    """Test that a batch is deduplicated, sorted and written in chunks."""
+
+    def game(day):
+        return DailyChallengeGame(
+            token=f"t{day}",
+            totalScore=1,
+            totalDistance=1.0,
+            rounds=[],
+            date=date(2025, 1, day),
+        )
+
+    values = mock_sheets_service.spreadsheets.return_value.values.return_value
+    values.get.return_value.execute.return_value = {"values": [["2025-01-02"]]}
+    values.append.return_value.execute.return_value = {}
+    writer.format_sheet = MagicMock()
+    writer.APPEND_CHUNK_ROWS = 2
+
+    added = writer.save_games([game(3), game(1), game(2), game(4)])
+
+    assert [g.date.day for g in added] == [1, 3, 4]
+    assert values.get.call_count == 1
+    bodies = [c.kwargs["body"]["values"] for c in values.append.call_args_list]
+    assert [[row[0] for row in body] for body in bodies] == [
+        ["2025-01-01", "2025-01-03"],
+        ["2025-01-04"],
+    ]
+
+
+def test_mirror_reads_only_new_rows(writer, mock_sheets_service, tmp_path):
+    """Test that dedupe reads only rows added since the last refresh."""
+    values = mock_sheets_service.spreadsheets.return_value.values.return_value
+    values.get.return_value.execute.return_value = {
+        "values": [["2025-01-01"], ["2025-01-02"]]
+    }
+    assert writer._get_existing_dates() == ["2025-01-01", "2025-01-02"]
+    assert values.get.call_args.kwargs["range"] == "A2:A"
+
+    # Our own append is recorded without reading it back
+    values.append.return_value.execute.return_value = {
+        "updates": {"updatedRange": "Sheet1!A4:N4"}
+    }
+    writer._append_rows([["2025-01-03", 1]])
+    assert writer.mirror.rows["2025-01-03"] == 4
+
+    values.get.return_value.execute.return_value = {"values": [["2025-01-04"]]}
+    dates = writer._get_existing_dates()
+    assert values.get.call_args.kwargs["range"] == "A5:A"
+    assert dates[-1] == "2025-01-04"
+
+    # A later run picks the mirror up from disk
+    reloaded = SheetMirror(tmp_path / "mirror.json")
+    assert reloaded.row_count == 5
+    assert reloaded.rows["2025-01-04"] == 5
+
+
+def test_mirror_revalidates_when_stale(writer, mock_sheets_service):
+    """Test that a stale mirror re-reads the whole date column."""
+    values = mock_sheets_service.spreadsheets.return_value.values.return_value
+    values.get.return_value.execute.return_value = {"values": [["2025-01-01"]]}
+    writer.mirror.extend(2, [["2024-12-31"], ["2025-01-01"]])
+    writer.mirror.validated_at = 1.0
+
+    assert writer._get_existing_dates() == ["2025-01-01"]
+    assert values.get.call_args.kwargs["range"] == "A2:A"
+
+
+def test_sync_games_pushes_only_the_diff(writer, mock_sheets_service):
+    """Test that sync reads once and writes only missing or changed rows."""
+
+    def game(day, score):
+        return DailyChallengeGame(
+            token=f"t{day}",
+            totalScore=score,
+            totalDistance=1.5,
+            rounds=[Round(score=score, distance=1.5, roundNumber=1)],
+            date=date(2025, 1, day),
+        )
+
+    def row(day, score):
+        return writer._game_to_row(game(day, score))
+
+    values = mock_sheets_service.spreadsheets.return_value.values.return_value
+    values.get.return_value.execute.return_value = {
+        "values": [
+            row(1, 100),
+            # Unchanged, but read back as strings
+            [str(v) for v in row(2, 200)],
+            row(3, 1),
+            row(9, 900),
+        ]
+    }
+    writer.format_sheet = MagicMock()
+
+    added, updated, sheet_only = writer.sync_games(
+        [game(4, 400), game(3, 300), game(2, 200), game(1, 100)]
+    )
+
+    assert [g.date.day for g in added] == [4]
+    assert [g.date.day for g in updated] == [3]
+    assert values.get.call_count == 1
+    # Changed and missing rows go out in one write
+    assert values.batchUpdate.call_count == 1
+    assert not values.append.called
+    data = values.batchUpdate.call_args.kwargs["body"]["data"]
+    assert data == [
+        {"range": "A4:N4", "values": [row(3, 300)]},
+        {"range": "A6:N6", "values": [row(4, 400)]},
+    ]
+    assert writer.mirror.rows["2025-01-04"] == 6
+    assert sheet_only == [row(9, 900)]
+
+
+def test_row_to_game_round_trips(writer):
+    """Test that a full sheet row converts back into the same game."""
+    game = DailyChallengeGame(
+        token="abc",
+        totalScore=15,
+        totalDistance=15.0,
+        rounds=[Round(score=n, distance=float(n), roundNumber=n) for n in range(1, 6)],
+        date=date(2025, 1, 1),
+    )
+    assert writer.row_to_game(writer._game_to_row(game)) == game
+
+    with pytest.raises(ValueError):
+        writer.row_to_game(["2025-01-01", 1])
@@ -0,0 +1,102 @@
+"""Startup regression tests based on ``python -X importtime``."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Cumulative import time allowed per subcommand, in seconds. These are
+# generous so slow CI machines pass; the module checks catch regressions.
+BUDGETS = {"configure": 0.3, "track": 1.5, "fill": 1.5}
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+RUN_CLI = """
+import sys
+from pathlib import Path
+
+# Patched before any other module imports it, so nothing is written to
+# the repository's data directory
+from geoguessr_daily_tracker import config
+
+config.get_data_dir = lambda: Path({data_dir!r})
+
+if {base_url!r}:
+    from geoguessr_daily_tracker import api
+
+    api.GeoGuessrAPI.BASE_URL = {base_url!r}
+
+from geoguessr_daily_tracker import cli
+
+sys.argv = ["geoguessr-daily-tracker", *{argv!r}]
+cli.main()
+"""
+
+
+def import_profile(argv, tmp_path, base_url=""):
+    """Run the CLI under -X importtime.
+
+    Returns:
+        Tuple[float, Set[str]]: Total import time in seconds and the
+        names of all imported modules
+    """
+    code = RUN_CLI.format(base_url=base_url, data_dir=str(tmp_path), argv=argv)
+    env = {
+        "HOME": str(tmp_path),
+        "NCFA_COOKIE": "test_cookie",
+        "PYTHONPATH": str(REPO_ROOT),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(tmp_path),
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        total_us += int(self_us)
+        modules.add(name.strip())
+    return total_us / 1e6, modules
+
+
+def test_configure_show_startup(tmp_path):
+    """Test that configure loads neither the API client nor Google libraries."""
+    seconds, modules = import_profile(["configure", "--show"], tmp_path)
+
+    assert seconds < BUDGETS["configure"]
+    assert not modules & {"requests", "pydantic", "googleapiclient", "google.oauth2"}
+
+
+@pytest.mark.parametrize("command", ["track", "fill"])
+def test_command_startup_without_sheets(command, tmp_path, stub_server):
+    """Test that commands skip Google libraries when Sheets is disabled."""
+    seconds, modules = import_profile([command], tmp_path, stub_server.base_url)
+
+    assert seconds < BUDGETS[command]
+    assert "geoguessr_daily_tracker.api" in modules
+    assert not modules & {"googleapiclient", "google.oauth2", "aiohttp"}
+
+
+def test_export_without_pyarrow_prints_install_hint(monkeypatch, capsys):
+    """Test that a missing optional dependency exits with an install hint."""
+    from geoguessr_daily_tracker import cli
+
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.delitem(
+        sys.modules, "geoguessr_daily_tracker.parquet_store", raising=False
+    )
+    monkeypatch.setattr(sys, "argv", ["geoguessr-daily-tracker", "export"])
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+
+    assert excinfo.value.code == 1
+    assert "pip install geoguessr-daily-tracker[parquet]" in capsys.readouterr().err
@@ -0,0 +1,94 @@
+"""Tests for the statistics engine."""
+
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from geoguessr_daily_tracker.stats import (  # noqa: E402
+    compute_stats,
+    medal_counts,
+    rolling_mean,
+    streaks,
+)
+from tests.test_utils import make_game  # noqa: E402
+
+
+def test_rolling_mean():
+    """Test rolling averages over a window."""
+    assert rolling_mean(np.array([1, 2, 3, 4]), 2).tolist() == [1.5, 2.5, 3.5]
+    assert rolling_mean(np.array([1]), 3).size == 0
+
+
+def test_medal_counts_use_sheet_thresholds():
+    """Test gold/silver/bronze buckets at the threshold boundaries."""
+    totals = np.array([22500, 22499, 20000, 19999, 25000])
+    assert medal_counts(totals) == {"gold": 2, "silver": 2, "bronze": 1}
+
+
+def test_streaks():
+    """Test longest and current runs of consecutive days."""
+    dates = np.array(
+        ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-05", "2025-01-06"],
+        dtype="datetime64[D]",
+    )
+    assert streaks(dates, today=date(2025, 1, 7)) == {"current": 2, "longest": 3}
+    # The latest run has ended once a whole day is missed
+    assert streaks(dates, today=date(2025, 1, 8)) == {"current": 0, "longest": 3}
+    assert streaks(np.array([], dtype="datetime64[D]")) == {
+        "current": 0,
+        "longest": 0,
+    }
+
+
+def test_compute_stats():
+    """Test the combined summary, including best and worst rounds."""
+    games = [make_game(day, score=day * 1000) for day in (3, 1, 2)]
+    games[0].rounds[4].score = 10
+
+    stats = compute_stats(games, window=2)
+
+    assert stats["games"] == 3
+    assert stats["rolling_average"] == (10000 + 15000) / 2
+    assert stats["best"] == (date(2025, 1, 3), 1, 3000)
+    assert stats["worst"] == (date(2025, 1, 3), 5, 10)
+    assert stats["round_percentiles"].shape == (5, 5)
+    assert stats["streaks"]["longest"] == 3
+
+
+def test_stats_command_without_round_scores(tmp_path, monkeypatch, capsys):
+    """Test that the stats command copes with games lacking round scores."""
+    from argparse import Namespace
+
+    from geoguessr_daily_tracker.cli import stats_command
+    from geoguessr_daily_tracker.storage import CsvStorage
+
+    storage = CsvStorage(tmp_path / "games.csv")
+    game = make_game(1)
+    game.rounds = []
+    storage.save_game(game)
+    monkeypatch.setattr("geoguessr_daily_tracker.storage.get_storage", lambda: storage)
+
+    stats_command(Namespace(window=7))
+
+    out = capsys.readouterr().out
+    assert "Best round: no games" in out
+    assert "Worst round: no games" in out
+
+
+def test_stats_command_rejects_empty_window(monkeypatch, capsys):
+    """Test that --window must be positive, reported as a usage error."""
+    import sys
+
+    from geoguessr_daily_tracker.cli import main
+
+    monkeypatch.setattr(
+        sys, "argv", ["geoguessr-daily-tracker", "stats", "--window", "0"]
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
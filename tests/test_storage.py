@@ -0,0 +1,183 @@
+"""Tests for the storage backends."""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+from geoguessr_daily_tracker.storage import (
+    CsvStorage,
+    SqliteStorage,
+    Storage,
+    get_storage,
+    migrate_from_csv,
+)
+from geoguessr_daily_tracker.utils import save_many
+from tests.test_utils import make_game
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    """Open a SQLite store in a temp dir."""
+    with SqliteStorage(tmp_path / "games.db") as storage:
+        yield storage
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"])
+def test_save_skips_and_replace_overwrites(tmp_path, backend):
+    """Test that both backends skip stored dates unless replacing."""
+    storage = (
+        CsvStorage(tmp_path / "games.csv")
+        if backend == "csv"
+        else SqliteStorage(tmp_path / "games.db")
+    )
+    with storage:
+        added = storage.save_games([make_game(2), make_game(1)])
+        assert [game.date.day for game in added] == [1, 2]
+
+        added = storage.save_games([make_game(1, score=2000), make_game(3)])
+        assert [game.date.day for game in added] == [3]
+        assert list(storage.iter_games()) == [make_game(1), make_game(2), make_game(3)]
+
+        storage.replace_games([make_game(1, score=2000)])
+        games = list(storage.iter_games())
+
+    assert [r.score for r in games[0].rounds] == [2000] * 5
+    assert games == [make_game(1, score=2000), make_game(2), make_game(3)]
+
+
+def test_sqlite_uses_wal(sqlite_storage):
+    """Test that the database is in WAL mode."""
+    mode = sqlite_storage.connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"])
+def test_tokens_are_unique(tmp_path, backend):
+    """Test that both backends skip a stored token and move it on replace."""
+    storage = (
+        CsvStorage(tmp_path / "games.csv")
+        if backend == "csv"
+        else SqliteStorage(tmp_path / "games.db")
+    )
+    with storage:
+        storage.save_game(make_game(1, token="same"))
+        # A clashing token is skipped without dropping the rest of the batch
+        added = storage.save_games([make_game(2, token="same"), make_game(3)])
+        assert [game.date.day for game in added] == [3]
+
+        storage.replace_games([make_game(2, token="same")])
+        assert [(g.date.day, g.token) for g in storage.iter_games()] == [
+            (2, "same"),
+            (3, "token3"),
+        ]
+
+
+def test_incomplete_backend_fails_on_construction():
+    """Test that a backend missing an abstract method cannot be created."""
+
+    class Incomplete(Storage):
+        def save_games(self, games):
+            return []
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_migrate_from_csv(tmp_path, sqlite_storage):
+    """Test that the CSV history is copied into SQLite once."""
+    csv_path = tmp_path / "games.csv"
+    save_many([make_game(day) for day in range(1, 6)], csv_path)
+
+    assert migrate_from_csv(sqlite_storage, csv_path) == 5
+    assert migrate_from_csv(sqlite_storage, csv_path) == 0
+    assert list(sqlite_storage.iter_games()) == list(CsvStorage(csv_path).iter_games())
+
+
+def test_get_storage_uses_config(tmp_path):
+    """Test that the backend is picked from the configuration."""
+    assert isinstance(get_storage({}), CsvStorage)
+    with get_storage(
+        {"STORAGE_BACKEND": "sqlite", "STORAGE_PATH": str(tmp_path / "x.db")}
+    ) as storage:
+        assert isinstance(storage, SqliteStorage)
+    with pytest.raises(ValueError):
+        get_storage({"STORAGE_BACKEND": "mongo"})
+
+
+def test_sqlite_iter_games_pages_through_range(sqlite_storage):
+    """Test that range reads span several pages without repeats."""
+    sqlite_storage.PAGE_SIZE = 2
+    sqlite_storage.save_games([make_game(day) for day in range(1, 10)])
+
+    games = sqlite_storage.iter_games(start=date(2025, 1, 3), end=date(2025, 1, 7))
+
+    assert [game.date.day for game in games] == [3, 4, 5, 6, 7]
+
+
+def make_located_game(day):
+    """Build a game whose rounds carry coordinates."""
+    game = make_game(day)
+    for r in game.rounds:
+        r.lat, r.lng = 40.0 + r.roundNumber, -3.0
+        r.guessLat, r.guessLng = 41.0, -4.0 + r.roundNumber
+        r.countryCode = "es"
+    return game
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"])
+def test_round_locations_round_trip(tmp_path, backend):
+    """Test that round coordinates survive a save and reload."""
+    storage = (
+        CsvStorage(tmp_path / "games.csv")
+        if backend == "csv"
+        else SqliteStorage(tmp_path / "games.db")
+    )
+    with storage:
+        storage.save_game(make_located_game(1))
+        storage.save_games([make_game(2), make_located_game(3)])
+        storage.save_game(make_game(1))
+
+        games = list(storage.iter_games(start=date(2025, 1, 2)))
+
+    assert [r.lat for r in games[0].rounds] == [None] * 5
+    assert games[1].rounds == make_located_game(3).rounds
+
+
+def test_csv_locations_saved_out_of_order(tmp_path):
+    """Test that coordinates saved out of order are appended and merged by date."""
+    storage = CsvStorage(tmp_path / "games.csv")
+    storage.save_games([make_located_game(day) for day in (5, 9)])
+    storage.save_games([make_located_game(day) for day in (1, 7)])
+
+    dates = [line[8:10] for line in storage.locations_path.read_text().splitlines()]
+    assert dates[1::5] == ["05", "09", "01", "07"]
+
+    games = list(storage.iter_games(start=date(2025, 1, 6), end=date(2025, 1, 9)))
+    assert [g.date.day for g in games] == [7, 9]
+    assert all(g.rounds == make_located_game(g.date.day).rounds for g in games)
+
+
+def test_sqlite_adds_location_columns_to_old_databases(tmp_path):
+    """Test that a database created before coordinates were stored is upgraded."""
+    path = tmp_path / "old.db"
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE games (
+            id INTEGER PRIMARY KEY, date TEXT NOT NULL UNIQUE,
+            token TEXT NOT NULL UNIQUE, total_score INTEGER NOT NULL,
+            total_distance REAL NOT NULL
+        );
+        CREATE TABLE rounds (
+            game_id INTEGER NOT NULL, round_number INTEGER NOT NULL,
+            score INTEGER NOT NULL, distance REAL NOT NULL,
+            PRIMARY KEY (game_id, round_number)
+        );
+        """)
+    connection.close()
+
+    with SqliteStorage(path) as storage:
+        storage.save_game(make_located_game(1))
+        (game,) = storage.iter_games()
+
+    assert game.rounds[0].countryCode == "es"
@@ -0,0 +1,116 @@
+"""Tests for the CSV store utilities."""
+
+import csv
+from datetime import date, timedelta
+
+from geoguessr_daily_tracker.models import DailyChallengeGame, Round
+from geoguessr_daily_tracker.utils import (
+    iter_games,
+    save_many,
+    save_to_csv,
+    write_games,
+)
+
+
+def make_game(day, token=None, score=1000):
+    """Build a game for 2025-01-<day>."""
+    return DailyChallengeGame(
+        token=token or f"token{day}",
+        totalScore=score * 5,
+        totalDistance=500.0,
+        rounds=[Round(score=score, distance=100.0, roundNumber=i) for i in range(1, 6)],
+        date=date(2025, 1, day),
+    )
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_save_to_csv_skips_existing_date(tmp_path):
+    """Test that a second save for the same date is ignored."""
+    path = tmp_path / "games.csv"
+
+    save_to_csv(make_game(1), path)
+    save_to_csv(make_game(1, token="other"), path)
+
+    rows = read_rows(path)
+    assert len(rows) == 1
+    assert rows[0]["link"] == "https://www.geoguessr.com/results/token1"
+
+
+def test_save_many_dedupes_and_only_appends(tmp_path):
+    """Test that a batch is deduplicated and backfilled dates are appended."""
+    path = tmp_path / "games.csv"
+    save_to_csv(make_game(2), path)
+
+    added = save_many([make_game(3), make_game(1), make_game(2), make_game(3)], path)
+
+    assert [game.date.day for game in added] == [1, 3]
+    assert [row["date"] for row in read_rows(path)] == [
+        "2025-01-02",
+        "2025-01-01",
+        "2025-01-03",
+    ]
+    assert [game.date.day for game in iter_games(path)] == [1, 2, 3]
+
+
+def test_index_notices_external_changes(tmp_path):
+    """Test that rows written by someone else are seen by the next save."""
+    path = tmp_path / "games.csv"
+    save_to_csv(make_game(1), path)
+
+    with open(path, "a", newline="") as f:
+        f.write("2025-01-05,0,0,,,,,,,,,,,https://www.geoguessr.com/results/x\n")
+    save_to_csv(make_game(5), path)
+
+    assert [row["date"] for row in read_rows(path)] == ["2025-01-01", "2025-01-05"]
+
+
+def test_iter_games_seeks_to_date_range(tmp_path):
+    """Test range reads on a history large enough to need bisection."""
+    path = tmp_path / "games.csv"
+    history = [make_game(1) for _ in range(2000)]
+    for offset, game in enumerate(history):
+        game.date = date(2000, 1, 1) + timedelta(days=offset)
+        game.token = f"token{offset}"
+    save_many(history, path)
+
+    games = list(iter_games(path, start=date(2003, 6, 1), end=date(2003, 6, 5)))
+    assert [game.date.day for game in games] == [1, 2, 3, 4, 5]
+    assert games[0] == history[(date(2003, 6, 1) - date(2000, 1, 1)).days]
+
+    assert len(list(iter_games(path, start=date(2010, 1, 1)))) == 0
+    assert len(list(iter_games(path, end=date(2000, 1, 10)))) == 10
+    assert len(list(iter_games(path))) == 2000
+    assert list(iter_games(tmp_path / "missing.csv")) == []
+
+
+def test_iter_games_handles_unsorted_files(tmp_path):
+    """Test that a file edited out of order is still read correctly."""
+    path = tmp_path / "games.csv"
+    save_many([make_game(day) for day in (1, 2, 3)], path)
+    with open(path, "a", newline="") as f:
+        f.write("2025-01-02,0,0,,,,,,,,,,,https://www.geoguessr.com/results/x\n")
+
+    games = list(iter_games(path, start=date(2025, 1, 2)))
+    assert [(g.date.day, g.token) for g in games] == [(2, "token2"), (3, "token3")]
+
+
+def test_iter_games_reads_legacy_files_without_rewriting(tmp_path):
+    """Test that rows before the seek point of an unsorted file are not lost."""
+    path = tmp_path / "games.csv"
+    history = [make_game(1, token=f"token{offset}") for offset in range(300)]
+    for offset, game in enumerate(history):
+        game.date = date(2000, 1, 1) + timedelta(days=offset)
+    write_games(history, path)
+    # A legacy file: the latest game first, then the rest in order
+    header, *rows = path.read_bytes().splitlines(keepends=True)
+    legacy = b"".join([header, rows[-1], *rows[:-1]])
+    path.write_bytes(legacy)
+
+    games = list(iter_games(path, start=history[200].date))
+
+    assert [g.token for g in games] == [g.token for g in history[200:]]
+    assert path.read_bytes() == legacy
@@ -0,0 +1,124 @@
+"""Tests for the watch daemon."""
+
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from geoguessr_daily_tracker.storage import CsvStorage
+from geoguessr_daily_tracker.watch import Watcher
+
+from .conftest import make_daily_payload, make_game_payload
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeAPI:
+    """Serve scripted daily challenges and game states."""
+
+    strict = False
+
+    def __init__(self):
+        self.token = "day1"
+        self.day = START
+        self.state = None  # None means not started yet
+        self.calls = 0
+
+    def get_daily_challenge_payload(self):
+        self.calls += 1
+        payload = make_daily_payload(self.token)
+        payload["date"] = self.day.isoformat()
+        return payload
+
+    def get_game_payload(self, token):
+        self.calls += 1
+        if self.state is None:
+            raise requests.HTTPError("404 Client Error")
+        payload = make_game_payload(token)
+        payload["state"] = self.state
+        return payload
+
+
+class FakeClock:
+    """Clock that only advances when slept on."""
+
+    def __init__(self):
+        self.time = START + timedelta(hours=1)
+        self.sleeps = []
+
+    def now(self):
+        return self.time
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.time += timedelta(seconds=seconds)
+
+
+def make_watcher(tmp_path, api, clock):
+    storage = CsvStorage(tmp_path / "games.csv")
+    return Watcher(
+        api,
+        storage,
+        leaderboard_dir=tmp_path / "leaderboards",
+        min_interval=60,
+        max_interval=600,
+        sleep=clock.sleep,
+        now=clock.now,
+    )
+
+
+def test_watch_backs_off_then_writes_once_per_day(tmp_path):
+    """Test the polling schedule across a finished game and a rollover."""
+    api, clock = FakeAPI(), FakeClock()
+    watcher = make_watcher(tmp_path, api, clock)
+
+    # Not started yet: exponential backoff up to the cap
+    assert [watcher.poll_once() for _ in range(5)] == [60, 120, 240, 480, 600]
+
+    api.state = "started"
+    assert watcher.poll_once() == 60
+
+    api.state = "finished"
+    delay = watcher.poll_once()
+    assert watcher.writes == 1
+    assert delay == 600
+    # Finished: no more game polls until the next challenge is due
+    calls = api.calls
+    watcher.poll_once()
+    assert api.calls == calls and watcher.writes == 1
+
+    # Rollover: the old challenge is still served, then the new one appears
+    clock.time = START + timedelta(days=1, seconds=1)
+    assert watcher.poll_once() == 60
+    api.token, api.day, api.state = "day2", START + timedelta(days=1), "finished"
+    watcher.poll_once()
+
+    assert watcher.writes == 2
+    games = list(watcher.storage.iter_games())
+    assert [(game.date.day, game.token) for game in games] == [
+        (1, "day1"),
+        (2, "day2"),
+    ]
+    assert (tmp_path / "leaderboards" / "2025-01-02.lb").exists()
+
+
+def test_watch_skips_already_stored_game(tmp_path):
+    """Test that a restart does not write today's result again."""
+    api, clock = FakeAPI(), FakeClock()
+    api.state = "finished"
+    make_watcher(tmp_path, api, clock).poll_once()
+
+    watcher = make_watcher(tmp_path, api, clock)
+    watcher.run(stop=lambda: len(clock.sleeps) >= 3)
+
+    assert watcher.writes == 0
+    assert len(list(watcher.storage.iter_games())) == 1
+
+
+def test_watch_survives_a_daily_response_without_date(tmp_path):
+    """Test that a malformed daily response backs off instead of crashing."""
+    api, clock = FakeAPI(), FakeClock()
+    api.get_daily_challenge_payload = lambda: {"token": "day1"}
+    watcher = make_watcher(tmp_path, api, clock)
+
+    assert watcher.poll_once() == 60
+    assert watcher.token is None